@@ -0,0 +1,108 @@
+"""
+Serialization cost per 1000 rows: default FastAPI path vs. the FastJSON path.
+
+    cd back-end && PYTHONPATH=src python benchmarks/bench_serialization.py
+"""
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from backend.api.requests import RequestWithUser
+from backend.core.responses import dumps, orjson
+from backend.models import SubscriptionRequest, SubscriptionStatus
+
+ROWS = 1000
+REPEAT = 5
+
+
+def make_rows():
+    return [
+        SubscriptionRequest(
+            id=i,
+            user_id=f"user-{i % 7}",
+            tmdb_id=str(10000 + i),
+            media_type="movie" if i % 2 else "tv",
+            title=f"Title {i}",
+            poster_path=f"/poster{i}.jpg",
+            overview="An overview that is a sentence or two long. " * 3,
+            release_date="2024-01-01",
+            status=SubscriptionStatus.PENDING,
+            request_date=datetime(2024, 1, 1, 12, 0, i % 60),
+            comment=None,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def make_media_payload():
+    # Roughly the shape of a TMDB details response with credits
+    person = {"id": 1, "name": "Actor Name", "character": "Role", "profile_path": "/p.jpg", "popularity": 12.5}
+    return {
+        "results": [
+            {
+                "id": i,
+                "title": f"Movie {i}",
+                "overview": "Overview text. " * 20,
+                "genres": [{"id": 18, "name": "Drama"}],
+                "credits": {"cast": [dict(person, id=j) for j in range(40)], "crew": []},
+                "status": "UNKNOWN",
+            }
+            for i in range(ROWS // 50)
+        ]
+    }
+
+
+def default_request_path(rows):
+    # What read_requests did before: model_dump per row, then FastAPI validates
+    # the dicts against List[RequestWithUser] and encodes with json.dumps
+    dicts = []
+    for row in rows:
+        d = row.model_dump()
+        d["user_name"] = "name"
+        dicts.append(d)
+    validated = TypeAdapter(List[RequestWithUser]).validate_python(dicts)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def fast_request_path(mappings):
+    return dumps(mappings)
+
+
+def default_media_path(payload):
+    return json.dumps(jsonable_encoder(payload)).encode()
+
+
+def bench(label, fn, *args, unit=f"{ROWS} rows"):
+    seconds = min(timeit.repeat(lambda: fn(*args), number=1, repeat=REPEAT))
+    print(f"{label:<40} {seconds * 1000:8.2f} ms / {unit}")
+
+
+def main():
+    rows = make_rows()
+    # read_requests now gets plain column mappings from the DB
+    mappings = []
+    for row in rows:
+        d = dict(row.__dict__)
+        d.pop("_sa_instance_state", None)
+        d["user_name"] = "name"
+        mappings.append(d)
+    payload = make_media_payload()
+
+    print(f"orjson available: {orjson is not None}")
+    bench("requests: model_dump + validate + json", default_request_path, rows)
+    bench("requests: row mappings + FastJSON", fast_request_path, mappings)
+    media_unit = f"{len(payload['results'])} titles x 40 credits"
+    bench("media: jsonable_encoder + json", default_media_path, payload, unit=media_unit)
+    bench("media: FastJSON", dumps, payload, unit=media_unit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Startup cost: importing backend.main in a fresh interpreter, and lifespan startup until ready.
+Exits non-zero when a median exceeds its budget, so it can guard CI against regressions.
+
+    cd back-end && PYTHONPATH=src python benchmarks/bench_startup.py [--import-budget-ms 2500] [--ready-budget-ms 500]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+RUNS = 5
+
+IMPORT_SCRIPT = """
+import time
+started = time.perf_counter()
+import backend.main
+print((time.perf_counter() - started) * 1000)
+"""
+
+READY_SCRIPT = """
+import asyncio, json
+from backend.main import app
+from backend.core.startup import startup_state
+
+async def main():
+    async with app.router.lifespan_context(app):
+        print(json.dumps(startup_state.status()))
+
+asyncio.run(main())
+"""
+
+
+def run(script: str, env: dict) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True, timeout=120
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--import-budget-ms", type=float, default=2500)
+    parser.add_argument("--ready-budget-ms", type=float, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "PYTHONPATH": SRC,
+            "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'app.db')}",
+            "SNAPSHOT_PATH": "",
+            "LOG_LEVEL": "WARNING",
+        }
+        import_ms = [float(run(IMPORT_SCRIPT, env)) for _ in range(RUNS)]
+        statuses = [json.loads(run(READY_SCRIPT, env)) for _ in range(RUNS)]
+
+    ready_ms = [status["ready_after_ms"] for status in statuses]
+    print(f"{'import backend.main':<30} median {statistics.median(import_ms):8.1f} ms   max {max(import_ms):8.1f} ms")
+    print(f"{'lifespan until ready':<30} median {statistics.median(ready_ms):8.1f} ms   max {max(ready_ms):8.1f} ms")
+    for phase in statuses[0]["phases_ms"]:
+        values = [status["phases_ms"][phase] for status in statuses]
+        print(f"  {phase:<28} median {statistics.median(values):8.1f} ms")
+
+    failed = False
+    if statistics.median(import_ms) > args.import_budget_ms:
+        print(f"FAIL: import exceeds budget of {args.import_budget_ms} ms")
+        failed = True
+    if statistics.median(ready_ms) > args.ready_budget_ms:
+        print(f"FAIL: startup exceeds budget of {args.ready_budget_ms} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,10 @@ from backend.core.security import create_access_token
 from backend.models import User, UserRole
 from backend.services.emby import emby_client
 from backend.db import get_session
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post("/login")
 async def login(
@@ -52,7 +54,7 @@ async def login(
         }
 
     except Exception as e:
-        print(f"Authentication error: {e}") # Log to console for debugging
+        logger.warning("Authentication error: %s", e)
         raise HTTPException(status_code=400, detail=f"Authentication failed: {str(e)}")
 
 @router.get("/me", response_model=User)
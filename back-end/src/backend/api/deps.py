@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
@@ -9,6 +9,7 @@ from backend.db import get_session
 from backend.models import User
 from backend.settings import get_settings
 from backend.core import security
+from backend.services.admission import admission
 
 settings = get_settings()
 
@@ -48,4 +49,15 @@ def get_current_active_admin(
         )
     return current_user
 
-
+def admit(route: str):
+    """
+    Dependency gating an expensive endpoint by per-user admission control.
+    Over-quota users get 429 with Retry-After (see the AdmissionRejected handler).
+    """
+    async def dependency(current_user: User = Depends(get_current_user)) -> AsyncGenerator[None, None]:
+        await admission.acquire(current_user.id, route)
+        try:
+            yield
+        finally:
+            admission.release()
+    return dependency
@@ -1,18 +1,34 @@
-from typing import Any, List, Dict, Optional
-from fastapi import APIRouter, Depends, Query, Response
-from sqlmodel import Session, select
+from typing import Annotated, Any, List, Dict, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel import Field, Session, SQLModel
+import asyncio
 import httpx
+import logging
 import re
 
 from backend.api import deps
+from backend.core.responses import FastJSONResponse, FastJSONRoute
 from backend.services.tmdb import tmdb_client
-from backend.services.emby import emby_client
-from backend.models import User, SubscriptionRequest
+from backend.services.emby import count_episodes_by_season, emby_client
+from backend.services.search_index import search_index
+from backend.services.feed import InvalidCursorError
+from backend.services.prefetch import prefetcher
+from backend.services.projection import PROFILE_PATTERN, project, project_items, resolve_spec
+from backend.services.rate_limit import background_priority
+from backend.services.circuit_breaker import CircuitOpenError
+from backend.services.subscription_status import RequestState, subscription_status
+from backend.models import MediaType, User
 from backend.db import get_session
 from backend.settings import get_settings
 
 settings = get_settings()
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
+logger = logging.getLogger(__name__)
+
+# Response shaping: a named profile (card/detail/person/season/full) or an explicit
+# comma-separated field list such as "id,title,credits.cast.name"
+ProfileParam = Annotated[Optional[str], Query(pattern=PROFILE_PATTERN)]
+FieldsParam = Annotated[Optional[str], Query()]
 
 def extract_media_info(emby_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     media_streams = emby_item.get("MediaStreams", [])
@@ -74,53 +90,90 @@ def extract_media_info(emby_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         "size": emby_item.get("Size"),
     }
 
+async def lookup_emby_items(tmdb_id: str) -> List[Dict[str, Any]]:
+    """
+    Emby items carrying this Tmdb id; an unreachable Emby counts as "not in library".
+    """
+    try:
+        return await emby_client.search_by_provider_id("Tmdb", tmdb_id)
+    except (CircuitOpenError, httpx.HTTPError) as e:
+        # Emby is down: keep the list populated and fall back to the request status
+        logger.warning("Emby lookup failed for %s: %s", tmdb_id, e)
+        return []
+
+def apply_media_status(
+    media: Dict[str, Any],
+    emby_items: List[Dict[str, Any]],
+    request: Optional[RequestState],
+) -> None:
+    if emby_items:
+        media["status"] = "AVAILABLE"
+        media["emby_id"] = emby_items[0].get("Id")
+        media["emby_server"] = emby_items[0].get("Server")
+    elif request:
+        media["status"] = request.status.value.upper()
+        media["request_user_id"] = request.user_id
+    else:
+        media["status"] = "UNKNOWN" # Not in Emby, not requested
+
 async def enrich_media_status(media_list: List[Dict[str, Any]], session: Session):
     """
-    Check Emby and Local DB for status.
+    Check Emby and the request status map for status.
+    Emby lookups run concurrently (bounded); request status needs no query.
     """
-    for media in media_list:
-        tmdb_id = str(media.get("id"))
-        
-        # 1. Check Emby
-        emby_items = await emby_client.search_by_provider_id("Tmdb", tmdb_id)
-        if emby_items:
-            media["status"] = "AVAILABLE"
-            media["emby_id"] = emby_items[0].get("Id")
-            continue
+    tmdb_ids = [str(media.get("id")) for media in media_list]
+    semaphore = asyncio.Semaphore(settings.ENRICH_CONCURRENCY)
 
-        # 2. Check SubscriptionRequest
-        statement = select(SubscriptionRequest).where(
-            SubscriptionRequest.tmdb_id == tmdb_id
-        )
-        request = session.exec(statement).first()
-        
-        if request:
-            media["status"] = request.status.value.upper()
-            media["request_user_id"] = request.user_id
-        else:
-            media["status"] = "UNKNOWN" # Not in Emby, not requested
+    async def check_emby(tmdb_id: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await lookup_emby_items(tmdb_id)
+
+    # 1. Check Emby
+    emby_results = await asyncio.gather(*(check_emby(tmdb_id) for tmdb_id in tmdb_ids))
+
+    # 2. Fall back to the request status for everything that is not in Emby
+    for media, tmdb_id, emby_items in zip(media_list, tmdb_ids, emby_results):
+        request = None if emby_items else subscription_status.primary(session, tmdb_id)
+        apply_media_status(media, emby_items, request)
+
+async def lookup_emby_items_batch(tmdb_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    lookup_emby_items for many ids with batched Emby queries.
+    """
+    try:
+        return await emby_client.search_by_provider_ids("Tmdb", tmdb_ids)
+    except (CircuitOpenError, httpx.HTTPError) as e:
+        logger.warning("Emby batch lookup failed for %d ids: %s", len(tmdb_ids), e)
+        return {}
 
-@router.get("/trending")
+@router.get("/trending", response_class=FastJSONResponse)
 async def get_trending(
     page: int = 1,
     media_type: str = Query("all", pattern="^(all|movie|tv)$"),
     time_window: str = Query("day", pattern="^(day|week)$"),
     without_genres: Optional[str] = Query(None),
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
 ) -> Any:
-    try:
+    async def fetch(page: int) -> Dict[str, Any]:
         if media_type == "tv" and without_genres:
             # Use discover endpoint for TV with filtering
-            data = await tmdb_client.discover_tv(page=page, without_genres=without_genres)
-        else:
-            data = await tmdb_client.get_trending(media_type=media_type, time_window=time_window, page=page)
+            return await tmdb_client.discover_tv(page=page, without_genres=without_genres)
+        return await tmdb_client.get_trending(media_type=media_type, time_window=time_window, page=page)
+
+    try:
+        data = await fetch(page)
     except Exception as e:
-        print(f"TMDB Get Trending Error: {e}")
+        logger.warning("TMDB Get Trending Error: %s", e)
         # Return empty results instead of 500 to avoid breaking UI completely
         return {"results": []}
 
-    results = data.get("results", [])
+    if page < (data.get("total_pages") or 0):
+        prefetcher.schedule(("trending", media_type, time_window, without_genres, page + 1), lambda: fetch(page + 1))
+
+    results = project_items(data.get("results", []), resolve_spec("card", profile, fields))
 
     # Trending endpoint doesn't always include media_type when we request a single type,
     # so ensure the downstream UI can distinguish movies vs TV shows.
@@ -128,13 +181,17 @@ async def get_trending(
         for item in results:
             item["media_type"] = media_type
     
+    prefetcher.schedule_details(results, tmdb_client.get_details)
     await enrich_media_status(results, session)
+    search_index.add_tmdb_results(results)
     
     return {"results": results}
 
-@router.get("/latest")
+@router.get("/latest", response_class=FastJSONResponse, dependencies=[Depends(deps.admit("latest"))])
 async def get_latest(
     limit: int = 20, # Increased default limit to 20 as requested
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user)
 ) -> Any:
     """
@@ -143,14 +200,15 @@ async def get_latest(
     try:
         emby_items = await emby_client.get_latest_items(limit=limit)
     except Exception as e:
-        print(f"Emby Get Latest Error: {e}")
+        logger.warning("Emby Get Latest Error: %s", e)
         return {"results": []}
     
+    spec = resolve_spec("card", profile, fields)
     results = []
     for item in emby_items:
         # Extract TMDB ID from ProviderIds
         provider_ids = item.get("ProviderIds", {})
-        print(f"DEBUG: Item {item.get('Name')} ProviderIds: {provider_ids}") # DEBUG LOG
+        logger.debug("Item %s ProviderIds: %s", item.get("Name"), provider_ids)
         tmdb_id = provider_ids.get("Tmdb") or provider_ids.get("tmdb") or provider_ids.get("TMDB")
         
         # Try to find via IMDb if TMDB ID is missing
@@ -158,15 +216,17 @@ async def get_latest(
             imdb_id = provider_ids.get("Imdb") or provider_ids.get("imdb") or provider_ids.get("IMDB")
             if imdb_id:
                 try:
-                    print(f"DEBUG: Looking up TMDB ID for {item.get('Name')} via IMDb: {imdb_id}")
-                    find_res = await tmdb_client.find_by_external_id(imdb_id, "imdb_id")
+                    logger.debug("Looking up TMDB ID for %s via IMDb: %s", item.get("Name"), imdb_id)
+                    # Fallback lookups yield to interactive traffic
+                    with background_priority():
+                        find_res = await tmdb_client.find_by_external_id(imdb_id, "imdb_id")
                     # Check movie_results or tv_results
                     found_items = find_res.get("movie_results", []) + find_res.get("tv_results", [])
                     if found_items:
                         tmdb_id = str(found_items[0].get("id"))
-                        print(f"DEBUG: Found TMDB ID via IMDb: {tmdb_id}")
+                        logger.debug("Found TMDB ID via IMDb: %s", tmdb_id)
                 except Exception as e:
-                    print(f"DEBUG: Failed lookup via IMDb: {e}")
+                    logger.debug("Failed lookup via IMDb: %s", e)
         
         # Fallback: Search by name and year if still no ID
         if not tmdb_id:
@@ -178,8 +238,9 @@ async def get_latest(
                 elif item.get("PremiereDate"):
                     year = item.get("PremiereDate")[:4]
                 
-                print(f"DEBUG: Searching TMDB by name for {name} ({year})")
-                search_res = await tmdb_client.search(query=name, page=1)
+                logger.debug("Searching TMDB by name for %s (%s)", name, year)
+                with background_priority():
+                    search_res = await tmdb_client.search(query=name, page=1)
                 search_results = search_res.get("results", [])
                 
                 # Filter by year if available to be more precise
@@ -198,15 +259,15 @@ async def get_latest(
                 
                 if candidate:
                     tmdb_id = str(candidate.get("id"))
-                    print(f"DEBUG: Found TMDB ID via Search: {tmdb_id} for {name}")
+                    logger.debug("Found TMDB ID via Search: %s for %s", tmdb_id, name)
             except Exception as e:
-                 print(f"DEBUG: Failed lookup via Search: {e}")
+                 logger.debug("Failed lookup via Search: %s", e)
 
         if tmdb_id:
             media_type = "movie" if item.get("Type") == "Movie" else "tv"
             try:
                 # Fetch details from TMDB
-                tmdb_data = await tmdb_client.get_details(media_type, tmdb_id)
+                tmdb_data = project(await tmdb_client.get_details(media_type, tmdb_id), spec)
                 
                 # Use TMDB data but mark as AVAILABLE (since it's from Emby)
                 tmdb_data["status"] = "AVAILABLE"
@@ -218,23 +279,32 @@ async def get_latest(
                 tmdb_data["emby_id"] = item.get("Id")
                 
                 results.append(tmdb_data)
+                search_index.add_tmdb_results([tmdb_data])
             except Exception as e:
-                print(f"Failed to fetch TMDB details for {item.get('Name')}: {e}")
+                logger.warning("Failed to fetch TMDB details for %s: %s", item.get("Name"), e)
                 # Skip this item if TMDB fetch fails, do not fallback to Emby ID to avoid frontend errors
                 continue
         else:
             # No TMDB ID found, skip this item
-            print(f"DEBUG: Skipping {item.get('Name')} (ID: {item.get('Id')}) - No TMDB ID found in ProviderIds: {provider_ids} or via search")
+            logger.debug(
+                "Skipping %s (ID: %s) - No TMDB ID found in ProviderIds: %s or via search",
+                item.get("Name"), item.get("Id"), provider_ids,
+            )
             continue
         
     return {"results": results}
 
 @router.get("/emby-image/{item_id}")
-async def get_emby_image(item_id: str):
+async def get_emby_image(item_id: str, server: Optional[str] = None):
     """
     Proxy Emby images to avoid CORS and mixed content issues.
+    `server` is the item's `emby_server`; without it the primary server is used.
     """
-    url = f"{settings.EMBY_SERVER_URL}/Items/{item_id}/Images/Primary"
+    try:
+        base_url = emby_client.server(server).base_url
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Unknown Emby server")
+    url = f"{base_url}/Items/{item_id}/Images/Primary"
     async with httpx.AsyncClient() as client:
         # Forward request to Emby
         resp = await client.get(url, params={"maxWidth": 400})
@@ -254,93 +324,163 @@ async def get_tmdb_image(size: str, image_path: str):
             # Pass along content type
             return Response(content=resp.content, media_type=resp.headers.get("content-type", "image/jpeg"))
         except Exception as e:
-            print(f"Failed to proxy TMDB image: {e}")
+            logger.warning("Failed to proxy TMDB image: %s", e)
             return Response(status_code=404)
 
-@router.get("/search")
+@router.get("/search", response_class=FastJSONResponse, dependencies=[Depends(deps.admit("search"))])
 async def search_media(
     query: str,
     page: int = 1,
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
 ) -> Any:
     data = await tmdb_client.search(query, page)
-    results = data.get("results", [])
     
     # Filter out people
-    results = [r for r in results if r.get("media_type") in ["movie", "tv"]]
-    
+    results = [r for r in data.get("results", []) if r.get("media_type") in ["movie", "tv"]]
+    results = project_items(results, resolve_spec("card", profile, fields))
+
+    if page < (data.get("total_pages") or 0):
+        prefetcher.schedule(("search", query, page + 1), lambda: tmdb_client.search(query, page + 1))
+    prefetcher.schedule_details(results, tmdb_client.get_details)
     await enrich_media_status(results, session)
+    search_index.add_tmdb_results(results)
     
     return {"results": results, "total_pages": data.get("total_pages")}
 
-@router.get("/anime")
+@router.get("/suggest", response_class=FastJSONResponse)
+def suggest_media(
+    query: str,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Search-as-you-type suggestions from the local title index (Emby library + TMDB results seen so far).
+    No upstream calls are made; use /search for the full TMDB search on submit.
+    """
+    return {"results": search_index.suggest(query, limit=limit)}
+
+@router.get("/anime", response_class=FastJSONResponse, dependencies=[Depends(deps.admit("anime"))])
 async def get_anime(
-    page: int = 1,
+    page: int = Query(1, ge=1, le=settings.ANIME_MAX_PAGE_WITHOUT_CURSOR),
+    cursor: Optional[str] = Query(None),
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
 ) -> Any:
-    data = await tmdb_client.get_anime(page)
-    results = data.get("results", [])
-    
+    """
+    Anime movies and TV shows merged by popularity.
+    Pass the returned `next_cursor` back as `cursor` to continue; `page` is kept for older clients
+    and only covers the first ANIME_MAX_PAGE_WITHOUT_CURSOR pages.
+    """
+    try:
+        data = await tmdb_client.get_anime(page, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    results = project_items(data.get("results", []), resolve_spec("card", profile, fields))
+
+    next_cursor = data.get("next_cursor")
+    if next_cursor:
+        prefetcher.schedule(("anime", next_cursor), lambda: tmdb_client.get_anime(cursor=next_cursor))
+    prefetcher.schedule_details(results, tmdb_client.get_details)
     await enrich_media_status(results, session)
+    search_index.add_tmdb_results(results)
     
-    return {"results": results}
+    return {"results": results, "next_cursor": next_cursor}
+
+def collect_person_credits(data: Dict[str, Any], credit_type: str = "all") -> List[Dict[str, Any]]:
+    """
+    Deduplicated movie/tv credits of a TMDB person, most popular first.
+    """
+    combined = data.get("combined_credits") or {}
+    items = []
+    if credit_type in ("all", "cast"):
+        items += combined.get("cast", [])
+    if credit_type in ("all", "crew"):
+        items += combined.get("crew", [])
+
+    credits = []
+    seen = set()
+    for item in items:
+        # Only interested in movie/tv
+        key = (item.get("media_type"), item.get("id"))
+        if key[0] in ["movie", "tv"] and key not in seen:
+            credits.append(item)
+            seen.add(key)
 
-@router.get("/person/{person_id}")
+    credits.sort(key=lambda x: x.get("popularity") or 0, reverse=True)
+    return credits
+
+@router.get("/person/{person_id}", response_class=FastJSONResponse, dependencies=[Depends(deps.admit("person"))])
 async def get_person_details(
     person_id: str,
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user),
-    session: Session = Depends(get_session)
 ) -> Any:
     """
     Get person details from TMDB including combined credits.
+    Credits are returned without Emby/request status; fetch it window by window from
+    /person/{person_id}/credits so the page can render before every credit is checked.
     """
-    data = await tmdb_client.get_person_details(person_id)
-    
-    # Enrich credits with status
-    if "combined_credits" in data:
-        cast = data["combined_credits"].get("cast", [])
-        crew = data["combined_credits"].get("crew", [])
-        
-        # Filter duplicates or just process all
-        # We need to make sure media_type is set correctly for enrichment
-        # TMDB usually provides media_type in combined_credits
-        
-        # Combine relevant items for enrichment
-        items_to_enrich = []
-        seen_ids = set()
-        
-        for item in cast + crew:
-            # Only interested in movie/tv
-            if item.get("media_type") in ["movie", "tv"]:
-                if item["id"] not in seen_ids:
-                    items_to_enrich.append(item)
-                    seen_ids.add(item["id"])
-        
-        await enrich_media_status(items_to_enrich, session)
-        
+    data = project(await tmdb_client.get_person_details(person_id), resolve_spec("person", profile, fields))
+    credits = collect_person_credits(data)
+    search_index.add_tmdb_results(credits)
+    data["credits_total"] = len(credits)
     return data
 
+@router.get(
+    "/person/{person_id}/credits", response_class=FastJSONResponse, dependencies=[Depends(deps.admit("person_credits"))]
+)
+async def get_person_credits(
+    person_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(40, ge=1, le=100),
+    credit_type: str = Query("all", pattern="^(all|cast|crew)$"),
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
+    current_user: User = Depends(deps.get_current_user),
+    session: Session = Depends(get_session)
+) -> Any:
+    """
+    One window of a person's credits (same order as returned by collect_person_credits), enriched with status.
+    The person payload itself comes from the TMDB response cache filled by /person/{person_id}
+    (PERSON_CREDITS_CACHE_SECONDS).
+    """
+    data = await tmdb_client.get_person_details(person_id, max_age=settings.PERSON_CREDITS_CACHE_SECONDS)
+    credits = collect_person_credits(data, credit_type)
+    window = project_items(credits[offset:offset + limit], resolve_spec("card", profile, fields))
 
-@router.get("/tv/{tmdb_id}/season/{season_number}")
+    await enrich_media_status(window, session)
+
+    next_offset = offset + limit if offset + limit < len(credits) else None
+    return {"results": window, "offset": offset, "total": len(credits), "next_offset": next_offset}
+
+
+@router.get("/tv/{tmdb_id}/season/{season_number}", response_class=FastJSONResponse)
 async def get_season_details(
     tmdb_id: str,
     season_number: int,
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
 ) -> Any:
     """
     Get details for a specific season of a TV show.
     """
-    data = await tmdb_client.get_season_details(tmdb_id, season_number)
+    data = project(
+        await tmdb_client.get_season_details(tmdb_id, season_number), resolve_spec("season", profile, fields)
+    )
     
     # Enrich with Emby status
     try:
         emby_lookup = await emby_client.search_by_provider_id("Tmdb", tmdb_id)
         if emby_lookup:
-            series_id = emby_lookup[0].get("Id")
-            emby_episodes = await emby_client.get_episodes(series_id, season_number)
+            emby_episodes = await emby_client.get_series_episodes(emby_lookup, season_number)
             
             # Create a set of existing episode numbers
             existing_episodes = set()
@@ -358,87 +498,120 @@ async def get_season_details(
                     else:
                         ep["is_in_library"] = False
     except Exception as e:
-        print(f"Failed to enrich season details with Emby data: {e}")
+        logger.warning("Failed to enrich season details with Emby data: %s", e)
         
     return data
 
 
-@router.get("/{media_type}/{tmdb_id}")
+async def within_budget(task: "asyncio.Task", deadline: float, label: str) -> Any:
+    """
+    Wait for an optional enrichment step until `deadline` (event loop time).
+    A slow step is cancelled and a failed one dropped, instead of delaying or failing the response.
+    """
+    timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if not done:
+        task.cancel()
+        logger.info("%s exceeded its latency budget, skipping", label)
+        return None
+    if task.cancelled():
+        return None
+    if task.exception() is not None:
+        logger.warning("%s failed: %s", label, task.exception())
+        return None
+    return task.result()
+
+@router.get("/{media_type}/{tmdb_id}", response_class=FastJSONResponse)
 async def get_details(
     media_type: str,
     tmdb_id: str,
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
 ) -> Any:
     """
-    Get media details from TMDB and enrich with credits.
+    Get media details from TMDB and enrich with Emby availability and subscription status.
+
+    Dependency graph (independent branches run concurrently):
+      TMDB details ----------------------------------------+
+      Emby lookup --+-- Emby item details (media_info) -----+--> response
+                    +-- Emby episodes (tv only) ------------+
+      subscription status (in-memory status map) ----------+
+    Only the TMDB details are required; the Emby steps are bounded by a latency budget.
     """
     # Allow 'tv' alias for 'series'
     if media_type == "series":
         media_type = "tv"
-        
-    data = await tmdb_client.get_details(media_type, tmdb_id)
-    
-    # Enrich with credits (cast/crew) - tmdb_client.get_details already does 'append_to_response' but we might need more
-    # Actually my current get_details implementation only does external_ids. Let's update it to include credits.
-    
-    # Mock status enrichment (single item list)
-    wrapper = [data]
+
+    async def emby_branch() -> List[Dict[str, Any]]:
+        return await lookup_emby_items(tmdb_id)
+
+    async def item_details_branch() -> Optional[Dict[str, Any]]:
+        emby_items = await emby_lookup
+        if not emby_items:
+            return None
+        item = emby_items[0]
+        return extract_media_info(await emby_client.get_item_details(item.get("Id"), server=item.get("Server")))
+
+    async def episodes_branch() -> Optional[Dict[int, int]]:
+        emby_items = await emby_lookup
+        if not emby_items:
+            return None
+        # If TV show is available, fetch all episodes to determine status of each season
+        return count_episodes_by_season(await emby_client.get_series_episodes(emby_items))
+
+    # Before any task is started, so a failing lookup cannot leave them running
+    requests = subscription_status.get(session, tmdb_id)
+
+    details_task = asyncio.create_task(tmdb_client.get_details(media_type, tmdb_id))
+    emby_lookup = asyncio.create_task(emby_branch())
+    media_info_task = asyncio.create_task(item_details_branch())
+    episodes_task = asyncio.create_task(episodes_branch()) if media_type == "tv" else None
+    optional_tasks = [t for t in (emby_lookup, media_info_task, episodes_task) if t is not None]
+
+    try:
+        data = await details_task
+    except BaseException:
+        for task in optional_tasks:
+            task.cancel()
+        raise
+
+    data = project(data, resolve_spec("detail", profile, fields))
+
     # Ensure ID is string for comparison
     data["id"] = str(data["id"])
     data["media_type"] = media_type
-    
-    await enrich_media_status(wrapper, session)
 
-    if data.get("status") == "AVAILABLE" and not data.get("emby_id"):
-        try:
-            emby_lookup = await emby_client.search_by_provider_id("Tmdb", tmdb_id)
-            if emby_lookup:
-                data["emby_id"] = emby_lookup[0].get("Id")
-        except Exception as exc:
-            print(f"Failed to lookup Emby item for {tmdb_id}: {exc}")
+    # Budgets count from the moment the required TMDB payload is ready
+    ready_at = asyncio.get_running_loop().time()
 
-    if data.get("emby_id"):
-        try:
-            emby_details = await emby_client.get_item_details(data["emby_id"])
-            media_info = extract_media_info(emby_details)
-            if media_info:
-                data["media_info"] = media_info
-        except Exception as exc:
-            # Log and continue without failing the entire response
-            print(f"Failed to fetch Emby media info for {tmdb_id}: {exc}")
-    
-    if media_type == "tv" and data.get("emby_id"):
-        try:
-            # If TV show is available, fetch all episodes to determine status of each season
-            emby_episodes = await emby_client.get_episodes(data["emby_id"])
-            
-            # Group episodes by ParentIndexNumber (Season Number)
-            episodes_by_season = {}
-            for ep in emby_episodes:
-                season_num = ep.get("ParentIndexNumber")
-                if season_num is not None:
-                    episodes_by_season[season_num] = episodes_by_season.get(season_num, 0) + 1
-            
-            # Add existing_episode_count to seasons data
-            if "seasons" in data:
-                for season in data["seasons"]:
-                    s_num = season.get("season_number")
-                    season["existing_episode_count"] = episodes_by_season.get(s_num, 0)
-                    
-        except Exception as e:
-            print(f"Failed to fetch Emby episodes for TV show {tmdb_id}: {e}")
+    emby_items = await within_budget(
+        emby_lookup, ready_at + settings.DETAILS_EMBY_BUDGET_SECONDS, f"Emby lookup for {tmdb_id}"
+    )
+    apply_media_status(data, emby_items or [], subscription_status.primary_of(requests))
+
+    media_info = await within_budget(
+        media_info_task, ready_at + settings.DETAILS_MEDIA_INFO_BUDGET_SECONDS, f"Emby media info for {tmdb_id}"
+    )
+    if media_info:
+        data["media_info"] = media_info
+
+    if episodes_task is not None:
+        episodes_by_season = await within_budget(
+            episodes_task, ready_at + settings.DETAILS_EPISODES_BUDGET_SECONDS, f"Emby episodes for TV show {tmdb_id}"
+        )
+        # Add existing_episode_count to seasons data
+        if episodes_by_season is not None and "seasons" in data:
+            for season in data["seasons"]:
+                s_num = season.get("season_number")
+                season["existing_episode_count"] = episodes_by_season.get(s_num, 0)
 
     # Check if subscribed (for heart icon)
     if media_type == "tv":
-        # Fetch subscription requests for this show to determine season status
-        requests = session.exec(
-            select(SubscriptionRequest).where(SubscriptionRequest.tmdb_id == tmdb_id)
-        ).all()
-        
-        season_requests = {r.specific_season: r.status for r in requests if r.specific_season is not None}
+        season_requests = {season: r.status for season, r in requests.items() if season is not None}
         # Check for whole-show request
-        whole_show_request = next((r for r in requests if r.specific_season is None), None)
+        whole_show_request = requests.get(None)
         
         if "seasons" in data:
             for season in data["seasons"]:
@@ -452,4 +625,72 @@ async def get_details(
                 if status:
                     season["subscription_status"] = status.value.upper()
 
+    search_index.add_tmdb_results([data])
+
     return data
+
+class DetailsRef(SQLModel):
+    media_type: MediaType
+    tmdb_id: str
+
+    def key(self) -> Tuple[str, str]:
+        # Allow 'tv' alias for 'series'
+        media_type = "tv" if self.media_type == MediaType.SERIES else self.media_type.value
+        return media_type, self.tmdb_id
+
+class DetailsBatchIn(SQLModel):
+    items: List[DetailsRef] = Field(min_length=1, max_length=settings.DETAILS_BATCH_MAX_ITEMS)
+
+@router.post("/details:batch", response_class=FastJSONResponse)
+async def get_details_batch(
+    batch: DetailsBatchIn,
+    profile: ProfileParam = None,
+    fields: FieldsParam = None,
+    current_user: User = Depends(deps.get_current_user),
+    session: Session = Depends(get_session)
+) -> Any:
+    """
+    Details for many (media_type, tmdb_id) pairs in one round trip, in request order.
+
+    TMDB payloads are fetched concurrently (through the shared response cache),
+    availability comes from batched Emby queries and request status from the in-memory status map.
+    Items TMDB could not resolve come back as {"media_type", "id", "error"}.
+    Defaults to the card profile; pass profile=detail for full detail payloads.
+    """
+    refs = list(dict.fromkeys(ref.key() for ref in batch.items))
+    tmdb_ids = list(dict.fromkeys(tmdb_id for _, tmdb_id in refs))
+    spec = resolve_spec("card", profile, fields)
+    semaphore = asyncio.Semaphore(settings.ENRICH_CONCURRENCY)
+
+    async def fetch(media_type: str, tmdb_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await tmdb_client.get_details(media_type, tmdb_id)
+
+    # Before any task is started, so a failing lookup cannot leave them running;
+    # prefers the whole-show request over per-season ones
+    requests_by_tmdb_id = {tmdb_id: subscription_status.primary(session, tmdb_id) for tmdb_id in tmdb_ids}
+    emby_task = asyncio.create_task(lookup_emby_items_batch(tmdb_ids))
+    details_tasks = [asyncio.create_task(fetch(media_type, tmdb_id)) for media_type, tmdb_id in refs]
+    try:
+        details = await asyncio.gather(*details_tasks, return_exceptions=True)
+        emby_by_tmdb_id = await emby_task
+    except BaseException:
+        for task in [emby_task, *details_tasks]:
+            task.cancel()
+        raise
+
+    resolved: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for (media_type, tmdb_id), data in zip(refs, details):
+        if isinstance(data, BaseException):
+            logger.warning("Batch details failed for %s/%s: %s", media_type, tmdb_id, data)
+            error = "not_found" if isinstance(data, httpx.HTTPStatusError) and data.response.status_code == 404 else "unavailable"
+            resolved[(media_type, tmdb_id)] = {"media_type": media_type, "id": tmdb_id, "error": error}
+            continue
+        data = project(data, spec)
+        data["id"] = str(data["id"])
+        data["media_type"] = media_type
+        apply_media_status(data, emby_by_tmdb_id.get(tmdb_id, []), requests_by_tmdb_id.get(tmdb_id))
+        resolved[(media_type, tmdb_id)] = data
+
+    search_index.add_tmdb_results([data for data in resolved.values() if "error" not in data])
+    return {"results": [resolved[ref.key()] for ref in batch.items]}
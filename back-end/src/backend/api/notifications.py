@@ -1,24 +1,42 @@
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from backend.api import deps
+from backend.core.responses import FastJSONResponse, FastJSONRoute
 from backend.db import get_session
 from backend.models import User, Notification
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-@router.get("/", response_model=List[Notification])
+@router.get("/", response_model=List[Notification], response_class=FastJSONResponse)
 def read_notifications(
     skip: int = 0,
     limit: int = 50,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
 ) -> Any:
-    statement = select(Notification).where(
+    statement = select(*Notification.__table__.columns).where(
         Notification.user_id == current_user.id
     ).order_by(Notification.created_at.desc()).offset(skip).limit(limit)
-    return session.exec(statement).all()
+    return [dict(row) for row in session.exec(statement).mappings()]
+
+@router.put("/read-all")
+def mark_all_read(
+    current_user: User = Depends(deps.get_current_user),
+    session: Session = Depends(get_session)
+) -> Any:
+    """
+    Mark every unread notification of the current user as read in one statement.
+    """
+    result = session.execute(
+        update(Notification)
+        .where(Notification.user_id == current_user.id, Notification.is_read == False)
+        .values(is_read=True)
+    )
+    session.commit()
+    return {"updated": result.rowcount}
 
 @router.put("/{notification_id}/read", response_model=Notification)
 def mark_read(
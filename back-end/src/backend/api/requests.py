@@ -4,15 +4,18 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, select
 
 from backend.api import deps
+from backend.core.responses import FastJSONResponse, FastJSONRoute
 from backend.db import get_session
 from backend.models import User, SubscriptionRequest, SubscriptionStatus, UserRole
-from backend.services.tmdb import tmdb_client
+from backend.jobs.external_ids import enqueue_external_ids
 from backend.services.approval import approval_service
+from backend.services.request_stats import request_stats
+from backend.services.subscription_status import subscription_status
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 @router.post("/", response_model=SubscriptionRequest)
-async def create_request(
+def create_request(
     request_in: SubscriptionRequest,
     current_user: User = Depends(deps.get_current_user),
     session: Session = Depends(get_session)
@@ -45,8 +48,12 @@ async def create_request(
             existing.release_date = request_in.release_date
             existing.specific_season = request_in.specific_season
             session.add(existing)
+            if not existing.imdb_id and not existing.tvdb_id:
+                enqueue_external_ids(session, existing)
             session.commit()
+            request_stats.invalidate()
             session.refresh(existing)
+            subscription_status.put(existing)
             return existing
         raise HTTPException(status_code=400, detail="Request for this media already exists")
 
@@ -56,29 +63,20 @@ async def create_request(
     request_in.user_id = current_user.id
     request_in.status = SubscriptionStatus.PENDING
     
-    # Fetch external IDs (IMDB/TVDB) for automation
-    try:
-        # Handle 'tv' vs 'series' vs 'movie'
-        lookup_type = request_in.media_type
-        if lookup_type == "series":
-            lookup_type = "tv"
-            
-        details = await tmdb_client.get_details(lookup_type, request_in.tmdb_id)
-        external_ids = details.get("external_ids", {})
-        request_in.imdb_id = external_ids.get("imdb_id")
-        request_in.tvdb_id = str(external_ids.get("tvdb_id")) if external_ids.get("tvdb_id") else None
-    except Exception:
-        pass # Ignore if TMDB fails, we can retry later or proceed without
-
     session.add(request_in)
+    session.flush()
+    # External IDs (IMDB/TVDB) for automation are fetched in the background, with retries
+    enqueue_external_ids(session, request_in)
     session.commit()
+    request_stats.invalidate()
     session.refresh(request_in)
+    subscription_status.put(request_in)
     return request_in
 
 class RequestWithUser(SubscriptionRequest):
     user_name: Optional[str] = None
 
-@router.get("/", response_model=List[RequestWithUser])
+@router.get("/", response_model=List[RequestWithUser], response_class=FastJSONResponse)
 def read_requests(
     skip: int = 0,
     limit: int = 100,
@@ -89,8 +87,12 @@ def read_requests(
 ) -> Any:
     """
     Retrieve requests.
+    Rows are read as plain column mappings and encoded directly, without building
+    model instances or re-validating them against RequestWithUser.
     """
-    query = select(SubscriptionRequest, User.name).join(User, SubscriptionRequest.user_id == User.id)
+    query = select(
+        *SubscriptionRequest.__table__.columns, User.name.label("user_name")
+    ).join(User, SubscriptionRequest.user_id == User.id)
     
     if current_user.role != UserRole.ADMIN or own:
         query = query.where(SubscriptionRequest.user_id == current_user.id)
@@ -100,15 +102,18 @@ def read_requests(
         
     query = query.offset(skip).limit(limit).order_by(SubscriptionRequest.request_date.desc())
     
-    results = session.exec(query).all()
-    
-    final_results = []
-    for req, user_name in results:
-        req_dict = req.model_dump()
-        req_dict["user_name"] = user_name
-        final_results.append(req_dict)
-        
-    return final_results
+    return [dict(row) for row in session.exec(query).mappings()]
+
+@router.get("/stats")
+def read_request_stats(
+    current_user: User = Depends(deps.get_current_active_admin),
+    session: Session = Depends(get_session)
+) -> Any:
+    """
+    Request counts by status, media type and user, daily throughput over the last
+    30 days and the median time from request to completion, for the admin dashboard.
+    """
+    return request_stats.get(session)
 
 @router.put("/{request_id}/approve", response_model=SubscriptionRequest)
 def approve_request(
@@ -122,10 +127,11 @@ def approve_request(
         
     request.status = SubscriptionStatus.APPROVED
     session.add(request)
+    approval_service.notify_downloader(session, request)
     session.commit()
+    request_stats.invalidate()
     session.refresh(request)
-    
-    approval_service.notify_downloader(request)
+    subscription_status.put(request)
     
     return request
 
@@ -142,7 +148,9 @@ def reject_request(
     request.status = SubscriptionStatus.REJECTED
     session.add(request)
     session.commit()
+    request_stats.invalidate()
     session.refresh(request)
+    subscription_status.put(request)
     return request
 
 @router.delete("/{tmdb_id}")
@@ -174,5 +182,7 @@ def cancel_request(
     response_payload = request.model_dump()
     session.delete(request)
     session.commit()
+    request_stats.invalidate()
+    subscription_status.remove(response_payload["tmdb_id"], response_payload["specific_season"])
     return response_payload
 
@@ -0,0 +1,55 @@
+from typing import Any
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from sqlmodel import Session
+
+from backend.api import deps
+from backend.core.startup import startup_state
+from backend.db import get_session
+from backend.models import User
+from backend.services.job_runs import job_ledger
+from backend.services.scheduler import scheduler
+from backend.services.rate_limit import rate_limit_metrics
+from backend.services.circuit_breaker import circuit_breaker_metrics
+from backend.services.prefetch import prefetcher
+from backend.services.admission import admission
+
+router = APIRouter()
+
+@router.get("/ready")
+def read_ready() -> Any:
+    """
+    Readiness probe (no auth): 200 once startup and warm-up are done, 503 before that and during shutdown.
+    """
+    return JSONResponse(status_code=200 if startup_state.ready else 503, content=startup_state.status())
+
+@router.get("/metrics")
+def read_metrics(
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Runtime metrics for admins: outbound rate limiter queue depth and wait times,
+    circuit breaker state per upstream, prefetch counters and per-user admission control.
+    """
+    return {
+        "rate_limits": rate_limit_metrics(),
+        "circuit_breakers": circuit_breaker_metrics(),
+        "prefetch": prefetcher.metrics(),
+        "admission": admission.metrics(),
+    }
+
+@router.get("/jobs")
+def read_jobs(
+    recent: int = Query(20, ge=1, le=200),
+    current_user: User = Depends(deps.get_current_active_admin),
+    session: Session = Depends(get_session),
+) -> Any:
+    """
+    Scheduled job runs: per job the newest runs with their timings and counters,
+    duration percentiles, error and overlap-skip counts, and the next scheduled run.
+    """
+    jobs = job_ledger.summary(session, recent=recent)
+    for job in jobs:
+        scheduled = scheduler.get_job(job["job_id"]) if scheduler.running else None
+        job["next_run_time"] = scheduled.next_run_time if scheduled else None
+    return {"jobs": jobs}
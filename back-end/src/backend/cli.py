@@ -0,0 +1,97 @@
+"""
+Command line entry point: ``python -m backend {api,worker}``.
+"""
+import argparse
+import asyncio
+import os
+import signal
+
+
+def run_api(args: argparse.Namespace) -> None:
+    """
+    Serve the HTTP API. With --no-scheduler only request handling (and the
+    per-process cache refresh) runs here; pair it with a separate worker.
+    """
+    if args.no_scheduler:
+        # Read by Settings in this process and in every uvicorn worker it spawns
+        os.environ["RUN_SCHEDULER_IN_API"] = "false"
+
+    import uvicorn
+    from backend.core.logging import setup_logging
+
+    setup_logging()
+
+    uvicorn.run(
+        "backend.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        proxy_headers=True,
+        # Let uvicorn's loggers propagate to the queued root handler
+        log_config=None,
+    )
+
+
+async def _worker_main() -> None:
+    from backend.db import init_db
+    from backend.services.downloader import downloader
+    from backend.services.scheduler import start_scheduler, stop_scheduler
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+    init_db()
+    # Shared jobs coordinate through the scheduler lease, so several workers are safe
+    start_scheduler(shared_jobs=True, local_jobs=False)
+    logger.info("Background worker started")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        stop_scheduler()
+        await downloader.aclose()
+        logger.info("Background worker stopped")
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    """
+    Run the scheduler and background jobs in their own process, without the API.
+    """
+    from backend.core.logging import setup_logging
+
+    setup_logging()
+    asyncio.run(_worker_main())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="backend", description="Emby Subscription Manager")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    api = subparsers.add_parser("api", help="Serve the HTTP API")
+    api.add_argument("--host", default="0.0.0.0")
+    api.add_argument("--port", type=int, default=8000)
+    api.add_argument("--workers", type=int, default=1)
+    api.add_argument(
+        "--no-scheduler",
+        action="store_true",
+        help="Do not run background jobs in the API process (use with `backend worker`)",
+    )
+    api.set_defaults(func=run_api)
+
+    worker = subparsers.add_parser("worker", help="Run scheduled background jobs")
+    worker.set_defaults(func=run_worker)
+
+    return parser
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
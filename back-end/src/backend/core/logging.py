@@ -0,0 +1,176 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from backend.settings import get_settings
+
+settings = get_settings()
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s [%(request_id)s]: %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Stamp records with the id of the HTTP request being served ("-" outside requests).
+    Runs on the logging thread of the caller, where the contextvar is visible.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of the DEBUG records of chosen loggers.
+
+    `rates` maps a logger name (prefixes match children too) to the fraction
+    to keep, e.g. {"backend.api.media": 0.1} keeps every tenth debug line.
+    INFO and above are never sampled.
+    """
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.every = {name: max(1, round(1 / rate)) if rate > 0 else 0 for name, rate in rates.items()}
+        self.counters: Dict[str, int] = {}
+
+    def _every(self, name: str) -> Optional[int]:
+        while name:
+            if name in self.every:
+                return self.every[name]
+            name = name.rpartition(".")[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.INFO or not self.every:
+            return True
+        every = self._every(record.name)
+        if every is None:
+            return True
+        if every == 0:
+            return False
+        count = self.counters.get(record.name, 0)
+        self.counters[record.name] = count + 1
+        return count % every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line; fields passed with `extra=` are included.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the whole record (traceback included) on the
+    calling thread and drops exc_info. Here only the arguments are merged into
+    the message, so mutable args cannot change while queued; exc_info is kept
+    for the output handler's formatter.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(level: Optional[str] = None) -> None:
+    """
+    Route all logging through a queue drained by a background thread, so the event loop
+    only pays for enqueueing a record; formatting and stdout writes happen off-loop.
+    Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = DeferredQueueHandler(log_queue)
+    # Filters run before enqueueing: dropped records cost no I/O, and the request id is read in context
+    handler.addFilter(RequestIdFilter())
+    if settings.LOG_SAMPLE_RATES:
+        handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATES))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel((level or settings.LOG_LEVEL).upper())
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """
+    Flush queued records and stop the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware giving every HTTP request an id, taken from X-Request-ID when the
+    client (or a proxy) sends one. It is visible to logging and echoed in the response.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex[:16]
+        token = request_id_var.set(request_id)
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_var.reset(token)
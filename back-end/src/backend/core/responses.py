@@ -0,0 +1,70 @@
+import inspect
+import json
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from starlette.responses import JSONResponse, Response
+
+from backend.settings import get_settings
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+settings = get_settings()
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode plain Python data (dicts, lists, datetimes, enums) to JSON bytes.
+    """
+    if orjson is not None and settings.FAST_JSON:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed.
+    """
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _wrap_endpoint(endpoint: Callable) -> Callable:
+    # Returning a Response makes FastAPI skip jsonable_encoder and response_model validation
+    if inspect.iscoroutinefunction(endpoint):
+        @wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            return result if isinstance(result, Response) else FastJSONResponse(result)
+        return async_wrapper
+
+    @wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        result = endpoint(*args, **kwargs)
+        return result if isinstance(result, Response) else FastJSONResponse(result)
+    return sync_wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Route class for opting endpoints into the fast serialization path.
+
+    Endpoints declared with ``response_class=FastJSONResponse`` have their return
+    value encoded straight to bytes: no jsonable_encoder walk and no re-validation
+    against ``response_model`` (which is still used for the OpenAPI schema).
+    Endpoints must therefore return plain data that already matches the model.
+    The functions themselves are left untouched, so calling them directly still
+    returns the plain data.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        if kwargs.get("response_class") is FastJSONResponse:
+            endpoint = _wrap_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
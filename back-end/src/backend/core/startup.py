@@ -0,0 +1,51 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupState:
+    """
+    Startup phase timings and the readiness flag behind GET /system/ready.
+
+    The app turns ready only once startup and warm-up (database, snapshot restore,
+    scheduler) are done, and stops being ready as soon as shutdown begins, so a
+    load balancer only routes traffic to processes that can serve it quickly.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.started_at: Optional[float] = None
+        self.ready_after_ms: Optional[float] = None
+        self.phases: Dict[str, float] = {}
+
+    def begin(self) -> None:
+        self.ready = False
+        self.started_at = time.perf_counter()
+        self.ready_after_ms = None
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    def mark_ready(self) -> None:
+        if self.started_at is not None:
+            self.ready_after_ms = round((time.perf_counter() - self.started_at) * 1000, 2)
+        self.ready = True
+        logger.info("Ready after %s ms: %s", self.ready_after_ms, self.phases)
+
+    def mark_stopping(self) -> None:
+        self.ready = False
+
+    def status(self) -> Dict[str, Any]:
+        return {"ready": self.ready, "ready_after_ms": self.ready_after_ms, "phases_ms": self.phases}
+
+
+startup_state = StartupState()
@@ -0,0 +1,171 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Dict, Iterable, List, Optional
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are built
+    brotli = None
+
+# Vite emits content-hashed file names under assets/, so they never change in place
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+DEFAULT_CACHE = "public, max-age=3600"
+INDEX_CACHE = "no-cache"
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+    "application/manifest+json",
+)
+MIN_COMPRESS_SIZE = 1024
+
+
+class StaticAsset:
+    def __init__(self, path: str, media_type: str, cache_control: str):
+        self.path = path
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.etag = ""
+        self.size = 0
+        # encoding -> body; None for files served from disk
+        self.variants: Optional[Dict[str, bytes]] = None
+
+
+class StaticSite:
+    """
+    The built SPA, indexed once at startup.
+
+    Every file is read into memory with its ETag, Cache-Control and
+    pre-built gzip/brotli variants, so a request is a dict lookup plus
+    Accept-Encoding negotiation and never touches the filesystem.
+    Files above `max_memory_bytes` are indexed but streamed from disk.
+    """
+
+    def __init__(self, root: str, max_memory_bytes: int = 5 * 1024 * 1024):
+        self.root = root
+        self.max_memory_bytes = max_memory_bytes
+        self.assets: Dict[str, StaticAsset] = {}
+
+    def load(self) -> None:
+        assets: Dict[str, StaticAsset] = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith((".gz", ".br")):
+                    continue
+                full_path = os.path.join(dirpath, filename)
+                rel_path = os.path.relpath(full_path, self.root).replace(os.sep, "/")
+                assets[rel_path] = self._build(rel_path, full_path)
+        self.assets = assets
+
+    def _build(self, rel_path: str, full_path: str) -> StaticAsset:
+        media_type = mimetypes.guess_type(rel_path)[0] or "application/octet-stream"
+        if rel_path == "index.html":
+            cache_control = INDEX_CACHE
+        elif rel_path.startswith("assets/"):
+            cache_control = IMMUTABLE_CACHE
+        else:
+            cache_control = DEFAULT_CACHE
+
+        asset = StaticAsset(full_path, media_type, cache_control)
+        asset.size = os.path.getsize(full_path)
+        if asset.size > self.max_memory_bytes:
+            stat = os.stat(full_path)
+            asset.etag = f'"{int(stat.st_mtime)}-{stat.st_size}"'
+            return asset
+
+        with open(full_path, "rb") as f:
+            body = f.read()
+        asset.etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        asset.variants = {"identity": body}
+
+        if asset.size >= MIN_COMPRESS_SIZE and media_type.startswith(COMPRESSIBLE_TYPES):
+            asset.variants["gzip"] = self._read_or(full_path + ".gz", lambda: gzip.compress(body, 9, mtime=0))
+            if brotli is not None or os.path.exists(full_path + ".br"):
+                asset.variants["br"] = self._read_or(full_path + ".br", lambda: brotli.compress(body, quality=11))
+        return asset
+
+    @staticmethod
+    def _read_or(path: str, build) -> bytes:
+        # Prefer variants produced by the frontend build, if any
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        return build()
+
+    @staticmethod
+    def _negotiate(header: str, available: Iterable[str]) -> str:
+        """
+        Pick the encoding to serve from `available` for an Accept-Encoding header.
+
+        A compressed variant is served whenever one is acceptable: the highest
+        q-value wins, br before gzip on ties. `*` covers the encodings not listed
+        by name and q=0 refuses one. When nothing compressed is acceptable the
+        identity body is served, even if the client refused identity too (no 406).
+        """
+        weights: Dict[str, float] = {}
+        for part in header.split(","):
+            token, _, params = part.strip().partition(";")
+            token = token.strip().lower()
+            if not token:
+                continue
+            q = 1.0
+            name, _, value = params.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+            weights[token] = q
+
+        best, best_q = "identity", 0.0
+        for candidate in ("br", "gzip"):
+            if candidate not in available:
+                continue
+            q = weights.get(candidate, weights.get("*", 0.0))
+            if q > best_q:
+                best, best_q = candidate, q
+        return best
+
+    def response(self, full_path: str, request: Request) -> Response:
+        asset = self.assets.get(full_path.lstrip("/"))
+        if asset is None:
+            if full_path.startswith("assets/"):
+                return Response(status_code=404)
+            # Otherwise return index.html for SPA routing
+            asset = self.assets.get("index.html")
+            if asset is None:
+                return Response(status_code=404)
+
+        if asset.variants is None:
+            headers = {"ETag": asset.etag, "Cache-Control": asset.cache_control}
+            if asset.etag in self._etags(request):
+                return Response(status_code=304, headers=headers)
+            return FileResponse(asset.path, media_type=asset.media_type, headers=headers)
+
+        encoding = self._negotiate(request.headers.get("accept-encoding", ""), asset.variants)
+
+        # Each encoded representation gets its own validator
+        etag = asset.etag if encoding == "identity" else f'{asset.etag[:-1]}-{encoding}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": asset.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if etag in self._etags(request):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+    @staticmethod
+    def _etags(request: Request) -> List[str]:
+        header = request.headers.get("if-none-match", "")
+        return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
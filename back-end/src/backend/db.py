@@ -8,6 +8,8 @@ engine = create_engine(
 )
 
 def init_db():
+    if settings.SKIP_CREATE_ALL:
+        return
     SQLModel.metadata.create_all(engine)
 
 def get_session():
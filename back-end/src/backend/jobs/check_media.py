@@ -1,42 +1,145 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
 from sqlmodel import Session, select
 from backend.db import engine
 from backend.models import SubscriptionRequest, SubscriptionStatus, Notification
-from backend.services.emby import emby_client
+from backend.services import job_runs
+from backend.services.emby import count_episodes_by_season, emby_client
+from backend.services.request_stats import request_stats
+from backend.services.subscription_status import RequestState, subscription_status
+from backend.services.tmdb import tmdb_client
+from backend.settings import get_settings
 import logging
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+def provider_ids(requests: List[SubscriptionRequest]) -> Dict[str, Optional[str]]:
+    # Emby items might have ProviderIds: { "Tmdb": "12345", "Imdb": "tt0123", "Tvdb": "456" }
+    # and not every library has Tmdb ids, so match on any of them
+    return {
+        "Tmdb": requests[0].tmdb_id,
+        "Imdb": next((r.imdb_id for r in requests if r.imdb_id), None),
+        "Tvdb": next((r.tvdb_id for r in requests if r.tvdb_id), None),
+    }
+
+def expected_episodes_by_season(tmdb_show: Dict[str, Any]) -> Dict[int, int]:
+    """
+    Episode count of every regular season TMDB knows episodes for (specials excluded).
+    """
+    return {
+        season["season_number"]: season["episode_count"]
+        for season in tmdb_show.get("seasons") or []
+        if (season.get("season_number") or 0) > 0 and (season.get("episode_count") or 0) > 0
+    }
+
+def completed_series_requests(
+    requests: List[SubscriptionRequest],
+    expected: Dict[int, int],
+    in_library: Dict[int, int],
+) -> List[SubscriptionRequest]:
+    """
+    A season request is complete once Emby has every episode TMDB lists for that season;
+    a whole-show request once that holds for every season.
+    """
+    def season_complete(season: int) -> bool:
+        return season in expected and in_library.get(season, 0) >= expected[season]
+
+    completed = []
+    for request in requests:
+        if request.specific_season is not None:
+            done = season_complete(request.specific_season)
+        else:
+            done = bool(expected) and all(season_complete(season) for season in expected)
+        if done:
+            completed.append(request)
+    return completed
+
+async def check_movie(requests: List[SubscriptionRequest]) -> List[SubscriptionRequest]:
+    items = await emby_client.search_by_any_provider_id(provider_ids(requests), item_types="Movie")
+    # Only the movie itself counts, never another item that shares one of its ids
+    return requests if any(item.get("Type") == "Movie" for item in items) else []
+
+async def check_series(requests: List[SubscriptionRequest]) -> List[SubscriptionRequest]:
+    """
+    All approved requests of one series share one Emby lookup, one Emby episodes
+    fetch per server and one (cached) TMDB details fetch.
+    """
+    items = await emby_client.search_by_any_provider_id(provider_ids(requests), item_types="Series")
+    # Episodes may be split across servers, so every server's series item counts
+    series = [item for item in items if item.get("Type") == "Series"]
+    if not series:
+        return []
+
+    tmdb_show, episodes = await asyncio.gather(
+        tmdb_client.get_details("tv", requests[0].tmdb_id),
+        emby_client.get_series_episodes(series),
+    )
+    return completed_series_requests(
+        requests, expected_episodes_by_season(tmdb_show), count_episodes_by_season(episodes)
+    )
+
+def notification_message(request: SubscriptionRequest) -> str:
+    if request.specific_season is not None:
+        return f"您申请的 '{request.title}' 第 {request.specific_season} 季已经入库 Emby，现在可以观看了。"
+    return f"您申请的 '{request.title}' 已经入库 Emby，现在可以观看了。"
+
 async def check_new_media_job():
     logger.info("Starting check_new_media_job")
     with Session(engine) as session:
         # Get all approved requests
         statement = select(SubscriptionRequest).where(SubscriptionRequest.status == SubscriptionStatus.APPROVED)
         requests = session.exec(statement).all()
-        
+
+        job_runs.count("items_scanned", len(requests))
         if not requests:
             return
 
+        # One group per title, so a series with several season requests is checked once
+        groups: Dict[tuple, List[SubscriptionRequest]] = {}
         for request in requests:
-            # Check Emby
-            # We use search_by_provider_id with tmdb
-            # Emby items might have ProviderIds: { "Tmdb": "12345" }
-            try:
-                items = await emby_client.search_by_provider_id("Tmdb", request.tmdb_id)
-                if items:
-                    # Found it!
-                    request.status = SubscriptionStatus.COMPLETED
-                    session.add(request)
-                    
-                    # Create Notification
-                    notification = Notification(
-                        user_id=request.user_id,
-                        title="资源已入库",
-                        message=f"您申请的 '{request.title}' 已经入库 Emby，现在可以观看了。",
-                        related_subscription_id=request.id
-                    )
-                    session.add(notification)
-                    session.commit()
-                    logger.info(f"Request {request.id} completed and notification sent.")
-            except Exception as e:
-                logger.error(f"Error checking media for request {request.id}: {e}")
+            is_series = request.media_type in ("tv", "series")
+            groups.setdefault((is_series, request.tmdb_id), []).append(request)
+
+        semaphore = asyncio.Semaphore(settings.ENRICH_CONCURRENCY)
+
+        async def check(is_series: bool, group: List[SubscriptionRequest]) -> List[SubscriptionRequest]:
+            async with semaphore:
+                try:
+                    return await (check_series(group) if is_series else check_movie(group))
+                except Exception as e:
+                    job_runs.count("errors")
+                    logger.error(f"Error checking media for requests {[r.id for r in group]}: {e}")
+                    return []
+
+        results = await asyncio.gather(*(check(is_series, group) for (is_series, _), group in groups.items()))
+        completed = [request for group in results for request in group]
+        job_runs.count("matches", len(completed))
+
+        if not completed:
+            return
 
+        # Status updates and notifications are written in one transaction
+        now = datetime.utcnow()
+        for request in completed:
+            request.status = SubscriptionStatus.COMPLETED
+            request.completed_at = now
+        session.add_all(completed)
+        session.execute(insert(Notification), [
+            {
+                "user_id": request.user_id,
+                "title": "资源已入库",
+                "message": notification_message(request),
+                "is_read": False,
+                "created_at": now,
+                "related_subscription_id": request.id,
+            }
+            for request in completed
+        ])
+        states = [RequestState.of(request) for request in completed]
+        session.commit()
+        request_stats.invalidate()
+        subscription_status.record(states)
+        logger.info(f"Completed {len(completed)} requests and sent notifications: {[r.id for r in completed]}")
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlmodel import Session
+from backend.models import DispatchStatus, SubscriptionRequest, SubscriptionStatus, WorkItem
+from backend.services import downloader as downloader_module
+from backend.services.work_queue import work_queue
+from backend.settings import get_settings
+import logging
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+DISPATCH = "dispatch"
+
+def enqueue_dispatch(session: Session, request: SubscriptionRequest) -> None:
+    """
+    Queue the hand-off of an approved request to the downloader; lands with the caller's commit.
+    """
+    request.dispatch_status = DispatchStatus.QUEUED
+    request.dispatched_at = None
+    session.add(request)
+    work_queue.enqueue(session, DISPATCH, str(request.id))
+
+async def dispatch_requests(session: Session, items: List[WorkItem]) -> List[Optional[BaseException]]:
+    """
+    Send due requests in batches of the adapter's max_batch_size, DOWNLOADER_CONCURRENCY batches at a time.
+    A failed batch fails (and is retried) for each of its requests.
+    """
+    downloader = downloader_module.downloader
+    requests: Dict[str, Optional[SubscriptionRequest]] = {
+        item.key: session.get(SubscriptionRequest, int(item.key)) for item in items
+    }
+    errors: Dict[str, Optional[BaseException]] = {item.key: None for item in items}
+    # Requests deleted, cancelled or rejected since approval are not sent
+    sendable = [
+        item for item in items
+        if requests[item.key] is not None and requests[item.key].status == SubscriptionStatus.APPROVED
+    ]
+    size = max(1, downloader.max_batch_size)
+    batches = [sendable[i:i + size] for i in range(0, len(sendable), size)]
+    semaphore = asyncio.Semaphore(settings.DOWNLOADER_CONCURRENCY)
+
+    async def send(batch: List[WorkItem]) -> Optional[BaseException]:
+        async with semaphore:
+            try:
+                await downloader.submit([requests[item.key] for item in batch])
+            except Exception as e:
+                return e
+            return None
+
+    outcomes = await asyncio.gather(*(send(batch) for batch in batches))
+
+    now = datetime.utcnow()
+    for batch, error in zip(batches, outcomes):
+        if error is not None:
+            logger.warning("Downloader %s rejected a batch of %d requests: %s", downloader.name, len(batch), error)
+        for item in batch:
+            request = requests[item.key]
+            errors[item.key] = error
+            if error is None:
+                request.dispatch_status = DispatchStatus.DELIVERED
+                request.dispatched_at = now
+            elif item.attempts + 1 >= work_queue.max_attempts:
+                request.dispatch_status = DispatchStatus.FAILED
+            session.add(request)
+    return [errors[item.key] for item in items]
+
+work_queue.register_batch(DISPATCH, dispatch_requests)
@@ -0,0 +1,51 @@
+from sqlmodel import Session, col, select
+from backend.db import engine
+from backend.models import SubscriptionRequest, SubscriptionStatus, WorkItem
+from backend.services import job_runs
+from backend.services.tmdb import tmdb_client
+from backend.services.work_queue import work_queue
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXTERNAL_IDS = "external_ids"
+
+def enqueue_external_ids(session: Session, request: SubscriptionRequest) -> None:
+    """
+    Queue the IMDb/TVDB id lookup of a request; `request.id` must be assigned (flush first).
+    """
+    work_queue.enqueue(session, EXTERNAL_IDS, str(request.id))
+
+async def resolve_external_ids(session: Session, item: WorkItem) -> None:
+    request = session.get(SubscriptionRequest, int(item.key))
+    if request is None:
+        return
+    # Handle 'tv' vs 'series' vs 'movie'
+    media_type = "tv" if request.media_type == "series" else request.media_type
+    external_ids = await tmdb_client.get_external_ids(media_type, request.tmdb_id)
+    request.imdb_id = external_ids.get("imdb_id") or None
+    request.tvdb_id = str(external_ids.get("tvdb_id")) if external_ids.get("tvdb_id") else None
+    session.add(request)
+
+work_queue.register(EXTERNAL_IDS, resolve_external_ids)
+
+async def backfill_external_ids_job():
+    """
+    Queue lookups for open requests that never got their external ids (e.g. created before the queue existed).
+    """
+    with Session(engine) as session:
+        queued = set(session.exec(select(WorkItem.key).where(WorkItem.kind == EXTERNAL_IDS)).all())
+        statement = select(SubscriptionRequest).where(
+            col(SubscriptionRequest.status).in_([SubscriptionStatus.PENDING, SubscriptionStatus.APPROVED]),
+            SubscriptionRequest.imdb_id == None,
+            SubscriptionRequest.tvdb_id == None,
+        )
+        candidates = session.exec(statement).all()
+        missing = [r for r in candidates if str(r.id) not in queued]
+        job_runs.count("items_scanned", len(candidates))
+        job_runs.count("matches", len(missing))
+        for request in missing:
+            enqueue_external_ids(session, request)
+        session.commit()
+    if missing:
+        logger.info(f"Queued external id lookups for {len(missing)} requests")
@@ -0,0 +1,24 @@
+from sqlmodel import Session
+from backend.db import engine
+from backend.services.work_queue import work_queue
+# Importing the job modules registers their handlers
+import backend.jobs.external_ids  # noqa: F401
+import backend.jobs.dispatch_downloads  # noqa: F401
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on batches per kind and run, so one backlog cannot hold the job forever
+MAX_BATCHES_PER_RUN = 20
+
+async def process_work_queue_job():
+    with Session(engine) as session:
+        for kind in work_queue.kinds:
+            processed = 0
+            for _ in range(MAX_BATCHES_PER_RUN):
+                count = await work_queue.process(session, kind)
+                processed += count
+                if count < work_queue.batch_size:
+                    break
+            if processed:
+                logger.info(f"Processed {processed} {kind} work items")
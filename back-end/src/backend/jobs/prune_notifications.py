@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+from sqlalchemy import delete
+from sqlmodel import Session, col, select
+from backend.db import engine
+from backend.models import Notification
+from backend.services import job_runs
+from backend.settings import get_settings
+import logging
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+def prune_notifications(session: Session, cutoff: datetime, batch_size: int) -> int:
+    """
+    Delete read notifications created before `cutoff`, `batch_size` rows per transaction
+    so the table is never locked for long. Returns the number of deleted rows.
+    """
+    deleted = 0
+    while True:
+        ids = session.exec(
+            select(Notification.id)
+            .where(Notification.is_read == True, Notification.created_at < cutoff)
+            .order_by(Notification.created_at)
+            .limit(batch_size)
+        ).all()
+        if not ids:
+            return deleted
+        session.execute(delete(Notification).where(col(Notification.id).in_(ids)))
+        session.commit()
+        deleted += len(ids)
+
+async def prune_notifications_job():
+    if settings.NOTIFICATION_RETENTION_DAYS <= 0:
+        return
+    cutoff = datetime.utcnow() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    with Session(engine) as session:
+        deleted = prune_notifications(session, cutoff, settings.NOTIFICATION_PRUNE_BATCH_SIZE)
+    job_runs.count("matches", deleted)
+    if deleted:
+        logger.info(f"Deleted {deleted} read notifications older than {cutoff:%Y-%m-%d}")
@@ -0,0 +1,19 @@
+from backend.services import job_runs
+from backend.services.emby import emby_client
+from backend.services.search_index import search_index
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def refresh_search_index_job():
+    logger.info("Starting refresh_search_index_job")
+    try:
+        items = await emby_client.get_library_items()
+    except Exception as e:
+        logger.error(f"Error loading Emby library for search index: {e}")
+        return
+
+    count = search_index.load_emby_library(items)
+    job_runs.count("items_scanned", len(items))
+    job_runs.count("matches", count)
+    logger.info(f"Search index refreshed with {count} library titles ({len(search_index)} entries total).")
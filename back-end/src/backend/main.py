@@ -1,19 +1,48 @@
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from starlette.responses import FileResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import os
 
 from backend.db import init_db
+from backend.core.logging import RequestIdMiddleware, setup_logging, stop_logging
+from backend.core.startup import startup_state
+from backend.core.static import StaticSite
 from backend.settings import get_settings
-from backend.api import auth, media, requests, notifications
-from backend.services.scheduler import start_scheduler
+from backend.api import auth, media, requests, notifications, system
+from backend.services.scheduler import start_scheduler, stop_scheduler
+from backend.services.admission import AdmissionRejected
+from backend.services.circuit_breaker import CircuitOpenError, circuit_breakers
+from backend.services.downloader import downloader
+from backend.services.emby import emby_client
+from backend.services.snapshot import load_snapshot, save_snapshot
+from backend.services.tmdb import tmdb_client
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_db()
-    start_scheduler()
+    startup_state.begin()
+    setup_logging()
+    with startup_state.phase("init_db"):
+        init_db()
+    if static_site is not None:
+        with startup_state.phase("static_site"):
+            static_site.load()
+    # Before the first request, so a restart does not start with cold caches
+    with startup_state.phase("snapshot"):
+        load_snapshot()
+    with startup_state.phase("scheduler"):
+        start_scheduler(shared_jobs=get_settings().RUN_SCHEDULER_IN_API, local_jobs=True)
+    startup_state.mark_ready()
     yield
+    startup_state.mark_stopping()
+    stop_scheduler()
+    save_snapshot()
+    # Let write-behind cache writes finish before the process exits
+    for breaker in circuit_breakers:
+        await breaker.last_good.drain()
+    await tmdb_client.aclose()
+    await emby_client.aclose()
+    await downloader.aclose()
+    stop_logging()
 
 app = FastAPI(
     title="Emby Subscription Manager",
@@ -21,11 +50,31 @@ app = FastAPI(
     openapi_url=f"{get_settings().API_V1_STR}/openapi.json",
     docs_url=f"{get_settings().API_V1_STR}/docs",
 )
+app.add_middleware(RequestIdMiddleware)
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    # Fail fast while an upstream is known to be down instead of waiting for its timeout
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(int(get_settings().CIRCUIT_BREAKER_OPEN_SECONDS))},
+    )
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    # One user is over their share of the expensive endpoints; everyone else is unaffected
+    return JSONResponse(
+        status_code=429,
+        content={"detail": exc.reason},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 app.include_router(auth.router, prefix=f"{get_settings().API_V1_STR}/auth", tags=["auth"])
 app.include_router(media.router, prefix=f"{get_settings().API_V1_STR}/media", tags=["media"])
 app.include_router(requests.router, prefix=f"{get_settings().API_V1_STR}/requests", tags=["requests"])
 app.include_router(notifications.router, prefix=f"{get_settings().API_V1_STR}/notifications", tags=["notifications"])
+app.include_router(system.router, prefix=f"{get_settings().API_V1_STR}/system", tags=["system"])
 
 # Serve React/Vue Frontend in Production
 # Assuming static files are located at /app/static in Docker
@@ -37,25 +86,13 @@ static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file
 # dirname = /app
 # join "static" -> /app/static. Yes.
 
-if os.path.exists(static_dir):
-    # Mount assets folder specifically
-    assets_dir = os.path.join(static_dir, "assets")
-    if os.path.exists(assets_dir):
-        app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
-
-    # Catch-all route for SPA
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
-        # Check if requesting a specific file that exists in static (e.g. vite.svg, favicon.ico)
-        file_path = os.path.join(static_dir, full_path)
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            return FileResponse(file_path)
-        
-        # Otherwise return index.html for SPA routing
-        index_path = os.path.join(static_dir, "index.html")
-        if os.path.exists(index_path):
-            return FileResponse(index_path)
-        return {"message": "Frontend not found"}
+static_site = StaticSite(static_dir) if os.path.exists(static_dir) else None
+
+if static_site is not None:
+    # Catch-all route for SPA, served from the in-memory index built at startup
+    @app.get("/{full_path:path}", include_in_schema=False)
+    async def serve_frontend(full_path: str, request: Request):
+        return static_site.response(full_path, request)
 
 @app.get("/api_health")
 def read_root():
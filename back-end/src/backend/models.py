@@ -1,4 +1,5 @@
 from typing import Optional
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 from enum import Enum
@@ -13,6 +14,21 @@ class SubscriptionStatus(str, Enum):
     REJECTED = "rejected"
     COMPLETED = "completed"
 
+class WorkStatus(str, Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+class DispatchStatus(str, Enum):
+    QUEUED = "queued"
+    DELIVERED = "delivered"
+    FAILED = "failed"
+
+class JobRunStatus(str, Enum):
+    OK = "ok"
+    ERROR = "error"
+    SKIPPED = "skipped"  # the previous run was still going
+
 class MediaType(str, Enum):
     MOVIE = "movie"
     SERIES = "series"
@@ -36,6 +52,7 @@ class SubscriptionRequest(SQLModel, table=True):
     release_date: Optional[str] = None
     status: SubscriptionStatus = Field(default=SubscriptionStatus.PENDING)
     request_date: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
     comment: Optional[str] = None
     specific_season: Optional[int] = Field(default=None, description="Specific season number to subscribe to")
     
@@ -43,7 +60,17 @@ class SubscriptionRequest(SQLModel, table=True):
     imdb_id: Optional[str] = None
     tvdb_id: Optional[str] = None
 
+    # Hand-off to the downloader after approval
+    dispatch_status: Optional[DispatchStatus] = None
+    dispatched_at: Optional[datetime] = None
+
 class Notification(SQLModel, table=True):
+    # Listing (per user, newest first) and retention (read, oldest first) queries
+    __table_args__ = (
+        Index("ix_notification_user_id_created_at", "user_id", "created_at"),
+        Index("ix_notification_is_read_created_at", "is_read", "created_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="user.id")
     title: str
@@ -52,3 +79,45 @@ class Notification(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     related_subscription_id: Optional[int] = Field(default=None, foreign_key="subscriptionrequest.id")
 
+
+class SchedulerLease(SQLModel, table=True):
+    # One row per leadership role; the holder runs the scheduled jobs until expires_at
+    name: str = Field(primary_key=True)
+    holder: str
+    expires_at: datetime
+
+
+class WorkItem(SQLModel, table=True):
+    # Persistent background work: one row per (kind, key), retried with backoff until done or failed
+    __table_args__ = (
+        UniqueConstraint("kind", "key", name="uq_workitem_kind_key"),
+        Index("ix_workitem_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str
+    key: str
+    status: WorkStatus = Field(default=WorkStatus.PENDING)
+    attempts: int = 0
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class JobRun(SQLModel, table=True):
+    # One row per scheduled job run; only the newest JOB_RUNS_KEEP_PER_JOB are kept per job
+    __table_args__ = (
+        Index("ix_jobrun_job_id_started_at", "job_id", "started_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_id: str
+    status: JobRunStatus
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+    items_scanned: int = 0
+    upstream_calls: int = 0
+    matches: int = 0
+    errors: int = 0
+    error: Optional[str] = None
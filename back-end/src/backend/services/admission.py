@@ -0,0 +1,147 @@
+import asyncio
+import math
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict
+
+from backend.services.rate_limit import TokenBucket
+from backend.settings import get_settings
+
+settings = get_settings()
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a user is over their share of an expensive endpoint; answered with 429.
+    """
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class AdmissionControl:
+    """
+    Per-user admission to the expensive endpoints (TMDB/Emby fan-out).
+
+    Each user (JWT subject) has a token bucket of `rate` requests per second with
+    bursts of `burst`; beyond that requests are rejected with a Retry-After. Admitted
+    requests then share `max_concurrent` slots. When all slots are busy they wait
+    in per-user queues that are served round-robin, so a user with many requests
+    in flight cannot starve the others. A user may have `max_queued_per_user`
+    requests waiting, each for at most `max_wait` seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 20,
+        max_concurrent: int = 8,
+        max_queued_per_user: int = 4,
+        max_wait: float = 5.0,
+        enabled: bool = True,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.max_queued_per_user = max_queued_per_user
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self.active = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        # user -> waiters, in the round-robin order users are served in
+        self._waiting: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self.admitted: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self.queued_total = 0
+
+    def _bucket(self, user_id: str) -> TokenBucket:
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            bucket = self._buckets[user_id] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def _reject(self, route: str, reason: str, retry_after: float) -> AdmissionRejected:
+        self.rejected[route] = self.rejected.get(route, 0) + 1
+        return AdmissionRejected(reason, retry_after)
+
+    async def acquire(self, user_id: str, route: str) -> None:
+        """
+        Take a slot for `user_id` (release it with `release`) or raise AdmissionRejected.
+        """
+        if not self.enabled:
+            return
+        bucket = self._bucket(user_id)
+        if not bucket.try_take():
+            raise self._reject(route, "Too many requests", bucket.time_until_token())
+
+        if self.active < self.max_concurrent and not self._waiting:
+            self.active += 1
+            self.admitted[route] = self.admitted.get(route, 0) + 1
+            return
+
+        waiters = self._waiting.setdefault(user_id, deque())
+        if len(waiters) >= self.max_queued_per_user:
+            raise self._reject(route, "Too many requests in progress", self.max_wait)
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        self.queued_total += 1
+        try:
+            # The slot is handed over by `release` already counted in `active`
+            await asyncio.wait_for(future, timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            self._discard(user_id, future)
+            raise self._reject(route, "Server busy", self.max_wait)
+        except asyncio.CancelledError:
+            self._discard(user_id, future)
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        self.admitted[route] = self.admitted.get(route, 0) + 1
+
+    def _discard(self, user_id: str, future: asyncio.Future) -> None:
+        waiters = self._waiting.get(user_id)
+        if waiters is not None and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._waiting[user_id]
+
+    def release(self) -> None:
+        """
+        Free a slot, handing it straight to the next waiting user in round-robin order.
+        """
+        if not self.enabled:
+            return
+        while self._waiting:
+            user_id, waiters = next(iter(self._waiting.items()))
+            future = waiters.popleft()
+            if waiters:
+                self._waiting.move_to_end(user_id)
+            else:
+                del self._waiting[user_id]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "active": self.active,
+            "max_concurrent": self.max_concurrent,
+            "queued": sum(len(waiters) for waiters in self._waiting.values()),
+            "queued_users": len(self._waiting),
+            "queued_total": self.queued_total,
+            "admitted": dict(self.admitted),
+            "rejected": dict(self.rejected),
+        }
+
+
+admission = AdmissionControl(
+    rate=settings.ADMISSION_RATE_PER_SECOND,
+    burst=settings.ADMISSION_BURST,
+    max_concurrent=settings.ADMISSION_MAX_CONCURRENT,
+    max_queued_per_user=settings.ADMISSION_MAX_QUEUED_PER_USER,
+    max_wait=settings.ADMISSION_MAX_WAIT_SECONDS,
+    enabled=settings.ADMISSION_ENABLED,
+)
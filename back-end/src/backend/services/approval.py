@@ -1,15 +1,18 @@
+import logging
+from sqlmodel import Session
+from backend.jobs.dispatch_downloads import enqueue_dispatch
 from backend.models import SubscriptionRequest
 
+logger = logging.getLogger(__name__)
+
 class ApprovalService:
-    def notify_downloader(self, request: SubscriptionRequest):
+    def notify_downloader(self, session: Session, request: SubscriptionRequest):
         """
-        Hook to notify downloader (e.g. MoviePilot).
-        Currently this is a placeholder for manual processing.
+        Hand the request to the downloader (e.g. MoviePilot, see DOWNLOADER_URL).
+        Only queued here, in the caller's transaction: delivery, batching and retries
+        happen in the work queue, so the approve click never waits on the downloader.
         """
-        # TODO: Implement MoviePilot integration here in future.
-        print(f"Request {request.id} approved. Ready for download/manual processing. Title: {request.title}")
-        pass
+        enqueue_dispatch(session, request)
+        logger.info("Request %s approved and queued for the downloader. Title: %s", request.id, request.title)
 
 approval_service = ApprovalService()
-
-
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from backend.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# (body, stored_at as unix time)
+CacheEntry = Tuple[bytes, float]
+
+
+def make_key(url: str, params: Optional[Dict[str, Any]] = None, exclude: Tuple[str, ...] = ("api_key",)) -> str:
+    """
+    Stable cache key for an upstream GET. Credentials are left out of the key.
+    """
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k not in exclude)
+    return url + "?" + "&".join(f"{k}={v}" for k, v in items)
+
+
+class CacheBackend(ABC):
+    """
+    Byte-oriented key/value store behind the response caches.
+    Implementations must be safe to share between coroutines of one process.
+    """
+
+    # Backends that do blocking I/O are called from worker threads by ResponseCache.aget / set_behind
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, body: bytes, stored_at: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, CacheEntry]]:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Per-process LRU. Fastest, but every uvicorn worker keeps its own copy.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, body: bytes, stored_at: Optional[float] = None) -> None:
+        self._entries[key] = (body, stored_at if stored_at is not None else time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def items(self) -> Iterator[Tuple[str, CacheEntry]]:
+        return iter(list(self._entries.items()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache shared by all worker processes on one host, stored in a local SQLite file (WAL mode).
+
+    Entries are evicted oldest-first once the namespace grows past `max_entries`;
+    the size check runs every `prune_every` writes to keep writes cheap.
+    Connections are per thread, so the backend can be used from worker threads.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, namespace: str, max_entries: int, prune_every: int = 100):
+        self.path = path
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.prune_every = prune_every
+        self._writes = 0
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, body BLOB NOT NULL, stored_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_stored_at ON cache (namespace, stored_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self._conn().execute(
+            "SELECT body, stored_at FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+        ).fetchone()
+        return (bytes(row[0]), row[1]) if row else None
+
+    def set(self, key: str, body: bytes, stored_at: Optional[float] = None) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, body, stored_at) VALUES (?, ?, ?, ?)",
+            (self.namespace, key, body, stored_at if stored_at is not None else time.time()),
+        )
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self._prune()
+
+    def _prune(self) -> None:
+        self._conn().execute(
+            "DELETE FROM cache WHERE namespace = ? AND key IN ("
+            " SELECT key FROM cache WHERE namespace = ? ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_entries),
+        )
+
+    def delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+
+    def items(self) -> Iterator[Tuple[str, CacheEntry]]:
+        rows = self._conn().execute(
+            "SELECT key, body, stored_at FROM cache WHERE namespace = ?", (self.namespace,)
+        ).fetchall()
+        return iter([(row[0], (bytes(row[1]), row[2])) for row in rows])
+
+    def __len__(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+
+def get_cache_backend(namespace: str, max_entries: int) -> CacheBackend:
+    """
+    Build the backend selected by CACHE_BACKEND ("memory" or "sqlite").
+    """
+    if settings.CACHE_BACKEND == "sqlite":
+        return SQLiteCacheBackend(settings.CACHE_PATH, namespace, max_entries)
+    if settings.CACHE_BACKEND != "memory":
+        raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
+    return MemoryCacheBackend(max_entries)
+
+
+class ResponseCache:
+    """
+    Upstream response bodies keyed by URL, on top of a CacheBackend.
+
+    Bodies are kept as bytes and decoded on every read, so callers can mutate
+    what they get back without corrupting the cached copy.
+    """
+
+    def __init__(self, namespace: str = "default", max_entries: int = 2000, backend: Optional[CacheBackend] = None):
+        self.namespace = namespace
+        self.backend = backend if backend is not None else get_cache_backend(namespace, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._pending: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Return the decoded body for `key`, or None when missing or older than `max_age` seconds.
+        """
+        entry = self.backend.get(key)
+        if entry is None or (max_age is not None and time.time() - entry[1] > max_age):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(entry[0])
+
+    def set(self, key: str, body: bytes) -> None:
+        self.backend.set(key, body)
+
+    async def aget(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        `get` for coroutines: a blocking backend is read in a worker thread, off the event loop.
+        """
+        if not self.backend.blocking:
+            return self.get(key, max_age)
+        return await asyncio.to_thread(self.get, key, max_age)
+
+    def set_behind(self, key: str, body: bytes) -> None:
+        """
+        `set` for coroutines: a blocking backend is written behind, in a worker thread.
+        A write that fails (e.g. the file stays locked by another worker) is logged and dropped.
+        """
+        if not self.backend.blocking:
+            self.set(key, body)
+            return
+        task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._set_quietly, key, body))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _set_quietly(self, key: str, body: bytes) -> None:
+        try:
+            self.set(key, body)
+        except sqlite3.Error as e:
+            logger.warning("Cache write to %s failed: %s", self.namespace, e)
+
+    async def drain(self) -> None:
+        """
+        Wait for the pending write-behind tasks.
+        """
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,215 @@
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from backend.services.cache import ResponseCache
+from backend.settings import get_settings
+
+settings = get_settings()
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an upstream whose circuit is open and nothing stale is cached.
+    """
+    def __init__(self, name: str):
+        super().__init__(f"{name} is unavailable (circuit open)")
+        self.name = name
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_upstream_failure(exc: Exception) -> bool:
+    """
+    Timeouts, connection errors, 5xx and exhausted 429s count against the circuit.
+    Other 4xx (e.g. unknown TMDB id) are the caller's problem, not an outage.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker for one upstream, with a last-known-good fallback.
+
+    CLOSED: calls go through; outcomes over the last `window_seconds` are tracked.
+    OPEN: once at least `min_calls` were seen and the error rate reaches
+    `error_rate`, calls fail fast for `open_seconds`, answered from the
+    last good response for the same key when there is one.
+    HALF_OPEN: after the cooldown a single probe is let through; success closes
+    the circuit, failure re-opens it. Only the probe moves the circuit out of
+    HALF_OPEN: calls admitted before it opened may still finish meanwhile, and
+    their outcomes are dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        error_rate: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 30.0,
+        open_seconds: float = 30.0,
+        stale_entries: int = 2000,
+    ):
+        self.name = name
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.last_good = ResponseCache(namespace=name, max_entries=stale_entries)
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self.short_circuited = 0
+        self.stale_served = 0
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def allow_request(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._outcomes.clear()
+
+    def record_success(self, probe: bool = False) -> None:
+        if probe:
+            self.state = CircuitState.CLOSED
+            self._probe_in_flight = False
+            self._outcomes.clear()
+            return
+        if self.state != CircuitState.CLOSED:
+            # Admitted before the circuit opened; says nothing about the upstream now
+            return
+        now = time.monotonic()
+        self._outcomes.append((now, True))
+        self._trim(now)
+
+    def record_failure(self, probe: bool = False) -> None:
+        if probe:
+            self._open()
+            return
+        if self.state != CircuitState.CLOSED:
+            return
+        now = time.monotonic()
+        self._outcomes.append((now, False))
+        self._trim(now)
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.error_rate:
+            self._open()
+
+    async def _stale(self, key: Optional[str]) -> Optional[Any]:
+        if key is None:
+            return None
+        stale = await self.last_good.aget(key)
+        if stale is not None:
+            self.stale_served += 1
+        return stale
+
+    async def call(
+        self,
+        fetch: Callable[[], Awaitable[httpx.Response]],
+        key: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ) -> Any:
+        """
+        Run `fetch` under the breaker and return the decoded JSON body.
+        Good bodies are remembered under `key` and served when the upstream is down;
+        with `max_age` a body younger than that is returned without calling upstream at all.
+        """
+        if key is not None and max_age:
+            fresh = await self.last_good.aget(key, max_age=max_age)
+            if fresh is not None:
+                return fresh
+
+        if not self.allow_request():
+            self.short_circuited += 1
+            stale = await self._stale(key)
+            if stale is not None:
+                return stale
+            raise CircuitOpenError(self.name)
+        # Admitted while half-open means this call is the single probe
+        is_probe = self.state == CircuitState.HALF_OPEN
+
+        try:
+            response = await fetch()
+            response.raise_for_status()
+        except Exception as exc:
+            if not is_upstream_failure(exc):
+                if is_probe:
+                    # The upstream answered, so it is reachable again
+                    self.record_success(probe=True)
+                raise
+            self.record_failure(probe=is_probe)
+            stale = await self._stale(key)
+            if stale is not None:
+                return stale
+            raise
+        finally:
+            if is_probe:
+                # A cancelled probe must not leave the circuit stuck half-open
+                self._probe_in_flight = False
+
+        self.record_success(probe=is_probe)
+        if key is not None:
+            self.last_good.set_behind(key, response.content)
+        return response.json()
+
+    def metrics(self) -> Dict[str, Any]:
+        self._trim(time.monotonic())
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "window_calls": len(self._outcomes),
+            "window_failures": failures,
+            "short_circuited": self.short_circuited,
+            "stale_served": self.stale_served,
+            "last_good": self.last_good.metrics(),
+        }
+
+
+# Every breaker reported by circuit_breaker_metrics
+circuit_breakers: List[CircuitBreaker] = []
+
+
+def build_breaker(name: str) -> CircuitBreaker:
+    breaker = CircuitBreaker(
+        name,
+        error_rate=settings.CIRCUIT_BREAKER_ERROR_RATE,
+        min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+        window_seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+        open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+        stale_entries=settings.STALE_CACHE_MAX_ENTRIES,
+    )
+    circuit_breakers.append(breaker)
+    return breaker
+
+
+tmdb_breaker = build_breaker("tmdb")
+emby_breaker = build_breaker("emby")
+
+
+def circuit_breaker_metrics():
+    return [breaker.metrics() for breaker in circuit_breakers]
@@ -0,0 +1,103 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from backend.models import SubscriptionRequest
+from backend.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class DownloaderAdapter(ABC):
+    """
+    Hands approved requests to a downloader (e.g. MoviePilot).
+
+    `submit` gets at most `max_batch_size` requests and raises when the batch was
+    not accepted; the whole batch is then retried later, so downloaders should
+    treat the request id as an idempotency key.
+    """
+
+    name: str = "downloader"
+    max_batch_size: int = 1
+
+    @abstractmethod
+    async def submit(self, requests: List[SubscriptionRequest]) -> None:
+        ...
+
+    async def aclose(self) -> None:
+        pass
+
+
+def request_payload(request: SubscriptionRequest) -> Dict[str, Any]:
+    return {
+        "id": request.id,
+        "tmdb_id": request.tmdb_id,
+        "imdb_id": request.imdb_id,
+        "tvdb_id": request.tvdb_id,
+        "media_type": "tv" if request.media_type == "series" else request.media_type,
+        "title": request.title,
+        "year": (request.release_date or "")[:4] or None,
+        "season": request.specific_season,
+    }
+
+
+class ManualDownloaderAdapter(DownloaderAdapter):
+    """
+    No downloader configured: approved requests are logged for manual processing.
+    """
+
+    name = "manual"
+    max_batch_size = 100
+
+    async def submit(self, requests: List[SubscriptionRequest]) -> None:
+        for request in requests:
+            logger.info("Request %s approved. Ready for download/manual processing. Title: %s", request.id, request.title)
+
+
+class HttpDownloaderAdapter(DownloaderAdapter):
+    """
+    POSTs {"requests": [...]} as JSON to a webhook; any 2xx accepts the batch.
+    """
+
+    name = "http"
+
+    def __init__(self, url: str, token: Optional[str] = None, timeout: float = 10.0, max_batch_size: int = 20):
+        self.url = url
+        self.token = token
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+            self._client = httpx.AsyncClient(trust_env=False, timeout=self.timeout, headers=headers)
+        return self._client
+
+    async def submit(self, requests: List[SubscriptionRequest]) -> None:
+        response = await self._get_client().post(
+            self.url, json={"requests": [request_payload(request) for request in requests]}
+        )
+        response.raise_for_status()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def build_downloader() -> DownloaderAdapter:
+    if settings.DOWNLOADER_URL:
+        return HttpDownloaderAdapter(
+            settings.DOWNLOADER_URL,
+            token=settings.DOWNLOADER_TOKEN,
+            timeout=settings.DOWNLOADER_TIMEOUT_SECONDS,
+            max_batch_size=settings.DOWNLOADER_BATCH_SIZE,
+        )
+    return ManualDownloaderAdapter()
+
+
+downloader = build_downloader()
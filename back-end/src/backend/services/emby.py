@@ -1,14 +1,38 @@
+import asyncio
 import httpx
+import logging
 from typing import Optional, Dict, Any, List
-from backend.settings import get_settings
+from backend.settings import EmbyServerConfig, get_settings
 from backend.models import UserRole
+from backend.services.rate_limit import RateLimiter, emby_rate_limiter, rate_limiters
+from backend.services.circuit_breaker import CircuitBreaker, build_breaker, emby_breaker
+from backend.services.cache import make_key
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 class EmbyClient:
-    def __init__(self):
-        self.base_url = settings.EMBY_SERVER_URL
-        self.api_key = settings.EMBY_API_KEY
+    """
+    Client for one Emby server, with its own connection pool, rate limiter and circuit breaker.
+    """
+    def __init__(
+        self,
+        name: str = "default",
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        user_id: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.base_url = (base_url or settings.EMBY_SERVER_URL).rstrip("/")
+        self.api_key = api_key if api_key is not None else settings.EMBY_API_KEY
+        self.user_id = user_id if user_id is not None else settings.EMBY_USER_ID
+        self.rate_limiter = rate_limiter or emby_rate_limiter
+        self.breaker = breaker or emby_breaker
+        self.timeout = timeout if timeout is not None else settings.EMBY_SERVER_TIMEOUT_SECONDS
+        self._client: Optional[httpx.AsyncClient] = None
         self.headers = {
             "X-Emby-Token": self.api_key,
             "Content-Type": "application/json",
@@ -21,9 +45,32 @@ class EmbyClient:
         
     def _get_client(self) -> httpx.AsyncClient:
         """
-        Return an AsyncClient that ignores proxy settings (trust_env=False).
+        Return this server's pooled AsyncClient, which ignores proxy settings (trust_env=False).
         """
-        return httpx.AsyncClient(trust_env=False)
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                trust_env=False,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=settings.EMBY_MAX_CONNECTIONS),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Any = httpx.USE_CLIENT_DEFAULT) -> Any:
+        """
+        GET an Emby endpoint through the circuit breaker and the shared rate limiter.
+        A timeout counts as a failure like any other transport error, and while Emby
+        is slow or down the last good response for the same URL is returned.
+        """
+        async def fetch() -> httpx.Response:
+            client = self._get_client()
+            return await self.rate_limiter.send(client.get, url, headers=self.headers, params=params, timeout=timeout)
+
+        return await self.breaker.call(fetch, make_key(url, params))
 
     async def authenticate(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -39,24 +86,22 @@ class EmbyClient:
              "X-Emby-Client-Version": "1.0.0",
         }
         
-        async with self._get_client() as client:
-            response = await client.post(
-                url, 
-                json={"Username": username, "Pw": password},
-                headers=auth_headers
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        response = await self.rate_limiter.send(
+            client.post,
+            url,
+            json={"Username": username, "Pw": password},
+            headers=auth_headers
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def get_user(self, user_id: str) -> Dict[str, Any]:
         """
         Get user details including policy (admin status).
         """
         url = f"{self.base_url}/Users/{user_id}"
-        async with self._get_client() as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url)
 
     async def get_latest_items(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -71,10 +116,22 @@ class EmbyClient:
             "Limit": limit,
             "Fields": "ProviderIds,Overview,DateCreated,CommunityRating",
         }
-        async with self._get_client() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get("Items", [])
+        data = await self._get(url, params)
+        return data.get("Items", [])
+
+    async def get_library_items(self) -> List[Dict[str, Any]]:
+        """
+        Get every movie and series in the library with the fields needed for title search.
+        """
+        url = f"{self.base_url}/Items"
+        params = {
+            "IncludeItemTypes": "Movie,Series",
+            "Recursive": "true",
+            "Fields": "ProviderIds,OriginalTitle,SortName,ProductionYear,PremiereDate",
+        }
+        # Full library scan: not bound by the per-lookup timeout
+        data = await self._get(url, params, timeout=settings.EMBY_BULK_TIMEOUT_SECONDS)
+        return data.get("Items", [])
 
     async def search_by_provider_id(self, provider: str, provider_id: str) -> List[Dict[str, Any]]:
         """
@@ -87,33 +144,78 @@ class EmbyClient:
             "AnyProviderIdEquals": f"{provider}.{provider_id}",
             "Fields": "ProviderIds",
         }
-        async with self._get_client() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get("Items", [])
+        data = await self._get(url, params)
+        return data.get("Items", [])
+
+    async def search_by_any_provider_id(
+        self, provider_ids: Dict[str, Optional[str]], item_types: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Items matching any of the given ids, e.g. {"Tmdb": "123", "Imdb": "tt0123", "Tvdb": None}.
+        Missing ids are skipped; one query covers all providers. Episodes carry the
+        Tvdb/Imdb ids of their series too, so pass `item_types` ("Movie" or "Series")
+        to match only the title itself.
+        """
+        url = f"{self.base_url}/Items"
+        params = {
+            "Recursive": "true",
+            "AnyProviderIdEquals": ",".join(f"{p}.{i}" for p, i in provider_ids.items() if i),
+            "Fields": "ProviderIds",
+        }
+        if item_types:
+            params["IncludeItemTypes"] = item_types
+        data = await self._get(url, params)
+        return data.get("Items", [])
+
+    async def search_by_provider_ids(
+        self, provider: str, provider_ids: List[str], chunk_size: int = 50
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Batched search_by_provider_id: one Items query per `chunk_size` ids.
+        Returns provider id -> matching items (ids without a match are absent).
+        """
+        url = f"{self.base_url}/Items"
+        unique_ids = list(dict.fromkeys(str(i) for i in provider_ids))
+        chunks = [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+
+        async def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            params = {
+                "Recursive": "true",
+                "AnyProviderIdEquals": ",".join(f"{provider}.{i}" for i in chunk),
+                "Fields": "ProviderIds",
+            }
+            data = await self._get(url, params)
+            return data.get("Items", [])
+
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        for items in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            for item in items:
+                # Provider keys are not consistently cased across Emby versions
+                ids = {k.lower(): str(v) for k, v in (item.get("ProviderIds") or {}).items()}
+                value = ids.get(provider.lower())
+                if value is not None:
+                    found.setdefault(value, []).append(item)
+        return found
 
     async def get_item_details(self, item_id: str) -> Dict[str, Any]:
         """
         Fetch detailed metadata for a specific Emby item, including media streams.
         """
-        if settings.EMBY_USER_ID:
-            url = f"{self.base_url}/Users/{settings.EMBY_USER_ID}/Items/{item_id}"
+        if self.user_id:
+            url = f"{self.base_url}/Users/{self.user_id}/Items/{item_id}"
         else:
             url = f"{self.base_url}/Items/{item_id}"
         params = {
             "Fields": "MediaStreams,Path,Size,Bitrate,Width,Height,Container,Overview",
         }
-        async with self._get_client() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, params)
 
     async def get_episodes(self, series_id: str, season_number: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get episodes for a specific series. If season_number is provided, filter by it.
         """
-        if settings.EMBY_USER_ID:
-            url = f"{self.base_url}/Users/{settings.EMBY_USER_ID}/Items"
+        if self.user_id:
+            url = f"{self.base_url}/Users/{self.user_id}/Items"
         else:
             url = f"{self.base_url}/Items"
             
@@ -126,9 +228,200 @@ class EmbyClient:
         if season_number is not None:
             params["ParentIndexNumber"] = season_number
             
-        async with self._get_client() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get("Items", [])
+        # Completion checks need the whole list, so this is not bound by the per-lookup timeout
+        data = await self._get(url, params, timeout=settings.EMBY_BULK_TIMEOUT_SECONDS)
+        return data.get("Items", [])
+
+def count_episodes_by_season(emby_episodes: List[Dict[str, Any]]) -> Dict[int, int]:
+    """
+    Episodes per season (ParentIndexNumber). Several versions of the same episode count once.
+    """
+    numbers: Dict[int, set] = {}
+    unnumbered: Dict[int, int] = {}
+    for ep in emby_episodes:
+        season_num = ep.get("ParentIndexNumber")
+        if season_num is None:
+            continue
+        if ep.get("IndexNumber") is None:
+            unnumbered[season_num] = unnumbered.get(season_num, 0) + 1
+        else:
+            numbers.setdefault(season_num, set()).add(ep["IndexNumber"])
+    seasons = set(numbers) | set(unnumbered)
+    return {s: len(numbers.get(s, ())) + unnumbered.get(s, 0) for s in seasons}
+
+def provider_id_key(item: Dict[str, Any]) -> Optional[str]:
+    # Same title on two servers: identify it by its Tmdb (or Imdb) id
+    ids = {k.lower(): str(v) for k, v in (item.get("ProviderIds") or {}).items()}
+    key = ids.get("tmdb") or ids.get("imdb")
+    return f"{item.get('Type')}:{key}" if key else None
+
+class EmbyServers:
+    """
+    All configured Emby servers (e.g. a 4K and a standard library) behind the EmbyClient API.
+
+    Library lookups fan out to every server concurrently and the answers are merged;
+    a slow or failing server only drops its own part of the answer. Slowness is
+    bounded by each server's own request timeout, inside its circuit breaker, so a
+    timed out lookup is recorded as a failure and served from the last good
+    response. Items are tagged with the name of their server ("Server"), which
+    item-level calls (details, episodes, images) use to reach the right one.
+    Login and user lookups go to the first (primary) server.
+    """
+
+    def __init__(self, servers: List[EmbyClient]):
+        self.servers = servers
+        self.by_name = {server.name: server for server in servers}
+
+    @property
+    def primary(self) -> EmbyClient:
+        return self.servers[0]
+
+    def server(self, name: Optional[str] = None) -> EmbyClient:
+        if name is None:
+            return self.primary
+        if name not in self.by_name:
+            raise KeyError(f"Unknown Emby server: {name}")
+        return self.by_name[name]
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(server.aclose() for server in self.servers))
+
+    async def _fan_out(self, call) -> List[Any]:
+        """
+        Run `call(server)` on every server; returns [(server, result)] for those that answered.
+        Raises the first error only when no server answered, so a single server behaves as before.
+        """
+        if len(self.servers) == 1:
+            return [(self.primary, await call(self.primary))]
+
+        outcomes = await asyncio.gather(*(call(server) for server in self.servers), return_exceptions=True)
+        answered = []
+        errors = []
+        for server, outcome in zip(self.servers, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                logger.warning("Emby server %s failed: %r", server.name, outcome)
+                errors.append(outcome)
+            else:
+                answered.append((server, outcome))
+        if not answered and errors:
+            raise errors[0]
+        return answered
+
+    @staticmethod
+    def _tag(server: EmbyClient, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for item in items:
+            item["Server"] = server.name
+        return items
+
+    async def _items(self, call) -> List[Dict[str, Any]]:
+        return [item for server, items in await self._fan_out(call) for item in self._tag(server, items)]
+
+    async def authenticate(self, username: str, password: str) -> Dict[str, Any]:
+        return await self.primary.authenticate(username, password)
+
+    async def get_user(self, user_id: str) -> Dict[str, Any]:
+        return await self.primary.get_user(user_id)
+
+    async def get_latest_items(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Most recently added across servers; a title on several servers is listed once.
+        """
+        items = await self._items(lambda server: server.get_latest_items(limit=limit))
+        items.sort(key=lambda item: item.get("DateCreated") or "", reverse=True)
+        merged, seen = [], set()
+        for item in items:
+            key = provider_id_key(item)
+            if key is not None and key in seen:
+                continue
+            seen.add(key)
+            merged.append(item)
+        return merged[:limit]
+
+    async def get_library_items(self) -> List[Dict[str, Any]]:
+        return await self._items(lambda server: server.get_library_items())
+
+    async def search_by_provider_id(self, provider: str, provider_id: str) -> List[Dict[str, Any]]:
+        return await self._items(lambda server: server.search_by_provider_id(provider, provider_id))
+
+    async def search_by_any_provider_id(
+        self, provider_ids: Dict[str, Optional[str]], item_types: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return await self._items(lambda server: server.search_by_any_provider_id(provider_ids, item_types))
+
+    async def search_by_provider_ids(
+        self, provider: str, provider_ids: List[str], chunk_size: int = 50
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        answered = await self._fan_out(lambda server: server.search_by_provider_ids(provider, provider_ids, chunk_size))
+        for server, by_id in answered:
+            for provider_id, items in by_id.items():
+                found.setdefault(provider_id, []).extend(self._tag(server, items))
+        return found
+
+    async def get_item_details(self, item_id: str, server: Optional[str] = None) -> Dict[str, Any]:
+        return await self.server(server).get_item_details(item_id)
+
+    async def get_episodes(
+        self, series_id: str, season_number: Optional[int] = None, server: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.server(server).get_episodes(series_id, season_number)
+
+    async def get_series_episodes(
+        self, series_items: List[Dict[str, Any]], season_number: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Episodes of a series from every server that has it; `series_items` come from a provider id lookup.
+        """
+        per_server: Dict[Optional[str], Dict[str, Any]] = {}
+        for item in series_items:
+            per_server.setdefault(item.get("Server"), item)
+
+        results = await asyncio.gather(
+            *(self.get_episodes(item.get("Id"), season_number, server=name) for name, item in per_server.items()),
+            return_exceptions=True,
+        )
+        episodes: List[Dict[str, Any]] = []
+        for name, result in zip(per_server, results):
+            if isinstance(result, asyncio.CancelledError) or (isinstance(result, BaseException) and len(per_server) == 1):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning("Emby server %s failed to list episodes: %r", name, result)
+                continue
+            episodes.extend(result)
+        return episodes
+
+def build_servers(configs: List[EmbyServerConfig]) -> List[EmbyClient]:
+    """
+    One EmbyClient per EMBY_SERVERS entry, or the EMBY_SERVER_URL server when none is configured.
+    The first server keeps the "emby" limiter and breaker; the others get their own.
+    """
+    if not configs:
+        return [EmbyClient()]
+    clients = []
+    for i, config in enumerate(configs):
+        if i == 0:
+            limiter, breaker = emby_rate_limiter, emby_breaker
+        else:
+            limiter = RateLimiter(
+                f"emby:{config.name}",
+                rate=settings.EMBY_RATE_LIMIT_PER_SECOND,
+                burst=settings.EMBY_RATE_LIMIT_BURST,
+                max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+                max_retry_after=settings.RATE_LIMIT_MAX_RETRY_AFTER,
+            )
+            rate_limiters.append(limiter)
+            breaker = build_breaker(f"emby:{config.name}")
+        clients.append(EmbyClient(
+            name=config.name,
+            base_url=config.url,
+            api_key=config.api_key,
+            user_id=config.user_id,
+            rate_limiter=limiter,
+            breaker=breaker,
+            timeout=settings.EMBY_SERVER_TIMEOUT_SECONDS,
+        ))
+    return clients
 
-emby_client = EmbyClient()
+emby_client = EmbyServers(build_servers(settings.EMBY_SERVERS))
@@ -0,0 +1,89 @@
+import asyncio
+import base64
+import heapq
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+# TMDB list endpoints return 20 results per page and refuse pages past 500
+UPSTREAM_PAGE_SIZE = 20
+UPSTREAM_MAX_PAGE = 500
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class PagedStream:
+    """
+    One paginated upstream listing (already sorted), read item by item.
+
+    Pages are requested only when the reader reaches them and kept for the
+    lifetime of the stream; `fetch_page` is expected to hit the response cache,
+    so re-reading the same listing across requests is cheap.
+    """
+
+    def __init__(self, fetch_page: Callable[[int], Awaitable[Dict[str, Any]]], media_type: str):
+        self.fetch_page = fetch_page
+        self.media_type = media_type
+        self.pages: Dict[int, List[Dict[str, Any]]] = {}
+        self.total_pages: Optional[int] = None
+
+    async def item(self, offset: int) -> Optional[Dict[str, Any]]:
+        page = offset // UPSTREAM_PAGE_SIZE + 1
+        if self.total_pages is not None and page > self.total_pages:
+            return None
+        if page not in self.pages:
+            data = await self.fetch_page(page)
+            self.pages[page] = data.get("results", [])
+            self.total_pages = min(data.get("total_pages") or page, UPSTREAM_MAX_PAGE)
+        results = self.pages[page]
+        index = offset % UPSTREAM_PAGE_SIZE
+        return results[index] if index < len(results) else None
+
+
+async def merge_by_popularity(
+    streams: Sequence[PagedStream],
+    offsets: Sequence[int],
+    count: int,
+) -> Tuple[List[Dict[str, Any]], List[int], bool]:
+    """
+    k-way merge of popularity-sorted streams, starting at `offsets`.
+    Returns up to `count` items, the offsets to resume from, and whether every stream is exhausted.
+    """
+    offsets = list(offsets)
+    heap: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    async def push(i: int) -> None:
+        head = await streams[i].item(offsets[i])
+        if head is not None:
+            heapq.heappush(heap, (-(head.get("popularity") or 0), i, head))
+
+    await asyncio.gather(*(push(i) for i in range(len(streams))))
+
+    items: List[Dict[str, Any]] = []
+    while heap and len(items) < count:
+        _, i, head = heapq.heappop(heap)
+        items.append({**head, "media_type": streams[i].media_type})
+        offsets[i] += 1
+        await push(i)
+    return items, offsets, not heap
+
+
+def encode_cursor(offsets: Sequence[int]) -> str:
+    raw = json.dumps({"o": list(offsets)}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, streams: int) -> List[int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        offsets = json.loads(raw)["o"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if (
+        not isinstance(offsets, list)
+        or len(offsets) != streams
+        or not all(isinstance(o, int) and 0 <= o < UPSTREAM_MAX_PAGE * UPSTREAM_PAGE_SIZE for o in offsets)
+    ):
+        raise InvalidCursorError("Invalid cursor")
+    return offsets
@@ -0,0 +1,132 @@
+import logging
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete
+from sqlmodel import Session, col, select
+
+from backend.db import engine
+from backend.models import JobRun, JobRunStatus
+from backend.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("items_scanned", "upstream_calls", "matches", "errors")
+
+# Counters of the job run the current task belongs to (tasks spawned by the job share them)
+_current_run: ContextVar[Optional[Dict[str, int]]] = ContextVar("job_run", default=None)
+
+
+def count(counter: str, n: int = 1) -> None:
+    """
+    Add `n` to a counter of the running job; a no-op outside scheduled jobs (e.g. in requests).
+    """
+    counters = _current_run.get()
+    if counters is not None:
+        counters[counter] += n
+
+
+class JobLedger:
+    """
+    Records every run of the scheduled jobs in the JobRun table.
+
+    Each job keeps its newest `keep_per_job` rows, so the table stays bounded
+    without a separate cleanup job. Recording never fails the job itself.
+    """
+
+    def __init__(self, keep_per_job: int = 200):
+        self.keep_per_job = keep_per_job
+
+    def record(self, run: JobRun) -> None:
+        try:
+            with Session(engine) as session:
+                session.add(run)
+                session.flush()
+                keep = select(JobRun.id).where(JobRun.job_id == run.job_id).order_by(col(JobRun.id).desc()).limit(self.keep_per_job)
+                session.execute(
+                    delete(JobRun).where(JobRun.job_id == run.job_id, col(JobRun.id).not_in(keep))
+                )
+                session.commit()
+        except Exception as e:
+            logger.warning("Could not record run of %s: %s", run.job_id, e)
+
+    def instrument(self, job_id: str):
+        """
+        Decorator timing every run of a job and recording it with its counters and outcome.
+        """
+        def decorator(job):
+            @wraps(job)
+            async def wrapper(*args, **kwargs):
+                counters = dict.fromkeys(COUNTERS, 0)
+                token = _current_run.set(counters)
+                started_at = datetime.utcnow()
+                started = time.perf_counter()
+                status, error = JobRunStatus.OK, None
+                try:
+                    return await job(*args, **kwargs)
+                except Exception as e:
+                    status, error = JobRunStatus.ERROR, repr(e)[:500]
+                    raise
+                finally:
+                    _current_run.reset(token)
+                    self.record(JobRun(
+                        job_id=job_id,
+                        status=status,
+                        started_at=started_at,
+                        finished_at=datetime.utcnow(),
+                        duration_ms=round((time.perf_counter() - started) * 1000, 2),
+                        error=error,
+                        **counters,
+                    ))
+            return wrapper
+        return decorator
+
+    def record_skipped(self, job_id: str) -> None:
+        """
+        A run was due while the previous one was still going (APScheduler max_instances).
+        """
+        logger.warning("Skipped a run of %s: the previous run is still in progress", job_id)
+        self.record(JobRun(job_id=job_id, status=JobRunStatus.SKIPPED, finished_at=datetime.utcnow()))
+
+    def summary(self, session: Session, recent: int = 20) -> List[Dict[str, Any]]:
+        """
+        Per job: the `recent` newest runs and duration percentiles over all kept runs.
+        """
+        runs: Dict[str, List[JobRun]] = {}
+        for run in session.exec(select(JobRun).order_by(col(JobRun.id).desc())).all():
+            runs.setdefault(run.job_id, []).append(run)
+
+        jobs = []
+        for job_id, job_runs in sorted(runs.items()):
+            durations = sorted(r.duration_ms for r in job_runs if r.status != JobRunStatus.SKIPPED)
+            jobs.append({
+                "job_id": job_id,
+                "runs": len(job_runs),
+                "errors": sum(1 for r in job_runs if r.status == JobRunStatus.ERROR),
+                "skipped": sum(1 for r in job_runs if r.status == JobRunStatus.SKIPPED),
+                "duration_ms": {
+                    "p50": percentile(durations, 50),
+                    "p95": percentile(durations, 95),
+                    "p99": percentile(durations, 99),
+                    "max": durations[-1] if durations else None,
+                },
+                "recent": job_runs[:recent],
+            })
+        return jobs
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Nearest-rank percentile of sorted values.
+    """
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+job_ledger = JobLedger(keep_per_job=settings.JOB_RUNS_KEEP_PER_JOB)
@@ -0,0 +1,89 @@
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from backend.db import engine
+from backend.models import SchedulerLease
+from backend.settings import get_settings
+import logging
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """
+    Database lease so that only one process (uvicorn worker, container) runs the scheduled jobs.
+
+    Every process calls try_acquire() periodically. The holder renews its lease;
+    anybody else takes it over only once it has expired, i.e. the leader died
+    or stopped renewing for `lease_seconds`.
+    """
+
+    def __init__(self, name: str = "scheduler", lease_seconds: int = 60):
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lease_expires: Optional[datetime] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._lease_expires is not None and datetime.utcnow() < self._lease_expires
+
+    def try_acquire(self) -> bool:
+        """
+        Acquire or renew the lease. Returns True if this process is the leader afterwards.
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        try:
+            with Session(engine) as session:
+                # Atomic compare-and-set: renew our own lease or take over an expired one
+                result = session.exec(
+                    update(SchedulerLease)
+                    .where(SchedulerLease.name == self.name)
+                    .where(or_(SchedulerLease.holder == self.holder_id, SchedulerLease.expires_at < now))
+                    .values(holder=self.holder_id, expires_at=expires_at)
+                )
+                if result.rowcount == 0:
+                    if session.get(SchedulerLease, self.name) is not None:
+                        session.rollback()
+                        self._lease_expires = None
+                        return False
+                    session.add(SchedulerLease(name=self.name, holder=self.holder_id, expires_at=expires_at))
+                session.commit()
+        except IntegrityError:
+            # Another process inserted the first lease at the same time
+            self._lease_expires = None
+            return False
+        except Exception as e:
+            logger.error(f"Leader election for {self.name} failed: {e}")
+            self._lease_expires = None
+            return False
+
+        if self._lease_expires is None:
+            logger.info(f"{self.holder_id} became leader for {self.name}")
+        self._lease_expires = expires_at
+        return True
+
+    def release(self) -> None:
+        if self._lease_expires is None:
+            return
+        try:
+            with Session(engine) as session:
+                lease = session.get(SchedulerLease, self.name)
+                if lease is not None and lease.holder == self.holder_id:
+                    session.delete(lease)
+                    session.commit()
+        except Exception as e:
+            logger.error(f"Releasing leadership for {self.name} failed: {e}")
+        self._lease_expires = None
+
+
+leader_election = LeaderElection(lease_seconds=settings.LEADER_LEASE_SECONDS)
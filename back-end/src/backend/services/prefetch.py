@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Set
+
+from backend.services.rate_limit import TokenBucket, background_priority
+from backend.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    """
+    Best-effort warming of the upstream caches for what a user is likely to open next.
+
+    Work runs as detached tasks in the background rate-limit lane, at most
+    `concurrency` at a time and at most `rate` starts per second. Nothing waits
+    on a prefetch: work beyond the budget is dropped, not queued, and a key
+    already in flight is not fetched twice. Results are discarded; the point is
+    that the fetch fills the response cache the next request reads from.
+    """
+
+    def __init__(self, enabled: bool, concurrency: int = 2, rate: float = 2.0, max_pending: int = 20):
+        self.enabled = enabled
+        self.max_pending = max_pending
+        self.budget = TokenBucket(rate=rate, capacity=max(rate, 1.0))
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._pending: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.scheduled = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def schedule(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Start `fetch` in the background unless disabled, already pending or over budget.
+        """
+        if not self.enabled or key in self._pending:
+            return False
+        if len(self._pending) >= self.max_pending or not self.budget.try_take():
+            self.dropped += 1
+            return False
+
+        self._pending.add(key)
+        self.scheduled += 1
+        task = asyncio.create_task(self._run(key, fetch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            with background_priority():
+                async with self._semaphore:
+                    await fetch()
+        except Exception as e:
+            self.failed += 1
+            logger.debug("Prefetch %s failed: %s", key, e)
+        finally:
+            self._pending.discard(key)
+
+    def schedule_details(self, items: Iterable[Dict[str, Any]], fetch_details: Callable[[str, str], Awaitable[Any]]) -> None:
+        """
+        Prefetch details of the first PREFETCH_DETAILS_COUNT movie/tv items of a listing.
+        """
+        count = 0
+        for item in items:
+            if count >= settings.PREFETCH_DETAILS_COUNT:
+                break
+            media_type = item.get("media_type")
+            if media_type not in ("movie", "tv") or item.get("id") is None:
+                continue
+            tmdb_id = str(item["id"])
+            self.schedule(("details", media_type, tmdb_id), lambda m=media_type, i=tmdb_id: fetch_details(m, i))
+            count += 1
+
+    async def drain(self) -> None:
+        """
+        Wait for running prefetches (used by tests and shutdown).
+        """
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "pending": len(self._pending),
+            "scheduled": self.scheduled,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+prefetcher = Prefetcher(
+    enabled=settings.PREFETCH_ENABLED,
+    concurrency=settings.PREFETCH_CONCURRENCY,
+    rate=settings.PREFETCH_RATE_PER_SECOND,
+    max_pending=settings.PREFETCH_MAX_PENDING,
+)
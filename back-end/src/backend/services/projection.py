@@ -0,0 +1,136 @@
+from typing import Any, Dict, List, Optional, Union
+
+# A spec maps field name -> True (keep as is), a nested spec (for dicts) or Each (for lists of dicts).
+Spec = Dict[str, Union[bool, "Each", Dict[str, Any]]]
+
+
+class Each:
+    """
+    Project every element of a list with `spec`, keeping at most `limit` elements.
+    """
+    def __init__(self, spec: Spec, limit: Optional[int] = None):
+        self.spec = spec
+        self.limit = limit
+
+
+def fields(*names: str) -> Spec:
+    return {name: True for name in names}
+
+
+CARD: Spec = fields(
+    "id", "media_type", "title", "name", "original_title", "original_name",
+    "overview", "poster_path", "backdrop_path", "release_date", "first_air_date",
+    "vote_average", "popularity",
+)
+
+DETAIL: Spec = {
+    **fields(
+        "id", "media_type", "title", "name", "original_title", "original_name",
+        "original_language", "tagline", "overview", "poster_path", "backdrop_path",
+        "release_date", "first_air_date", "vote_average", "popularity", "status", "genres",
+        "runtime", "episode_run_time", "number_of_seasons", "number_of_episodes",
+    ),
+    "external_ids": fields("imdb_id", "tvdb_id"),
+    "seasons": Each(fields("id", "name", "season_number", "episode_count", "air_date", "poster_path")),
+    "credits": {
+        # Cast is billed in order; the page shows the top of the list and six crew members
+        "cast": Each(fields("id", "name", "character", "profile_path"), limit=40),
+        "crew": Each(fields("id", "name", "job", "department"), limit=6),
+    },
+}
+
+PERSON: Spec = {
+    **fields(
+        "id", "name", "biography", "birthday", "deathday", "place_of_birth",
+        "known_for_department", "gender", "profile_path",
+    ),
+    "external_ids": fields("imdb_id"),
+    "combined_credits": {
+        "cast": Each({**CARD, **fields("character")}),
+        "crew": Each({**CARD, **fields("job")}),
+    },
+}
+
+SEASON: Spec = {
+    **fields("id", "name", "season_number", "air_date", "overview", "poster_path"),
+    "episodes": Each(fields(
+        "id", "name", "overview", "episode_number", "season_number", "air_date", "still_path",
+    )),
+}
+
+PROFILES: Dict[str, Spec] = {
+    "card": CARD,
+    "detail": DETAIL,
+    "person": PERSON,
+    "season": SEASON,
+}
+
+# Query pattern for the `profile` parameter; "full" disables projection
+PROFILE_PATTERN = "^(card|detail|person|season|full)$"
+
+
+def parse_fields(value: str) -> Spec:
+    """
+    Build a spec from a `fields=` parameter, e.g. "id,title,credits.cast".
+    Lists are projected element-wise, so "credits.cast.name" keeps only cast names.
+    id and media_type are always kept since status enrichment relies on them.
+    """
+    spec: Dict[str, Any] = {"id": True, "media_type": True}
+    for path in value.split(","):
+        parts = [p for p in path.strip().split(".") if p]
+        if not parts:
+            continue
+        node = spec
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {}
+                node[part] = child
+            node = child
+        node.setdefault(parts[-1], True)
+    return spec
+
+
+def resolve_spec(default: str, profile: Optional[str] = None, fields: Optional[str] = None) -> Optional[Spec]:
+    """
+    `fields` wins over `profile`, which wins over the endpoint default. None means no projection.
+    """
+    if fields:
+        return parse_fields(fields)
+    name = profile or default
+    if name == "full":
+        return None
+    return PROFILES[name]
+
+
+def project(data: Any, spec: Optional[Spec]) -> Any:
+    """
+    Copy only the fields named by `spec` out of a TMDB payload.
+    """
+    if spec is None or not isinstance(data, dict):
+        return data
+    out = {}
+    for field, sub in spec.items():
+        if field not in data:
+            continue
+        value = data[field]
+        if sub is True:
+            out[field] = value
+        elif isinstance(sub, Each):
+            if isinstance(value, list):
+                items = value if sub.limit is None else value[: sub.limit]
+                out[field] = [project(item, sub.spec) for item in items]
+            else:
+                out[field] = value
+        elif isinstance(value, list):
+            # Nested spec from `fields=` applied to a list: project each element
+            out[field] = [project(item, sub) for item in value]
+        else:
+            out[field] = project(value, sub)
+    return out
+
+
+def project_items(items: List[Dict[str, Any]], spec: Optional[Spec]) -> List[Dict[str, Any]]:
+    if spec is None:
+        return items
+    return [project(item, spec) for item in items]
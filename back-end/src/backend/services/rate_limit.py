@@ -0,0 +1,250 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import httpx
+
+from backend.services import job_runs
+from backend.settings import get_settings
+
+settings = get_settings()
+
+
+class Priority(IntEnum):
+    """
+    Lower value is served first.
+    """
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_current_priority: ContextVar[Priority] = ContextVar("upstream_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+@contextmanager
+def background_priority():
+    """
+    Mark every upstream call made inside the block (and tasks spawned from it) as background work.
+    """
+    token = _current_priority.set(Priority.BACKGROUND)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After is either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now < self.paused_until:
+            self.updated = now
+            return
+        elapsed = now - max(self.updated, self.paused_until)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def try_take(self) -> bool:
+        now = time.monotonic()
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def time_until_token(self) -> float:
+        now = time.monotonic()
+        self._refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for `seconds` (used when upstream answers 429).
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+class _LaneStats:
+    def __init__(self, window: int = 200):
+        self.count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, wait: float) -> None:
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.recent.append(wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+        p95 = recent[int(len(recent) * 0.95) - 1] if recent else 0.0
+        return {
+            "acquired": self.count,
+            "avg_wait_ms": round(self.total_wait / self.count * 1000, 2) if self.count else 0.0,
+            "p95_wait_ms": round(p95 * 1000, 2),
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for one upstream with strict priority lanes.
+
+    Interactive callers are always served before background callers; within a
+    lane the order is FIFO. A 429 pauses the whole bucket for Retry-After so
+    the other in-flight callers back off too.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_retries: int = 3, max_retry_after: float = 30.0):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self._waiters: Dict[Priority, Deque[asyncio.Future]] = {p: deque() for p in Priority}
+        self._stats: Dict[Priority, _LaneStats] = {p: _LaneStats() for p in Priority}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.throttled = 0
+        self.retries = 0
+
+    def queue_depth(self, priority: Priority) -> int:
+        return sum(1 for fut in self._waiters[priority] if not fut.done())
+
+    async def acquire(self, priority: Optional[Priority] = None) -> None:
+        if priority is None:
+            priority = current_priority()
+        start = time.monotonic()
+
+        if not any(self._waiters.values()) and self.bucket.try_take():
+            self._stats[priority].record(0.0)
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(fut)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await fut
+        self._stats[priority].record(time.monotonic() - start)
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        for priority in Priority:
+            lane = self._waiters[priority]
+            while lane:
+                fut = lane.popleft()
+                if not fut.done():
+                    return fut
+        return None
+
+    async def _dispatch(self) -> None:
+        while any(self._waiters.values()):
+            delay = self.bucket.time_until_token()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            fut = self._next_waiter()
+            if fut is None:
+                break
+            self.bucket.try_take()
+            fut.set_result(None)
+
+    async def send(self, send: Callable[..., Awaitable[httpx.Response]], *args, **kwargs) -> httpx.Response:
+        """
+        Call `send` (e.g. client.get) under the limiter, retrying 429 responses
+        after the upstream's Retry-After (or an exponential backoff when absent).
+        """
+        attempt = 0
+        while True:
+            await self.acquire()
+            job_runs.count("upstream_calls")
+            response = await send(*args, **kwargs)
+            if response.status_code != 429:
+                return response
+
+            self.throttled += 1
+            if attempt >= self.max_retries:
+                return response
+            self.retries += 1
+            attempt += 1
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = 2 ** (attempt - 1)
+            self.bucket.pause(min(delay, self.max_retry_after))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rate_per_second": self.bucket.rate,
+            "burst": self.bucket.capacity,
+            "tokens_available": round(max(self.bucket.tokens, 0.0), 2),
+            "paused_for_ms": round(max(self.bucket.paused_until - time.monotonic(), 0.0) * 1000, 2),
+            "throttled_responses": self.throttled,
+            "retries": self.retries,
+            "lanes": {
+                priority.name.lower(): {
+                    "queue_depth": self.queue_depth(priority),
+                    **self._stats[priority].snapshot(),
+                }
+                for priority in Priority
+            },
+        }
+
+
+tmdb_rate_limiter = RateLimiter(
+    "tmdb",
+    rate=settings.TMDB_RATE_LIMIT_PER_SECOND,
+    burst=settings.TMDB_RATE_LIMIT_BURST,
+    max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+    max_retry_after=settings.RATE_LIMIT_MAX_RETRY_AFTER,
+)
+
+emby_rate_limiter = RateLimiter(
+    "emby",
+    rate=settings.EMBY_RATE_LIMIT_PER_SECOND,
+    burst=settings.EMBY_RATE_LIMIT_BURST,
+    max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+    max_retry_after=settings.RATE_LIMIT_MAX_RETRY_AFTER,
+)
+
+
+# Every limiter reported by rate_limit_metrics (additional Emby servers register theirs)
+rate_limiters: List[RateLimiter] = [tmdb_rate_limiter, emby_rate_limiter]
+
+
+def rate_limit_metrics() -> List[Dict[str, Any]]:
+    return [limiter.metrics() for limiter in rate_limiters]
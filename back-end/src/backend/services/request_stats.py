@@ -0,0 +1,114 @@
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func
+from sqlmodel import Session, col, select
+
+from backend.models import SubscriptionRequest, User
+from backend.settings import get_settings
+
+settings = get_settings()
+
+
+class RequestStats:
+    """
+    Admin dashboard summary of subscription requests, kept in memory.
+
+    The summary is computed with a handful of GROUP BY queries (the median time to
+    complete included, via ORDER BY/OFFSET) and reused until a write through the
+    API invalidates it. Writes from other processes (e.g. the
+    completion job in a separate worker) show up after at most `ttl_seconds`.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, days: int = 30):
+        self.ttl_seconds = ttl_seconds
+        self.days = days
+        self._summary: Optional[Dict[str, Any]] = None
+        self._computed_at = 0.0
+
+    def invalidate(self) -> None:
+        self._summary = None
+
+    def get(self, session: Session) -> Dict[str, Any]:
+        if self._summary is None or time.monotonic() - self._computed_at > self.ttl_seconds:
+            self._summary = self.compute(session)
+            self._computed_at = time.monotonic()
+        return self._summary
+
+    def compute(self, session: Session) -> Dict[str, Any]:
+        by_status: Dict[str, int] = {}
+        by_media_type: Dict[str, int] = {}
+        by_user: Dict[str, Dict[str, Any]] = {}
+
+        rows = session.exec(
+            select(
+                SubscriptionRequest.status,
+                SubscriptionRequest.user_id,
+                User.name,
+                SubscriptionRequest.media_type,
+                func.count(),
+            )
+            .join(User, SubscriptionRequest.user_id == User.id, isouter=True)
+            .group_by(SubscriptionRequest.status, SubscriptionRequest.user_id, User.name, SubscriptionRequest.media_type)
+        ).all()
+        for status, user_id, user_name, media_type, count in rows:
+            status = status.value if hasattr(status, "value") else status
+            media_type = "tv" if media_type == "series" else media_type
+            by_status[status] = by_status.get(status, 0) + count
+            by_media_type[media_type] = by_media_type.get(media_type, 0) + count
+            user = by_user.setdefault(user_id, {"user_id": user_id, "user_name": user_name, "total": 0, "by_status": {}})
+            user["total"] += count
+            user["by_status"][status] = user["by_status"].get(status, 0) + count
+
+        since = datetime.utcnow().date() - timedelta(days=self.days - 1)
+        daily: Dict[str, Dict[str, Any]] = {
+            str(since + timedelta(days=i)): {"date": str(since + timedelta(days=i)), "requested": 0, "completed": 0}
+            for i in range(self.days)
+        }
+        requested_day = func.date(SubscriptionRequest.request_date)
+        for day, count in session.exec(
+            select(requested_day, func.count())
+            .where(SubscriptionRequest.request_date >= since)
+            .group_by(requested_day)
+        ).all():
+            if str(day) in daily:
+                daily[str(day)]["requested"] = count
+        completed_day = func.date(SubscriptionRequest.completed_at)
+        for day, count in session.exec(
+            select(completed_day, func.count())
+            .where(SubscriptionRequest.completed_at >= since)
+            .group_by(completed_day)
+        ).all():
+            if str(day) in daily:
+                daily[str(day)]["completed"] = count
+
+        median_hours = None
+        is_completed = col(SubscriptionRequest.completed_at).is_not(None)
+        hours_to_complete = (
+            func.julianday(SubscriptionRequest.completed_at) - func.julianday(SubscriptionRequest.request_date)
+        ) * 24
+        completed = session.exec(select(func.count()).where(is_completed)).one()
+        if completed:
+            # The middle row, or the two middle rows for an even count
+            middle = session.exec(
+                select(hours_to_complete)
+                .where(is_completed)
+                .order_by(hours_to_complete)
+                .offset((completed - 1) // 2)
+                .limit(2 - completed % 2)
+            ).all()
+            median_hours = round(sum(middle) / len(middle), 2)
+
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_media_type": by_media_type,
+            "by_user": sorted(by_user.values(), key=lambda u: u["total"], reverse=True),
+            "daily": list(daily.values()),
+            "median_hours_to_complete": median_hours,
+            "generated_at": datetime.utcnow().isoformat(),
+        }
+
+
+request_stats = RequestStats(ttl_seconds=settings.REQUEST_STATS_TTL_SECONDS)
@@ -1,18 +1,123 @@
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import wraps
 from backend.jobs.check_media import check_new_media_job
+from backend.jobs.external_ids import backfill_external_ids_job
+from backend.jobs.process_work_queue import process_work_queue_job
+from backend.jobs.prune_notifications import prune_notifications_job
+from backend.jobs.refresh_search_index import refresh_search_index_job
+from backend.services.job_runs import job_ledger
+from backend.services.leader import leader_election
+from backend.services.rate_limit import background_priority
+from backend.services.snapshot import save_snapshot_job
+from backend.settings import get_settings
+import logging
+import random
 
-scheduler = AsyncIOScheduler()
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
-def start_scheduler():
-    scheduler.add_job(
-        check_new_media_job,
-        trigger=IntervalTrigger(minutes=2),
-        id="check_new_media",
-        replace_existing=True,
-        next_run_time=datetime.now()
-    )
-    scheduler.start()
+# A job never overlaps itself: a run that comes due while the previous one is still
+# going is skipped (and recorded), and runs missed meanwhile collapse into one
+scheduler = AsyncIOScheduler(job_defaults={"max_instances": 1, "coalesce": True})
+
+def record_skipped_run(event):
+    job_ledger.record_skipped(event.job_id)
+
+scheduler.add_listener(record_skipped_run, EVENT_JOB_MAX_INSTANCES)
+
+def background_job(job):
+    """
+    Run a scheduled job in the background lane so interactive requests get upstream quota first.
+    """
+    @wraps(job)
+    async def wrapper(*args, **kwargs):
+        with background_priority():
+            return await job(*args, **kwargs)
+    return wrapper
 
+def leader_only(job):
+    """
+    Skip the job unless this process holds the scheduler lease, so it runs once across workers.
+    """
+    @wraps(job)
+    async def wrapper(*args, **kwargs):
+        if not leader_election.is_leader:
+            logger.debug(f"Skipping {job.__name__}: not the scheduler leader")
+            return None
+        return await job(*args, **kwargs)
+    return wrapper
+
+def first_run_time() -> datetime:
+    """
+    Deferred, jittered first run for jobs that used to start immediately at startup.
+    """
+    delay = settings.STARTUP_JOB_DELAY_SECONDS + random.uniform(0, settings.STARTUP_JOB_JITTER_SECONDS)
+    return datetime.now() + timedelta(seconds=delay)
+
+async def renew_leadership_job():
+    leader_election.try_acquire()
+
+def start_scheduler(shared_jobs: bool = True, local_jobs: bool = True):
+    """
+    shared_jobs: jobs that touch shared state (DB, Emby) and must run once across processes.
+    local_jobs: jobs that refresh this process's in-memory state, needed wherever the API runs.
+    """
+    if shared_jobs:
+        leader_election.try_acquire()
+        scheduler.add_job(
+            renew_leadership_job,
+            trigger=IntervalTrigger(seconds=max(settings.LEADER_LEASE_SECONDS // 3, 1)),
+            id="renew_leadership",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            leader_only(job_ledger.instrument("check_new_media")(background_job(check_new_media_job))),
+            trigger=IntervalTrigger(minutes=2),
+            id="check_new_media",
+            replace_existing=True,
+            next_run_time=first_run_time()
+        )
+        scheduler.add_job(
+            leader_only(job_ledger.instrument("process_work_queue")(background_job(process_work_queue_job))),
+            trigger=IntervalTrigger(seconds=settings.WORK_QUEUE_INTERVAL_SECONDS),
+            id="process_work_queue",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            leader_only(job_ledger.instrument("backfill_external_ids")(backfill_external_ids_job)),
+            trigger=IntervalTrigger(hours=6),
+            id="backfill_external_ids",
+            replace_existing=True,
+            next_run_time=first_run_time()
+        )
+        scheduler.add_job(
+            leader_only(job_ledger.instrument("prune_notifications")(prune_notifications_job)),
+            trigger=IntervalTrigger(hours=settings.NOTIFICATION_PRUNE_INTERVAL_HOURS),
+            id="prune_notifications",
+            replace_existing=True,
+        )
+    if local_jobs:
+        # Every process keeps its own in-memory search index, so this one runs everywhere
+        scheduler.add_job(
+            job_ledger.instrument("refresh_search_index")(background_job(refresh_search_index_job)),
+            trigger=IntervalTrigger(minutes=settings.SEARCH_INDEX_REFRESH_MINUTES),
+            id="refresh_search_index",
+            replace_existing=True,
+            next_run_time=first_run_time()
+        )
+        if settings.SNAPSHOT_PATH:
+            scheduler.add_job(
+                job_ledger.instrument("save_snapshot")(save_snapshot_job),
+                trigger=IntervalTrigger(minutes=settings.SNAPSHOT_INTERVAL_MINUTES),
+                id="save_snapshot",
+                replace_existing=True,
+            )
+    scheduler.start()
 
+def stop_scheduler():
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+    leader_election.release()
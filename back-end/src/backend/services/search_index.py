@@ -0,0 +1,289 @@
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.settings import get_settings
+
+settings = get_settings()
+
+# (media_type, tmdb_id)
+IndexKey = Tuple[str, str]
+
+_STRIP_RE = re.compile(r"[^\w\s]+", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+# Fields copied from TMDB results so suggestions can be rendered as media cards.
+_CARD_FIELDS = (
+    "title",
+    "name",
+    "original_title",
+    "original_name",
+    "poster_path",
+    "backdrop_path",
+    "release_date",
+    "first_air_date",
+    "vote_average",
+    "popularity",
+)
+
+
+def normalize(text: str) -> str:
+    """
+    Casefold and strip punctuation so "Spider-Man: No Way Home" matches "spider man".
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _STRIP_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    In-memory prefix/trigram index over titles we have already seen.
+
+    Entries come from two places: the Emby library (pinned, marked available)
+    and TMDB results passing through the media endpoints (LRU, bounded).
+    Updates run on the event loop while /suggest reads from the threadpool, so
+    every public method holds the index lock.
+    """
+
+    PREFIX_LENGTH = 2
+
+    def __init__(self, max_entries: int = 20000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[IndexKey, Dict[str, Any]]" = OrderedDict()
+        self._names: Dict[IndexKey, List[str]] = {}
+        self._trigrams: Dict[str, Set[IndexKey]] = {}
+        self._prefixes: Dict[str, Set[IndexKey]] = {}
+        self._library: Set[IndexKey] = set()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _index_keys(self, names: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        grams: Set[str] = set()
+        prefixes: Set[str] = set()
+        for name in names:
+            grams |= _trigrams(name)
+            for word in [name] + name.split(" "):
+                for length in range(1, self.PREFIX_LENGTH + 1):
+                    if len(word) >= length:
+                        prefixes.add(word[:length])
+        return grams, prefixes
+
+    def _remove(self, key: IndexKey) -> None:
+        self._entries.pop(key, None)
+        names = self._names.pop(key, [])
+        grams, prefixes = self._index_keys(names)
+        for gram in grams:
+            postings = self._trigrams.get(gram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._trigrams[gram]
+        for prefix in prefixes:
+            postings = self._prefixes.get(prefix)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._prefixes[prefix]
+
+    def _put(self, key: IndexKey, card: Dict[str, Any], names: Iterable[str]) -> None:
+        existing = self._entries.get(key)
+        if existing is not None:
+            # Keep availability and any fields we learnt from the other source
+            card = {**existing, **{k: v for k, v in card.items() if v is not None}}
+            names = set(names) | set(self._names.get(key, []))
+            self._remove(key)
+
+        normalized = sorted({normalize(n) for n in names if n} - {""})
+        if not normalized:
+            return
+
+        self._entries[key] = card
+        self._names[key] = normalized
+        grams, prefixes = self._index_keys(normalized)
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(key)
+        for prefix in prefixes:
+            self._prefixes.setdefault(prefix, set()).add(key)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        if len(self._entries) <= self.max_entries:
+            return
+        # Library entries are pinned; drop the least recently seen TMDB-only ones.
+        for key in list(self._entries.keys()):
+            if len(self._entries) <= self.max_entries:
+                break
+            if key not in self._library:
+                self._remove(key)
+
+    def add_tmdb_results(self, results: Iterable[Dict[str, Any]], media_type: Optional[str] = None) -> None:
+        """
+        Index TMDB movie/tv results. Items without a usable media_type are skipped.
+        """
+        with self._lock:
+            self._add_tmdb_results(results, media_type)
+
+    def _add_tmdb_results(self, results: Iterable[Dict[str, Any]], media_type: Optional[str]) -> None:
+        for item in results:
+            item_type = item.get("media_type") or media_type
+            if item_type == "series":
+                item_type = "tv"
+            if item_type not in ("movie", "tv") or item.get("id") is None:
+                continue
+
+            key = (item_type, str(item["id"]))
+            card = {field: item.get(field) for field in _CARD_FIELDS}
+            card["id"] = int(item["id"]) if str(item["id"]).isdigit() else item["id"]
+            card["media_type"] = item_type
+            if item.get("status") == "AVAILABLE":
+                card["status"] = "AVAILABLE"
+                card["emby_id"] = item.get("emby_id")
+
+            names = [
+                item.get("title"),
+                item.get("name"),
+                item.get("original_title"),
+                item.get("original_name"),
+            ]
+            names.extend(item.get("aliases") or [])
+            self._put(key, card, names)
+
+    def load_emby_library(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the pinned library entries with the given Emby items.
+        Only items carrying a Tmdb provider id can be linked to a details page.
+        """
+        with self._lock:
+            return self._load_emby_library(items)
+
+    def _load_emby_library(self, items: Iterable[Dict[str, Any]]) -> int:
+        stale = set(self._library)
+        self._library = set()
+        count = 0
+        for item in items:
+            provider_ids = item.get("ProviderIds", {})
+            tmdb_id = provider_ids.get("Tmdb") or provider_ids.get("tmdb") or provider_ids.get("TMDB")
+            if not tmdb_id:
+                continue
+
+            media_type = "movie" if item.get("Type") == "Movie" else "tv"
+            key = (media_type, str(tmdb_id))
+            title_field = "title" if media_type == "movie" else "name"
+            date_field = "release_date" if media_type == "movie" else "first_air_date"
+            card = {
+                "id": int(tmdb_id) if str(tmdb_id).isdigit() else tmdb_id,
+                "media_type": media_type,
+                title_field: item.get("Name"),
+                date_field: (item.get("PremiereDate") or "")[:10] or None,
+                "status": "AVAILABLE",
+                "emby_id": item.get("Id"),
+            }
+            names = [item.get("Name"), item.get("OriginalTitle"), item.get("SortName")]
+
+            self._library.add(key)
+            stale.discard(key)
+            self._put(key, card, names)
+            count += 1
+
+        # Titles that left the library fall back to plain TMDB entries
+        for key in stale:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.pop("status", None)
+                entry.pop("emby_id", None)
+        return count
+
+    def _candidates(self, query: str) -> Set[IndexKey]:
+        if len(query) < 3:
+            return set(self._prefixes.get(query[: self.PREFIX_LENGTH], set()))
+
+        postings = [self._trigrams.get(gram) for gram in _trigrams(query)]
+        if any(p is None for p in postings):
+            return set()
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates &= p
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _score(query: str, names: List[str]) -> int:
+        best = 0
+        for name in names:
+            if name == query:
+                return 4
+            if name.startswith(query):
+                best = max(best, 3)
+            elif any(word.startswith(query) for word in name.split(" ")):
+                best = max(best, 2)
+            elif query in name:
+                best = max(best, 1)
+        return best
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return the best matches for a partially typed query.
+        Ranking: exact > prefix > word prefix > substring, then available first, then popularity.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        with self._lock:
+            return self._suggest(query, limit)
+
+    def _suggest(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        scored = []
+        for key in self._candidates(query):
+            score = self._score(query, self._names[key])
+            if not score:
+                continue
+            card = self._entries[key]
+            scored.append((
+                score,
+                card.get("status") == "AVAILABLE",
+                card.get("popularity") or 0,
+                key,
+            ))
+
+        scored.sort(key=lambda s: (s[0], s[1], s[2]), reverse=True)
+        return [dict(self._entries[s[3]]) for s in scored[:limit]]
+
+    def dump(self) -> List[Dict[str, Any]]:
+        """
+        Entries in LRU order (oldest first), for the warm-restart snapshot.
+        """
+        with self._lock:
+            return [
+                {"key": list(key), "card": dict(card), "names": list(self._names[key]), "library": key in self._library}
+                for key, card in self._entries.items()
+            ]
+
+    def restore(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Re-index entries produced by `dump`; entries indexed since startup are kept.
+        """
+        count = 0
+        with self._lock:
+            for entry in entries:
+                key = tuple(entry["key"])
+                if entry.get("library"):
+                    self._library.add(key)
+                self._put(key, entry["card"], entry["names"])
+                count += 1
+        return count
+
+
+search_index = SearchIndex(max_entries=settings.SEARCH_INDEX_MAX_ENTRIES)
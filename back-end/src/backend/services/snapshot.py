@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from backend.services.cache import MemoryCacheBackend
+from backend.services.circuit_breaker import CircuitBreaker, circuit_breakers
+from backend.services.search_index import SearchIndex, search_index
+from backend.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class Snapshot:
+    """
+    Warm-restart snapshot of this process's in-memory state, as one gzipped JSON file.
+
+    Covers the upstream response caches of every circuit breaker (TMDB responses,
+    Emby lookups, resolved ids) and the search index. Cache entries keep their
+    original stored_at, so TMDB_CACHE_TTL_SECONDS still applies to them after a
+    restart; entries older than `max_age` seconds are not restored at all.
+    Caches on the sqlite backend already survive restarts and are skipped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_age: float,
+        breakers: List[CircuitBreaker],
+        index: SearchIndex,
+    ):
+        self.path = path
+        self.max_age = max_age
+        self.breakers = breakers
+        self.index = index
+
+    def capture(self) -> Dict[str, Any]:
+        caches = {}
+        for breaker in self.breakers:
+            backend = breaker.last_good.backend
+            if not isinstance(backend, MemoryCacheBackend):
+                continue
+            caches[breaker.name] = [
+                [key, body.decode("utf-8"), stored_at] for key, (body, stored_at) in backend.items()
+            ]
+        return {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "caches": caches,
+            "search_index": self.index.dump(),
+        }
+
+    def write(self, state: Dict[str, Any]) -> None:
+        # Write aside and rename, so a crash mid-write never leaves a truncated snapshot
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=5) as f:
+            json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def save(self) -> None:
+        self.write(self.capture())
+
+    async def save_async(self) -> None:
+        # State is captured on the event loop; compressing and writing happen off it
+        state = self.capture()
+        await asyncio.to_thread(self.write, state)
+
+    def load(self) -> Optional[Dict[str, int]]:
+        """
+        Restore from the snapshot file. Returns per-part counts, or None when there is nothing to load.
+        """
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable snapshot %s: %s", self.path, e)
+            return None
+        if state.get("version") != SNAPSHOT_VERSION:
+            logger.info("Ignoring snapshot %s with version %s", self.path, state.get("version"))
+            return None
+
+        counts: Dict[str, int] = {}
+        oldest = time.time() - self.max_age
+        by_name = {breaker.name: breaker for breaker in self.breakers}
+        for name, entries in state.get("caches", {}).items():
+            breaker = by_name.get(name)
+            if breaker is None or not isinstance(breaker.last_good.backend, MemoryCacheBackend):
+                continue
+            restored = 0
+            for key, body, stored_at in entries:
+                if stored_at >= oldest:
+                    breaker.last_good.backend.set(key, body.encode("utf-8"), stored_at=stored_at)
+                    restored += 1
+            counts[name] = restored
+
+        if state.get("saved_at", 0) >= oldest:
+            counts["search_index"] = self.index.restore(state.get("search_index", []))
+        return counts
+
+
+snapshot = Snapshot(
+    settings.SNAPSHOT_PATH,
+    max_age=settings.SNAPSHOT_MAX_AGE_HOURS * 3600,
+    breakers=circuit_breakers,
+    index=search_index,
+)
+
+
+def load_snapshot() -> None:
+    if not settings.SNAPSHOT_PATH:
+        return
+    started = time.monotonic()
+    counts = snapshot.load()
+    if counts is not None:
+        logger.info("Restored snapshot %s in %.2fs: %s", settings.SNAPSHOT_PATH, time.monotonic() - started, counts)
+
+
+def save_snapshot() -> None:
+    if not settings.SNAPSHOT_PATH:
+        return
+    try:
+        snapshot.save()
+    except OSError as e:
+        logger.warning("Could not write snapshot %s: %s", settings.SNAPSHOT_PATH, e)
+
+
+async def save_snapshot_job():
+    try:
+        await snapshot.save_async()
+    except OSError as e:
+        logger.warning("Could not write snapshot %s: %s", settings.SNAPSHOT_PATH, e)
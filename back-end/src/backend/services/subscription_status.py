@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlmodel import Session, select
+
+from backend.models import SubscriptionRequest, SubscriptionStatus
+from backend.settings import get_settings
+
+settings = get_settings()
+
+
+StatusIndex = Dict[str, Dict[Optional[int], "RequestState"]]
+
+
+class RequestState(NamedTuple):
+    id: int
+    tmdb_id: str
+    specific_season: Optional[int]
+    status: SubscriptionStatus
+    user_id: str
+
+    @classmethod
+    def of(cls, request: SubscriptionRequest) -> "RequestState":
+        return cls(request.id, request.tmdb_id, request.specific_season, request.status, request.user_id)
+
+
+class SubscriptionStatusMap:
+    """
+    Process-wide map tmdb_id -> {season (None for the whole show) -> request state}.
+
+    Loaded with one query on first use, then kept current write-through by every
+    endpoint and job that changes requests, so status enrichment on the read paths
+    needs no SQL. Changes made by other processes (other uvicorn workers, or the
+    completion job in a separate worker) are picked up by a full reload at most
+    `ttl_seconds` later.
+
+    Writes come from the threadpool (sync endpoints) while reloads run on the
+    event loop, so a write landing while a reload query is in flight is also
+    journaled and replayed onto the reloaded map before it replaces the old one.
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._by_tmdb_id: StatusIndex = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        # One journal per reload in flight
+        self._journals: List[List[Callable[[StatusIndex], None]]] = []
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def _ensure_loaded(self, session: Session) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at <= self.ttl_seconds:
+            return
+        journal: List[Callable[[StatusIndex], None]] = []
+        with self._lock:
+            self._journals.append(journal)
+        try:
+            rows = session.exec(select(
+                SubscriptionRequest.id,
+                SubscriptionRequest.tmdb_id,
+                SubscriptionRequest.specific_season,
+                SubscriptionRequest.status,
+                SubscriptionRequest.user_id,
+            )).all()
+        except BaseException:
+            with self._lock:
+                self._journals.remove(journal)
+            raise
+        by_tmdb_id: StatusIndex = {}
+        for row in rows:
+            state = RequestState(*row)
+            by_tmdb_id.setdefault(state.tmdb_id, {})[state.specific_season] = state
+        with self._lock:
+            self._journals.remove(journal)
+            # Writes made after the query started may be missing from its rows
+            for apply in journal:
+                apply(by_tmdb_id)
+            self._by_tmdb_id = by_tmdb_id
+            self._loaded_at = time.monotonic()
+
+    def _write(self, apply: Callable[[StatusIndex], None]) -> None:
+        with self._lock:
+            apply(self._by_tmdb_id)
+            for journal in self._journals:
+                journal.append(apply)
+
+    def get(self, session: Session, tmdb_id: str) -> Dict[Optional[int], RequestState]:
+        """
+        All requests of a title by season; the whole-show request is under None.
+        """
+        self._ensure_loaded(session)
+        return dict(self._by_tmdb_id.get(str(tmdb_id), {}))
+
+    def primary(self, session: Session, tmdb_id: str) -> Optional[RequestState]:
+        """
+        The request that stands for the title on cards: the whole-show one, else the earliest season request.
+        """
+        return self.primary_of(self.get(session, tmdb_id))
+
+    @staticmethod
+    def primary_of(states: Dict[Optional[int], RequestState]) -> Optional[RequestState]:
+        if not states:
+            return None
+        return states.get(None) or min(states.values(), key=lambda state: state.id)
+
+    def record(self, states: Iterable[RequestState]) -> None:
+        states = list(states)
+
+        def apply(by_tmdb_id: StatusIndex) -> None:
+            for state in states:
+                by_tmdb_id.setdefault(state.tmdb_id, {})[state.specific_season] = state
+
+        self._write(apply)
+
+    def put(self, request: SubscriptionRequest) -> None:
+        self.record([RequestState.of(request)])
+
+    def remove(self, tmdb_id: str, specific_season: Optional[int]) -> None:
+        def apply(by_tmdb_id: StatusIndex) -> None:
+            states = by_tmdb_id.get(tmdb_id)
+            if states is not None:
+                states.pop(specific_season, None)
+                if not states:
+                    del by_tmdb_id[tmdb_id]
+
+        self._write(apply)
+
+
+subscription_status = SubscriptionStatusMap(ttl_seconds=settings.SUBSCRIPTION_STATUS_TTL_SECONDS)
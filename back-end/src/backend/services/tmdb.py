@@ -2,6 +2,10 @@ import httpx
 import asyncio
 from typing import Dict, Any, List, Optional
 from backend.settings import get_settings
+from backend.services.rate_limit import tmdb_rate_limiter
+from backend.services.circuit_breaker import tmdb_breaker
+from backend.services.cache import make_key
+from backend.services.feed import PagedStream, decode_cursor, encode_cursor, merge_by_popularity
 
 settings = get_settings()
 
@@ -19,10 +23,25 @@ class TMDBClient:
             self.proxies["http://"] = settings.HTTP_PROXY
         if settings.HTTPS_PROXY:
             self.proxies["https://"] = settings.HTTPS_PROXY
-            
+        # Built on first use and reused: constructing an AsyncClient (SSL context) costs tens of ms
+        self._client: Optional[httpx.AsyncClient] = None
+
     def _get_client(self) -> httpx.AsyncClient:
         """
-        Return an AsyncClient with configured proxies.
+        Return the shared AsyncClient, building it on first use.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """
+        Build an AsyncClient with configured proxies.
         """
         # httpx 0.28.1 removed the 'proxies' argument from AsyncClient constructor if it's not passed correctly,
         # but checking the docs, 'proxies' IS the correct argument name. 
@@ -70,16 +89,27 @@ class TMDBClient:
         
         return httpx.AsyncClient()
 
+    async def _get(self, url: str, params: Dict[str, Any], max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        GET a TMDB endpoint through the circuit breaker and the shared rate limiter.
+        Responses younger than `max_age` (default TMDB_CACHE_TTL_SECONDS) are served
+        from cache, and while TMDB is down the last good response for the same URL is returned.
+        """
+        async def fetch() -> httpx.Response:
+            client = self._get_client()
+            return await tmdb_rate_limiter.send(client.get, url, params=params)
+
+        if max_age is None:
+            max_age = settings.TMDB_CACHE_TTL_SECONDS
+        return await tmdb_breaker.call(fetch, make_key(url, params), max_age=max_age)
+
     async def get_trending(self, media_type: str = "all", time_window: str = "day", page: int = 1) -> Dict[str, Any]:
         """
         Get trending movies/shows.
         """
         url = f"{self.base_url}/trending/{media_type}/{time_window}"
         params = {**self.params, "page": page}
-        async with self._get_client() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, params)
 
     async def search(self, query: str, page: int = 1) -> Dict[str, Any]:
         """
@@ -87,10 +117,7 @@ class TMDBClient:
         """
         url = f"{self.base_url}/search/multi"
         params = {**self.params, "query": query, "page": page}
-        async with self._get_client() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, params)
 
     async def discover_tv(self, page: int = 1, without_genres: str = None) -> Dict[str, Any]:
         """
@@ -105,64 +132,36 @@ class TMDBClient:
         if without_genres:
             params["without_genres"] = without_genres
             
-        async with self._get_client() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-
-    async def get_anime(self, page: int = 1) -> Dict[str, Any]:
-        """
-        Get anime (Animation genre).
-        Genre ID for Animation is 16.
-        Mix of Movies and TV shows if possible, but TMDB discover is per type.
-        We will fetch both and combine, or just fetch one type.
-        For now, let's fetch both and mix them, or the caller decides.
-        Actually, to simplify, let's just return TV shows (most anime) or allow type param.
-        Wait, user wants "Anime" mixed.
-        Let's fetch both and combine them by popularity.
-        """
-        # Fetch TV Anime
-        url_tv = f"{self.base_url}/discover/tv"
-        params_tv = {
-            **self.params,
-            "with_genres": "16",
-            "sort_by": "popularity.desc",
-            "page": page,
-            "with_original_language": "ja",
-        }
-        
-        # Fetch Movie Anime
-        url_movie = f"{self.base_url}/discover/movie"
-        params_movie = {
-            **self.params,
-            "with_genres": "16",
-            "sort_by": "popularity.desc",
-            "page": page,
-            "with_original_language": "ja",
-        }
+        return await self._get(url, params)
 
-        async with self._get_client() as client:
-            # Parallel requests
-            resp_tv, resp_movie = await asyncio.gather(
-                client.get(url_tv, params=params_tv),
-                client.get(url_movie, params=params_movie)
-            )
-            
-            data_tv = resp_tv.json()
-            data_movie = resp_movie.json()
-            
-            # Tag them
-            results_tv = data_tv.get("results", [])
-            for r in results_tv: r["media_type"] = "tv"
-            
-            results_movie = data_movie.get("results", [])
-            for r in results_movie: r["media_type"] = "movie"
-            
-            # Combine and sort by popularity
-            combined = results_tv + results_movie
-            combined.sort(key=lambda x: x.get("popularity", 0), reverse=True)
-            
-            return {"results": combined[:20]} # Return top 20 mixed
+    async def get_anime(self, page: int = 1, cursor: Optional[str] = None, page_size: int = 20) -> Dict[str, Any]:
+        """
+        Get anime (Animation genre, original language Japanese), TV shows and movies mixed.
+
+        TMDB discover is per type, so both listings are merged by popularity.
+        Upstream pages are fetched lazily as the merge consumes them. `next_cursor`
+        resumes exactly where this page stopped; without a cursor, `page` N returns
+        merged items [page_size*(N-1), page_size*N).
+        """
+        def stream(media_type: str) -> PagedStream:
+            url = f"{self.base_url}/discover/{media_type}"
+            params = {
+                **self.params,
+                "with_genres": "16",  # Genre ID for Animation is 16
+                "sort_by": "popularity.desc",
+                "with_original_language": "ja",
+            }
+            return PagedStream(lambda n: self._get(url, {**params, "page": n}), media_type)
+
+        streams = [stream("tv"), stream("movie")]
+        if cursor:
+            offsets = decode_cursor(cursor, len(streams))
+        else:
+            # Skip the earlier pages; their upstream pages are normally still cached
+            _, offsets, _ = await merge_by_popularity(streams, [0, 0], page_size * (page - 1))
+
+        results, offsets, exhausted = await merge_by_popularity(streams, offsets, page_size)
+        return {"results": results, "next_cursor": None if exhausted else encode_cursor(offsets)}
 
     async def get_details(self, media_type: str, tmdb_id: str) -> Dict[str, Any]:
         """
@@ -171,31 +170,29 @@ class TMDBClient:
         url = f"{self.base_url}/{media_type}/{tmdb_id}"
         # Request credits and external_ids
         params = {**self.params, "append_to_response": "external_ids,credits"}
-        async with self._get_client() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, params)
+
+    async def get_external_ids(self, media_type: str, tmdb_id: str) -> Dict[str, Any]:
+        """
+        Only the external ids (imdb_id, tvdb_id, ...) of a movie or TV show.
+        """
+        url = f"{self.base_url}/{media_type}/{tmdb_id}/external_ids"
+        return await self._get(url, {"api_key": self.api_key})
 
-    async def get_person_details(self, person_id: str) -> Dict[str, Any]:
+    async def get_person_details(self, person_id: str, max_age: Optional[float] = None) -> Dict[str, Any]:
         """
-        Get person details and combined credits.
+        Get person details and combined credits; `max_age` allows a cached copy that young.
         """
         url = f"{self.base_url}/person/{person_id}"
         params = {**self.params, "append_to_response": "combined_credits,external_ids"}
-        async with self._get_client() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, params, max_age=max_age)
 
     async def get_season_details(self, tv_id: str, season_number: int) -> Dict[str, Any]:
         """
         Get details for a specific season of a TV show.
         """
         url = f"{self.base_url}/tv/{tv_id}/season/{season_number}"
-        async with self._get_client() as client:
-            response = await client.get(url, params=self.params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, self.params)
 
     async def find_by_external_id(self, external_id: str, external_source: str) -> Dict[str, Any]:
         """
@@ -204,9 +201,6 @@ class TMDBClient:
         """
         url = f"{self.base_url}/find/{external_id}"
         params = {**self.params, "external_source": external_source}
-        async with self._get_client() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(url, params)
 
 tmdb_client = TMDBClient()
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlmodel import Session, select
+
+from backend.models import WorkItem, WorkStatus
+from backend.services import job_runs
+from backend.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Handlers get the item and the session of the batch; raising schedules a retry
+Handler = Callable[[Session, WorkItem], Awaitable[None]]
+# Batch handlers get all due items at once and return each item's error (None when it succeeded)
+BatchHandler = Callable[[Session, List[WorkItem]], Awaitable[List[Optional[BaseException]]]]
+
+
+class WorkQueue:
+    """
+    Database-backed work queue processed by the scheduler leader.
+
+    Work is identified by (kind, key), so enqueueing the same work twice is a no-op
+    while it is pending. Failed attempts are retried with exponential backoff
+    (`retry_base_seconds` * 2^attempts, capped at `retry_max_seconds`) until
+    `max_attempts`, after which the item stays FAILED until enqueued again.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        concurrency: int = 4,
+        max_attempts: int = 8,
+        retry_base_seconds: float = 30,
+        retry_max_seconds: float = 6 * 3600,
+    ):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.handlers: Dict[str, Handler] = {}
+        self.batch_handlers: Dict[str, BatchHandler] = {}
+
+    @property
+    def kinds(self) -> List[str]:
+        return [*self.handlers, *self.batch_handlers]
+
+    def register(self, kind: str, handler: Handler) -> None:
+        self.handlers[kind] = handler
+
+    def register_batch(self, kind: str, handler: BatchHandler) -> None:
+        """
+        For work that is cheaper in bulk (one upstream call for many items); the handler does its own concurrency.
+        """
+        self.batch_handlers[kind] = handler
+
+    def enqueue(self, session: Session, kind: str, key: str) -> WorkItem:
+        """
+        Add work to the session (the caller commits, so it lands with the change that caused it).
+        """
+        item = session.exec(select(WorkItem).where(WorkItem.kind == kind, WorkItem.key == key)).first()
+        now = datetime.utcnow()
+        if item is None:
+            item = WorkItem(kind=kind, key=key, next_attempt_at=now, created_at=now, updated_at=now)
+        elif item.status != WorkStatus.PENDING:
+            item.status = WorkStatus.PENDING
+            item.attempts = 0
+            item.next_attempt_at = now
+            item.last_error = None
+            item.updated_at = now
+        session.add(item)
+        return item
+
+    def retry_delay(self, attempts: int) -> float:
+        return min(self.retry_base_seconds * (2 ** (attempts - 1)), self.retry_max_seconds)
+
+    def due(self, session: Session, kind: str, now: Optional[datetime] = None) -> List[WorkItem]:
+        statement = (
+            select(WorkItem)
+            .where(
+                WorkItem.kind == kind,
+                WorkItem.status == WorkStatus.PENDING,
+                WorkItem.next_attempt_at <= (now or datetime.utcnow()),
+            )
+            .order_by(WorkItem.next_attempt_at)
+            .limit(self.batch_size)
+        )
+        return list(session.exec(statement).all())
+
+    async def process(self, session: Session, kind: str) -> int:
+        """
+        Run one batch of due `kind` items concurrently and commit all outcomes at once.
+        Returns the number of items attempted.
+        """
+        items = self.due(session, kind)
+        if not items:
+            return 0
+
+        if kind in self.batch_handlers:
+            errors = await self.batch_handlers[kind](session, items)
+        else:
+            errors = await self._run_each(session, self.handlers[kind], items)
+
+        failures = sum(1 for error in errors if error is not None)
+        job_runs.count("items_scanned", len(items))
+        job_runs.count("matches", len(items) - failures)
+        job_runs.count("errors", failures)
+
+        now = datetime.utcnow()
+        for item, error in zip(items, errors):
+            item.updated_at = now
+            if error is None:
+                item.status = WorkStatus.DONE
+                item.last_error = None
+                continue
+            item.attempts += 1
+            item.last_error = str(error)[:500]
+            if item.attempts >= self.max_attempts:
+                item.status = WorkStatus.FAILED
+                logger.warning("Work item %s/%s failed for good after %d attempts: %s", kind, item.key, item.attempts, error)
+            else:
+                item.next_attempt_at = now + timedelta(seconds=self.retry_delay(item.attempts))
+                logger.info("Work item %s/%s failed (attempt %d), retrying later: %s", kind, item.key, item.attempts, error)
+        session.add_all(items)
+        session.commit()
+        return len(items)
+
+    async def _run_each(self, session: Session, handler: Handler, items: List[WorkItem]) -> List[Optional[BaseException]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(item: WorkItem) -> Optional[BaseException]:
+            async with semaphore:
+                try:
+                    await handler(session, item)
+                except Exception as e:
+                    return e
+                return None
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+work_queue = WorkQueue(
+    batch_size=settings.WORK_QUEUE_BATCH_SIZE,
+    concurrency=settings.WORK_QUEUE_CONCURRENCY,
+    max_attempts=settings.WORK_QUEUE_MAX_ATTEMPTS,
+    retry_base_seconds=settings.WORK_QUEUE_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.WORK_QUEUE_RETRY_MAX_SECONDS,
+)
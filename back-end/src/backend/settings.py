@@ -1,5 +1,15 @@
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, List
+
+
+class EmbyServerConfig(BaseModel):
+    name: str
+    url: str
+    api_key: str = ""
+    user_id: str | None = None
+
 
 class Settings(BaseSettings):
     APP_NAME: str = "Emby Subscription Manager"
@@ -12,14 +22,143 @@ class Settings(BaseSettings):
     EMBY_SERVER_URL: str = "http://localhost:8096"
     EMBY_API_KEY: str = ""
     EMBY_USER_ID: str | None = None
+    # Several servers (e.g. 4K and standard) as a JSON list of {"name", "url", "api_key", "user_id"};
+    # when set it replaces the three settings above. The first server handles logins.
+    EMBY_SERVERS: List[EmbyServerConfig] = []
+    # Per-server request timeout for lookups, so a slow server cannot hold up a response;
+    # a timeout counts against the server's circuit breaker
+    EMBY_SERVER_TIMEOUT_SECONDS: float = 3.0
+    # Request timeout for full scans (library index refresh, complete episode lists)
+    EMBY_BULK_TIMEOUT_SECONDS: float = 60.0
+    EMBY_MAX_CONNECTIONS: int = 20
 
     # TMDB Configuration
     TMDB_API_KEY: str = ""
     TMDB_BASE_URL: str = "https://api.themoviedb.org/3"
     TMDB_IMAGE_BASE_URL: str = "https://image.tmdb.org/t/p/original"
+    # TMDB responses younger than this are served from the response cache without a call:
+    # listings re-read by the anime merge, prefetched pages and snapshot-restored entries
+    # rely on it. 0 disables fresh reads (the cache then only serves TMDB outages)
+    TMDB_CACHE_TTL_SECONDS: int = 300
+    # Credit windows of a person page reuse the person payload fetched by /person/{id} this long
+    PERSON_CREDITS_CACHE_SECONDS: int = 300
+
+    # Outbound rate limiting (token bucket per upstream)
+    TMDB_RATE_LIMIT_PER_SECOND: float = 20.0
+    TMDB_RATE_LIMIT_BURST: int = 20
+    EMBY_RATE_LIMIT_PER_SECOND: float = 50.0
+    EMBY_RATE_LIMIT_BURST: int = 50
+    RATE_LIMIT_MAX_RETRIES: int = 3
+    RATE_LIMIT_MAX_RETRY_AFTER: float = 30.0
+
+    # Circuit breaker per upstream, with last-known-good fallback
+    CIRCUIT_BREAKER_ERROR_RATE: float = 0.5
+    CIRCUIT_BREAKER_MIN_CALLS: int = 5
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    STALE_CACHE_MAX_ENTRIES: int = 2000
+
+    # Downloader that approved requests are handed to (e.g. a MoviePilot webhook).
+    # Without a URL approved requests are only logged for manual processing.
+    DOWNLOADER_URL: str = ""
+    DOWNLOADER_TOKEN: str | None = None
+    DOWNLOADER_TIMEOUT_SECONDS: float = 10.0
+    DOWNLOADER_BATCH_SIZE: int = 20
+    DOWNLOADER_CONCURRENCY: int = 2
+
+    # Per-user admission to the expensive endpoints (search, person, latest):
+    # a token bucket per user, then fair (round-robin) queuing for a shared pool of slots
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_RATE_PER_SECOND: float = 2.0
+    ADMISSION_BURST: int = 20
+    ADMISSION_MAX_CONCURRENT: int = 8
+    ADMISSION_MAX_QUEUED_PER_USER: int = 4
+    ADMISSION_MAX_WAIT_SECONDS: float = 5.0
+
+    # Max concurrent Emby lookups while enriching a list of media
+    ENRICH_CONCURRENCY: int = 8
+    # /media/anime without a cursor re-merges every earlier page, so plain page numbers stop here;
+    # deeper pages are reached with next_cursor
+    ANIME_MAX_PAGE_WITHOUT_CURSOR: int = 10
+    # Max items accepted by POST /media/details:batch
+    DETAILS_BATCH_MAX_ITEMS: int = 50
+
+    # Latency budgets for optional enrichment steps of the details endpoint
+    DETAILS_EMBY_BUDGET_SECONDS: float = 2.0
+    DETAILS_MEDIA_INFO_BUDGET_SECONDS: float = 1.0
+    DETAILS_EPISODES_BUDGET_SECONDS: float = 1.5
+
+    # Opt-in prefetch of the next listing page and the top cards' details into the
+    # TMDB response cache (needs TMDB_CACHE_TTL_SECONDS > 0), in the background lane
+    PREFETCH_ENABLED: bool = False
+    PREFETCH_CONCURRENCY: int = 2
+    PREFETCH_RATE_PER_SECOND: float = 2.0
+    PREFETCH_MAX_PENDING: int = 20
+    PREFETCH_DETAILS_COUNT: int = 4
+
+    # Local search-as-you-type index
+    SEARCH_INDEX_MAX_ENTRIES: int = 20000
+    SEARCH_INDEX_REFRESH_MINUTES: int = 30
+
+    # Encode opted-in list/media responses with orjson (if installed)
+    FAST_JSON: bool = True
 
     # Database
     DATABASE_URL: str = "sqlite:///./app.db"
+    # Set when the schema is managed by `alembic upgrade head`, to skip create_all at startup
+    SKIP_CREATE_ALL: bool = False
+
+    # Shared cache backend: "memory" (per process) or "sqlite" (shared by all workers on the host)
+    CACHE_BACKEND: str = "memory"
+    CACHE_PATH: str = "./cache.db"
+
+    # Warm restart: in-memory caches and the search index are written here on shutdown
+    # and every SNAPSHOT_INTERVAL_MINUTES, and restored on startup. Empty disables it.
+    SNAPSHOT_PATH: str = "./snapshot.json.gz"
+    SNAPSHOT_INTERVAL_MINUTES: int = 10
+    # Snapshot entries older than this are not restored
+    SNAPSHOT_MAX_AGE_HOURS: float = 24
+
+    # All-in-one mode: run the shared background jobs inside the API process.
+    # Set to false when a separate `python -m backend worker` process is deployed.
+    RUN_SCHEDULER_IN_API: bool = True
+    # First runs of the startup jobs (Emby scan, search index, id backfill) wait this long
+    # plus a random jitter, so they do not compete with the first user requests and
+    # several processes do not start them in lockstep
+    STARTUP_JOB_DELAY_SECONDS: float = 30.0
+    STARTUP_JOB_JITTER_SECONDS: float = 30.0
+
+    # Leader election so scheduled jobs run once across uvicorn workers
+    LEADER_LEASE_SECONDS: int = 60
+
+    # Read notifications older than this are deleted by the retention job (0 keeps them forever)
+    NOTIFICATION_RETENTION_DAYS: int = 90
+    NOTIFICATION_PRUNE_BATCH_SIZE: int = 500
+    NOTIFICATION_PRUNE_INTERVAL_HOURS: int = 6
+
+    # Admin request statistics are cached in memory for at most this long
+    REQUEST_STATS_TTL_SECONDS: int = 60
+
+    # In-memory request status map used by list/detail enrichment; reloaded from the DB
+    # at most this often to pick up changes made by other processes (e.g. the worker)
+    SUBSCRIPTION_STATUS_TTL_SECONDS: int = 60
+
+    # Persistent work queue (external id lookups, ...)
+    WORK_QUEUE_INTERVAL_SECONDS: int = 30
+    WORK_QUEUE_BATCH_SIZE: int = 50
+    WORK_QUEUE_CONCURRENCY: int = 4
+    WORK_QUEUE_MAX_ATTEMPTS: int = 8
+    WORK_QUEUE_RETRY_BASE_SECONDS: int = 30
+    WORK_QUEUE_RETRY_MAX_SECONDS: int = 6 * 3600
+
+    # Scheduled job run ledger (GET /system/jobs): runs kept per job
+    JOB_RUNS_KEEP_PER_JOB: int = 200
+
+    # Logging: level, "text" or "json" output, and per-logger sampling of DEBUG lines,
+    # e.g. LOG_SAMPLE_RATES='{"backend.api.media": 0.1}' keeps one in ten
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
 
     # Proxy
     HTTP_PROXY: str | None = None
@@ -0,0 +1,28 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+import backend.models  # noqa: F401  (registers the tables on SQLModel.metadata)
+
+
+@pytest.fixture
+def engine():
+    """
+    Fresh in-memory database with every table; one shared connection, so sessions
+    opened on it (and code the engine is patched into) all see the same data.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        yield session
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api import deps, media
+from backend.main import app
+from backend.models import User
+from backend.services.admission import AdmissionControl, AdmissionRejected
+
+
+def test_queued_requests_are_served_round_robin_across_users():
+    async def run():
+        control = AdmissionControl(rate=100, burst=100, max_concurrent=1, max_queued_per_user=2, max_wait=5)
+        served = []
+
+        async def request(user_id):
+            await control.acquire(user_id, "search")
+            served.append(user_id)
+
+        await control.acquire("greedy", "search")
+        tasks = [asyncio.create_task(request(user)) for user in ("greedy", "greedy", "polite")]
+        await asyncio.sleep(0)
+        # A third waiting request of the same user is turned away
+        with pytest.raises(AdmissionRejected):
+            await control.acquire("greedy", "search")
+
+        for _ in range(3):
+            control.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        control.release()
+        return served, control.metrics()
+
+    served, metrics = asyncio.run(run())
+
+    assert served == ["greedy", "polite", "greedy"]
+    assert metrics["active"] == 0
+    assert metrics["rejected"] == {"search": 1}
+
+
+def test_user_over_quota_gets_429_with_retry_after(monkeypatch):
+    async def fake_search(query, page):
+        return {"results": [], "total_pages": 1}
+
+    monkeypatch.setattr(deps, "admission", AdmissionControl(rate=0.1, burst=1))
+    monkeypatch.setattr(media.tmdb_client, "search", fake_search)
+    app.dependency_overrides[deps.get_current_user] = lambda: User(id="u1", name="Tester")
+    try:
+        client = TestClient(app)
+        assert client.get("/api/v1/media/search", params={"query": "x"}).status_code == 200
+        response = client.get("/api/v1/media/search", params={"query": "x"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 10
+
+
+def test_person_credit_windows_are_admitted_per_user(monkeypatch):
+    async def fake_person(person_id, max_age=None):
+        return {"id": person_id, "combined_credits": {"cast": [], "crew": []}}
+
+    control = AdmissionControl(rate=0.1, burst=1)
+    monkeypatch.setattr(deps, "admission", control)
+    monkeypatch.setattr(media.tmdb_client, "get_person_details", fake_person)
+    app.dependency_overrides[deps.get_current_user] = lambda: User(id="u1", name="Tester")
+    try:
+        client = TestClient(app)
+        assert client.get("/api/v1/media/person/7/credits").status_code == 200
+        response = client.get("/api/v1/media/person/7/credits", params={"offset": 40})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 429
+    assert control.metrics()["rejected"] == {"person_credits": 1}
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api import deps
+from backend.main import app
+from backend.models import User
+from backend.services import tmdb
+from backend.services.feed import UPSTREAM_MAX_PAGE, UPSTREAM_PAGE_SIZE, InvalidCursorError, decode_cursor, encode_cursor
+
+
+def _fake_discover(monkeypatch, sizes):
+    """
+    Two discover listings with strictly decreasing popularity; records fetched pages.
+    """
+    fetched = []
+
+    async def fake_get(url, params):
+        media_type = url.rsplit("/", 1)[-1]
+        page = params["page"]
+        fetched.append((media_type, page))
+        total = sizes[media_type]
+        start = (page - 1) * 20
+        results = [
+            {"id": f"{media_type}-{i}", "popularity": 1000 - i * (1.0 if media_type == "tv" else 1.5)}
+            for i in range(start, min(start + 20, total))
+        ]
+        return {"results": results, "total_pages": (total + 19) // 20}
+
+    monkeypatch.setattr(tmdb.tmdb_client, "_get", fake_get)
+    return fetched
+
+
+def _expected(sizes):
+    items = [
+        (1000 - i * (1.0 if media_type == "tv" else 1.5), f"{media_type}-{i}")
+        for media_type, total in sizes.items()
+        for i in range(total)
+    ]
+    return [item_id for _, item_id in sorted(items, key=lambda x: -x[0])]
+
+
+def test_cursor_walk_returns_every_item_once_in_popularity_order(monkeypatch):
+    sizes = {"tv": 45, "movie": 30}
+    _fake_discover(monkeypatch, sizes)
+
+    seen, cursor = [], None
+    while True:
+        data = asyncio.run(tmdb.tmdb_client.get_anime(cursor=cursor))
+        seen += [item["id"] for item in data["results"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == _expected(sizes)
+    assert all(item_id.startswith(("tv-", "movie-")) for item_id in seen)
+
+
+def test_page_number_is_a_continuation_and_fetches_lazily(monkeypatch):
+    sizes = {"tv": 100, "movie": 100}
+    fetched = _fake_discover(monkeypatch, sizes)
+
+    page1 = asyncio.run(tmdb.tmdb_client.get_anime(page=1))
+    assert sorted(fetched) == [("movie", 1), ("tv", 1)]
+
+    page2 = asyncio.run(tmdb.tmdb_client.get_anime(page=2))
+    ids = [item["id"] for item in page1["results"] + page2["results"]]
+    assert ids == _expected(sizes)[:40]
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", 2)
+
+
+def test_cursor_offsets_past_the_upstream_page_cap_are_rejected():
+    last = UPSTREAM_MAX_PAGE * UPSTREAM_PAGE_SIZE - 1
+    assert decode_cursor(encode_cursor([last, 0]), 2) == [last, 0]
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor([last + 1, 0]), 2)
+
+
+def test_deep_page_numbers_need_a_cursor(monkeypatch):
+    _fake_discover(monkeypatch, {"tv": 20, "movie": 20})
+    app.dependency_overrides[deps.get_current_user] = lambda: User(id="u1", name="Tester")
+    try:
+        client = TestClient(app)
+        deepest = tmdb.settings.ANIME_MAX_PAGE_WITHOUT_CURSOR
+        assert client.get("/api/v1/media/anime", params={"page": deepest}).status_code == 200
+        assert client.get("/api/v1/media/anime", params={"page": deepest + 1}).status_code == 422
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx
+import pytest
+
+from backend.services.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+def _response(status_code, payload=None):
+    request = httpx.Request("GET", "http://tmdb/trending")
+    return httpx.Response(status_code, json=payload or {}, request=request)
+
+
+def test_opens_after_errors_and_serves_last_good():
+    async def run():
+        breaker = CircuitBreaker("tmdb", error_rate=0.5, min_calls=2, open_seconds=60)
+        calls = []
+
+        async def ok():
+            calls.append("ok")
+            return _response(200, {"results": [1]})
+
+        async def down():
+            calls.append("down")
+            raise httpx.ConnectTimeout("timed out")
+
+        assert await breaker.call(ok, "trending") == {"results": [1]}
+
+        # Failures are answered from the last good body while it exists
+        assert await breaker.call(down, "trending") == {"results": [1]}
+        assert await breaker.call(down, "trending") == {"results": [1]}
+        assert breaker.state == CircuitState.OPEN
+
+        # Open: no upstream call at all
+        calls.clear()
+        result = await breaker.call(ok, "trending")
+        result["results"].append(2)  # callers may mutate what they get back
+        assert await breaker.call(ok, "trending") == {"results": [1]}
+        assert calls == []
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(ok, "search")
+
+    asyncio.run(run())
+
+
+def test_half_open_probe_closes_circuit():
+    async def run():
+        breaker = CircuitBreaker("emby", min_calls=1, open_seconds=0)
+
+        async def fail():
+            return _response(502)
+
+        async def ok():
+            return _response(200, {"Items": []})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call(fail)
+        assert breaker.state == CircuitState.OPEN
+
+        assert await breaker.call(ok) == {"Items": []}
+        assert breaker.state == CircuitState.CLOSED
+
+    asyncio.run(run())
+
+
+def test_client_errors_do_not_trip_the_circuit():
+    async def run():
+        breaker = CircuitBreaker("tmdb", min_calls=1)
+
+        async def not_found():
+            return _response(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call(not_found)
+        assert breaker.state == CircuitState.CLOSED
+
+    asyncio.run(run())
+
+
+def test_calls_admitted_before_opening_do_not_settle_the_probe():
+    async def run():
+        breaker = CircuitBreaker("emby", min_calls=1, open_seconds=0)
+        release_stale = asyncio.Event()
+        release_probe = asyncio.Event()
+
+        async def slow_fail():
+            await release_stale.wait()
+            return _response(502)
+
+        async def fail():
+            return _response(502)
+
+        async def probe():
+            await release_probe.wait()
+            return _response(200, {"Items": []})
+
+        # Admitted while closed, still running when the circuit opens and the probe starts
+        stale_call = asyncio.create_task(breaker.call(slow_fail))
+        await asyncio.sleep(0)
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call(fail)
+        probe_call = asyncio.create_task(breaker.call(probe))
+        await asyncio.sleep(0)
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        release_stale.set()
+        with pytest.raises(httpx.HTTPStatusError):
+            await stale_call
+        # Neither re-opened nor a second probe let through
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(fail)
+
+        release_probe.set()
+        assert await probe_call == {"Items": []}
+        assert breaker.state == CircuitState.CLOSED
+
+    asyncio.run(run())
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlmodel import select
+
+from backend.api import requests as requests_api
+from backend.jobs import dispatch_downloads
+from backend.models import DispatchStatus, SubscriptionRequest, SubscriptionStatus, User, UserRole, WorkItem
+from backend.services.downloader import HttpDownloaderAdapter
+from backend.services.work_queue import work_queue
+
+
+class StandInDownloader(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.received.append((self.headers.get("Authorization"), body))
+        self.send_response(503 if self.server.down else 200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_approved_requests_are_dispatched_in_batches_with_retries(monkeypatch, session):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInDownloader)
+    server.received, server.down = [], True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/hook"
+    monkeypatch.setattr(
+        dispatch_downloads.downloader_module, "downloader", HttpDownloaderAdapter(url, token="secret", max_batch_size=2)
+    )
+
+    for i in range(3):
+        session.add(SubscriptionRequest(user_id="u1", tmdb_id=str(100 + i), media_type="movie", title=f"Movie {i}"))
+    session.commit()
+    admin = User(id="admin", name="Admin", role=UserRole.ADMIN)
+    for request in session.exec(select(SubscriptionRequest)).all():
+        requests_api.approve_request(request.id, current_user=admin, session=session)
+
+    try:
+        # Downloader down: nothing delivered, everything stays queued for a retry
+        assert asyncio.run(work_queue.process(session, dispatch_downloads.DISPATCH)) == 3
+        assert {r.dispatch_status for r in session.exec(select(SubscriptionRequest)).all()} == {DispatchStatus.QUEUED}
+
+        server.down = False
+        for item in session.exec(select(WorkItem)).all():
+            item.next_attempt_at = datetime.utcnow()
+            session.add(item)
+        session.commit()
+        server.received.clear()
+        asyncio.run(work_queue.process(session, dispatch_downloads.DISPATCH))
+    finally:
+        server.shutdown()
+
+    assert sorted(len(body["requests"]) for _, body in server.received) == [1, 2]
+    assert {auth for auth, _ in server.received} == {"Bearer secret"}
+    sent = sorted(r["tmdb_id"] for _, body in server.received for r in body["requests"])
+    assert sent == ["100", "101", "102"]
+    for request in session.exec(select(SubscriptionRequest)).all():
+        assert request.status == SubscriptionStatus.APPROVED
+        assert request.dispatch_status == DispatchStatus.DELIVERED
+        assert request.dispatched_at is not None
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx
+
+from backend.services.cache import make_key
+from backend.services.circuit_breaker import CircuitBreaker, CircuitState
+from backend.services.emby import EmbyClient, EmbyServers
+
+
+def _servers(monkeypatch, delays):
+    clients = []
+    for name, delay in delays.items():
+        client = EmbyClient(name=name, base_url=f"http://{name}.local")
+
+        async def fake_search(provider_ids, item_types=None, name=name, delay=delay):
+            await asyncio.sleep(delay)
+            if delay:
+                raise httpx.ReadTimeout("timed out")
+            return [{"Id": f"{name}-1", "Type": "Series", "ProviderIds": {"Tmdb": provider_ids["Tmdb"]}}]
+
+        monkeypatch.setattr(client, "search_by_any_provider_id", fake_search)
+        clients.append(client)
+    return EmbyServers(clients)
+
+
+def test_fan_out_merges_servers_and_drops_slow_one(monkeypatch):
+    servers = _servers(monkeypatch, {"4k": 0, "hd": 0, "slow": 0.1})
+
+    items = asyncio.run(servers.search_by_any_provider_id({"Tmdb": "42"}))
+
+    assert sorted((item["Server"], item["Id"]) for item in items) == [("4k", "4k-1"), ("hd", "hd-1")]
+    assert servers.server("hd").base_url == "http://hd.local"
+
+
+def test_fan_out_raises_when_no_server_answers(monkeypatch):
+    servers = _servers(monkeypatch, {"slow": 0.1, "slower": 0.1})
+
+    try:
+        asyncio.run(servers.search_by_any_provider_id({"Tmdb": "42"}))
+    except httpx.ReadTimeout:
+        pass
+    else:
+        raise AssertionError("expected a timeout")
+
+
+class SlowEmby(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(1)
+        try:
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'{"Items": []}')
+        except OSError:
+            # The client gave up first
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def test_slow_server_counts_against_breaker_and_serves_last_good():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowEmby)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    breaker = CircuitBreaker("emby:test", min_calls=1)
+    client = EmbyClient(name="only", base_url=base_url, breaker=breaker, timeout=0.2)
+    servers = EmbyServers([client])
+    url = f"{base_url}/Items"
+    params = {"Recursive": "true", "AnyProviderIdEquals": "Tmdb.42", "Fields": "ProviderIds"}
+    stale = b'{"Items": [{"Id": "cached", "ProviderIds": {"Tmdb": "42"}}]}'
+    breaker.last_good.set(make_key(url, params), stale)
+
+    async def run():
+        try:
+            return await servers.search_by_provider_id("Tmdb", "42")
+        finally:
+            await servers.aclose()
+
+    try:
+        items = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert [item["Id"] for item in items] == ["cached"]
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.stale_served == 1
+
+
+def test_provider_id_search_can_be_limited_to_the_title_type():
+    sent = []
+
+    def handler(request):
+        sent.append(dict(request.url.params))
+        return httpx.Response(200, json={"Items": []})
+
+    client = EmbyClient(name="only", base_url="http://emby.local", breaker=CircuitBreaker("emby:types"))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    asyncio.run(client.search_by_any_provider_id({"Tmdb": "42", "Tvdb": "77"}, item_types="Series"))
+
+    assert sent[0]["AnyProviderIdEquals"] == "Tmdb.42,Tvdb.77"
+    assert sent[0]["IncludeItemTypes"] == "Series"
@@ -0,0 +1,67 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+from sqlmodel import Session, select
+
+from backend.api import system
+from backend.models import JobRun, JobRunStatus, User, UserRole
+from backend.services import job_runs
+from backend.services.job_runs import JobLedger, percentile
+
+
+def test_runs_are_recorded_with_counters_and_bounded(monkeypatch, engine):
+    monkeypatch.setattr(job_runs, "engine", engine)
+    ledger = JobLedger(keep_per_job=3)
+
+    @ledger.instrument("scan")
+    async def scan(n):
+        job_runs.count("items_scanned", n)
+
+        async def lookup():
+            job_runs.count("upstream_calls")
+
+        # Counters are shared with tasks the job spawns
+        await asyncio.gather(lookup(), lookup())
+        job_runs.count("matches")
+
+    @ledger.instrument("broken")
+    async def broken():
+        job_runs.count("errors")
+        raise RuntimeError("emby down")
+
+    for n in range(5):
+        asyncio.run(scan(n))
+    with pytest.raises(RuntimeError):
+        asyncio.run(broken())
+    ledger.record_skipped("scan")
+    # Outside a job counting is a no-op
+    job_runs.count("matches")
+
+    with Session(engine) as session:
+        scans = session.exec(select(JobRun).where(JobRun.job_id == "scan").order_by(JobRun.id)).all()
+        assert [r.status for r in scans] == [JobRunStatus.OK, JobRunStatus.OK, JobRunStatus.SKIPPED]
+        assert [(r.items_scanned, r.upstream_calls, r.matches) for r in scans[:2]] == [(3, 2, 1), (4, 2, 1)]
+        assert scans[0].duration_ms >= 0
+        failed = session.exec(select(JobRun).where(JobRun.job_id == "broken")).one()
+        assert failed.status == JobRunStatus.ERROR
+        assert failed.errors == 1
+        assert "emby down" in failed.error
+
+        monkeypatch.setattr(system, "job_ledger", ledger)
+        admin = User(id="admin", name="Admin", role=UserRole.ADMIN)
+        jobs = {job["job_id"]: job for job in system.read_jobs(recent=2, current_user=admin, session=session)["jobs"]}
+    assert jobs["scan"]["skipped"] == 1
+    assert len(jobs["scan"]["recent"]) == 2
+    assert jobs["broken"]["errors"] == 1
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) is None
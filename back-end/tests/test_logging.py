@@ -0,0 +1,82 @@
+import asyncio
+import io
+import json
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueListener
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backend.core.logging import (
+    DeferredQueueHandler,
+    JsonFormatter,
+    RequestIdFilter,
+    RequestIdMiddleware,
+    SamplingFilter,
+    request_id_var,
+)
+
+
+def _record(name, level=logging.DEBUG):
+    return logging.LogRecord(name, level, __file__, 1, "msg", (), None)
+
+
+def test_sampling_keeps_a_fraction_of_debug_lines_per_logger():
+    sampler = SamplingFilter({"backend.api": 0.25, "backend.jobs.noisy": 0})
+
+    kept = [sampler.filter(_record("backend.api.media")) for _ in range(8)]
+
+    assert kept.count(True) == 2
+    assert sampler.filter(_record("backend.api.media", logging.WARNING))
+    assert not sampler.filter(_record("backend.jobs.noisy"))
+    assert sampler.filter(_record("backend.services.tmdb"))
+
+
+def test_middleware_exposes_request_id_to_logs_and_response():
+    seen = {}
+
+    async def app(scope, receive, send):
+        record = _record("backend.api.media")
+        RequestIdFilter().filter(record)
+        seen["request_id"] = record.request_id
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"x-request-id", b"abc123")]}
+    asyncio.run(RequestIdMiddleware(app)(scope, None, send))
+
+    assert seen["request_id"] == "abc123"
+    assert (b"x-request-id", b"abc123") in sent[0]["headers"]
+    assert request_id_var.get() == "-"
+
+
+def test_queued_records_keep_the_exception_for_the_json_formatter():
+    log_queue = queue.SimpleQueue()
+    stream = io.StringIO()
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter())
+    listener = QueueListener(log_queue, output)
+    logger = logging.getLogger("backend.test.deferred")
+    logger.propagate = False
+    handler = DeferredQueueHandler(log_queue)
+    logger.addHandler(handler)
+    listener.start()
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Job %s failed", 42)
+    finally:
+        listener.stop()
+        logger.removeHandler(handler)
+
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "Job 42 failed"
+    assert "ValueError: boom" in entry["exc_info"]
+    assert "Traceback" not in entry["message"]
@@ -0,0 +1,156 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from backend.api import media
+from backend.models import SubscriptionRequest, SubscriptionStatus, User
+from backend.services.subscription_status import SubscriptionStatusMap
+
+
+def test_get_details_runs_upstream_calls_concurrently(monkeypatch, session):
+    calls = []
+    release_tmdb = None
+
+    async def fake_get_details(media_type, tmdb_id):
+        calls.append("tmdb")
+        await release_tmdb.wait()
+        return {"id": 42, "name": "Show", "seasons": [{"season_number": 1}, {"season_number": 2}]}
+
+    async def fake_search(provider, provider_id):
+        calls.append("emby_lookup")
+        return [{"Id": "emby-42"}]
+
+    async def fake_item_details(item_id, server=None):
+        calls.append("item_details")
+        return {"MediaStreams": []}
+
+    async def fake_episodes(series_id, season_number=None, server=None):
+        calls.append("episodes")
+        # The Emby branch finishes while TMDB is still in flight
+        release_tmdb.set()
+        return [{"ParentIndexNumber": 1}, {"ParentIndexNumber": 1}]
+
+    monkeypatch.setattr(media.tmdb_client, "get_details", fake_get_details)
+    monkeypatch.setattr(media.emby_client, "search_by_provider_id", fake_search)
+    monkeypatch.setattr(media.emby_client, "get_item_details", fake_item_details)
+    monkeypatch.setattr(media.emby_client, "get_episodes", fake_episodes)
+    monkeypatch.setattr(media, "subscription_status", SubscriptionStatusMap())
+
+    session.add(User(id="u1", name="Tester"))
+    session.add(SubscriptionRequest(
+        user_id="u1", tmdb_id="42", media_type="tv", title="Show",
+        specific_season=2, status=SubscriptionStatus.PENDING,
+    ))
+    session.commit()
+
+    async def run():
+        nonlocal release_tmdb
+        release_tmdb = asyncio.Event()
+        return await media.get_details("tv", "42", current_user=User(id="u1", name="Tester"), session=session)
+
+    data = asyncio.run(run())
+
+    assert calls.count("emby_lookup") == 1
+    assert data["status"] == "AVAILABLE"
+    assert data["emby_id"] == "emby-42"
+    assert data["seasons"][0]["existing_episode_count"] == 2
+    assert data["seasons"][1]["subscription_status"] == "PENDING"
+
+
+def test_status_lookup_failure_starts_no_upstream_calls(monkeypatch):
+    started = []
+
+    async def fake_get_details(media_type, tmdb_id):
+        started.append(tmdb_id)
+        return {"id": tmdb_id}
+
+    def broken_lookup(session, tmdb_id):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(media.tmdb_client, "get_details", fake_get_details)
+    monkeypatch.setattr(media, "subscription_status", SubscriptionStatusMap())
+    monkeypatch.setattr(media.subscription_status, "get", broken_lookup)
+    monkeypatch.setattr(media.subscription_status, "primary", broken_lookup)
+    user = User(id="u1", name="Tester")
+    batch = media.DetailsBatchIn(items=[{"media_type": "movie", "tmdb_id": "1"}])
+
+    async def run():
+        for call in (media.get_details("movie", "1", current_user=user, session=None),
+                     media.get_details_batch(batch, current_user=user, session=None)):
+            with pytest.raises(RuntimeError):
+                await call
+        await asyncio.sleep(0)
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+    assert started == []
+
+
+def test_get_details_skips_slow_media_info(monkeypatch, session):
+    async def fake_get_details(media_type, tmdb_id):
+        return {"id": 7, "title": "Movie"}
+
+    async def fake_search(provider, provider_id):
+        return [{"Id": "emby-7"}]
+
+    async def slow_item_details(item_id, server=None):
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(media.tmdb_client, "get_details", fake_get_details)
+    monkeypatch.setattr(media.emby_client, "search_by_provider_id", fake_search)
+    monkeypatch.setattr(media.emby_client, "get_item_details", slow_item_details)
+    monkeypatch.setattr(media.settings, "DETAILS_MEDIA_INFO_BUDGET_SECONDS", 0.05)
+
+    data = asyncio.run(media.get_details("movie", "7", current_user=User(id="u1", name="Tester"), session=session))
+
+    assert data["status"] == "AVAILABLE"
+    assert "media_info" not in data
+
+
+def test_details_batch_uses_one_emby_query_and_keeps_order(monkeypatch, session):
+    emby_queries = []
+
+    async def fake_get_details(media_type, tmdb_id):
+        if tmdb_id == "404":
+            request = httpx.Request("GET", "https://tmdb.test")
+            raise httpx.HTTPStatusError("missing", request=request, response=httpx.Response(404, request=request))
+        return {"id": int(tmdb_id), "title": f"Item {tmdb_id}", "credits": {"cast": []}}
+
+    async def fake_emby_get(url, params=None):
+        emby_queries.append(params["AnyProviderIdEquals"])
+        return {"Items": [{"Id": "emby-1", "ProviderIds": {"Tmdb": "1"}}]}
+
+    monkeypatch.setattr(media.tmdb_client, "get_details", fake_get_details)
+    monkeypatch.setattr(media.emby_client.servers[0], "_get", fake_emby_get)
+    monkeypatch.setattr(media, "subscription_status", SubscriptionStatusMap())
+
+    session.add(User(id="u1", name="Tester"))
+    session.add(SubscriptionRequest(
+        user_id="u1", tmdb_id="2", media_type="movie", title="Item 2", status=SubscriptionStatus.APPROVED,
+    ))
+    session.commit()
+
+    batch = media.DetailsBatchIn(items=[
+        {"media_type": "movie", "tmdb_id": "2"},
+        {"media_type": "series", "tmdb_id": "404"},
+        {"media_type": "movie", "tmdb_id": "1"},
+    ])
+    data = asyncio.run(media.get_details_batch(batch, current_user=User(id="u1", name="Tester"), session=session))
+
+    assert emby_queries == ["Tmdb.2,Tmdb.404,Tmdb.1"]
+    assert [item["id"] for item in data["results"]] == ["2", "404", "1"]
+    assert data["results"][0]["status"] == "APPROVED"
+    assert data["results"][1] == {"media_type": "tv", "id": "404", "error": "not_found"}
+    assert data["results"][2]["status"] == "AVAILABLE"
+    assert "credits" not in data["results"][2]
+
+
+def test_details_batch_rejects_oversized_batches():
+    with pytest.raises(ValidationError):
+        media.DetailsBatchIn(items=[{"media_type": "movie", "tmdb_id": str(i)} for i in range(51)])
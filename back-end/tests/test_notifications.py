@@ -0,0 +1,166 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlmodel import Session, select
+
+from backend.api import notifications
+from backend.jobs import check_media
+from backend.jobs.prune_notifications import prune_notifications
+from backend.models import Notification, SubscriptionRequest, SubscriptionStatus, User
+
+
+def test_completed_requests_are_written_in_one_commit(monkeypatch, engine):
+    with Session(engine) as session:
+        session.add(User(id="u1", name="Tester"))
+        for tmdb_id in ("1", "2", "3"):
+            session.add(SubscriptionRequest(
+                user_id="u1", tmdb_id=tmdb_id, media_type="movie", title=f"Movie {tmdb_id}",
+                status=SubscriptionStatus.APPROVED,
+            ))
+        session.commit()
+
+    async def fake_search(provider_ids, item_types=None):
+        tmdb_id = provider_ids["Tmdb"]
+        return [{"Id": f"emby-{tmdb_id}", "Type": "Movie"}] if tmdb_id != "3" else []
+
+    commits = []
+    original_commit = Session.commit
+
+    def counting_commit(self):
+        commits.append(1)
+        return original_commit(self)
+
+    monkeypatch.setattr(check_media, "engine", engine)
+    monkeypatch.setattr(check_media.emby_client, "search_by_any_provider_id", fake_search)
+    monkeypatch.setattr(Session, "commit", counting_commit)
+
+    asyncio.run(check_media.check_new_media_job())
+
+    assert len(commits) == 1
+    with Session(engine) as session:
+        notes = session.exec(select(Notification)).all()
+        statuses = {r.tmdb_id: r.status for r in session.exec(select(SubscriptionRequest)).all()}
+    assert sorted(n.related_subscription_id for n in notes) == [1, 2]
+    assert statuses == {"1": SubscriptionStatus.COMPLETED, "2": SubscriptionStatus.COMPLETED, "3": SubscriptionStatus.APPROVED}
+
+
+def test_prune_deletes_only_old_read_notifications_in_batches(engine):
+    old = datetime.utcnow() - timedelta(days=100)
+    with Session(engine) as session:
+        session.add(User(id="u1", name="Tester"))
+        for i in range(5):
+            session.add(Notification(user_id="u1", title="t", message=f"old read {i}", is_read=True, created_at=old))
+        session.add(Notification(user_id="u1", title="t", message="old unread", is_read=False, created_at=old))
+        session.add(Notification(user_id="u1", title="t", message="new read", is_read=True))
+        session.commit()
+
+        deleted = prune_notifications(session, datetime.utcnow() - timedelta(days=90), batch_size=2)
+
+        assert deleted == 5
+        assert sorted(n.message for n in session.exec(select(Notification)).all()) == ["new read", "old unread"]
+
+
+def test_mark_all_read_only_touches_current_user(engine):
+    with Session(engine) as session:
+        session.add(User(id="u1", name="Tester"))
+        session.add(User(id="u2", name="Other"))
+        session.add(Notification(user_id="u1", title="t", message="a"))
+        session.add(Notification(user_id="u1", title="t", message="b"))
+        session.add(Notification(user_id="u2", title="t", message="c"))
+        session.commit()
+
+        result = notifications.mark_all_read(current_user=User(id="u1", name="Tester"), session=session)
+
+        assert result == {"updated": 2}
+        unread = session.exec(select(Notification).where(Notification.is_read == False)).all()
+        assert [n.user_id for n in unread] == ["u2"]
+
+
+def test_series_requests_complete_per_season_with_one_fetch_per_series(monkeypatch, engine):
+    with Session(engine) as session:
+        session.add(User(id="u1", name="Tester"))
+        for season in (1, 2, None):
+            session.add(SubscriptionRequest(
+                user_id="u1", tmdb_id="77", media_type="tv", title="Show",
+                specific_season=season, status=SubscriptionStatus.APPROVED,
+            ))
+        session.commit()
+
+    calls = []
+
+    async def fake_search(provider_ids, item_types=None):
+        calls.append("search")
+        return [{"Id": "ep-1", "Type": "Episode"}, {"Id": "series-77", "Type": "Series"}]
+
+    async def fake_details(media_type, tmdb_id):
+        calls.append("tmdb")
+        return {"seasons": [
+            {"season_number": 0, "episode_count": 3},
+            {"season_number": 1, "episode_count": 2},
+            {"season_number": 2, "episode_count": 3},
+        ]}
+
+    async def fake_episodes(series_id, season_number=None, server=None):
+        calls.append(("episodes", series_id))
+        # Season 1 complete (episode 2 in two versions), season 2 still airing
+        return [
+            {"ParentIndexNumber": 1, "IndexNumber": 1},
+            {"ParentIndexNumber": 1, "IndexNumber": 2},
+            {"ParentIndexNumber": 1, "IndexNumber": 2},
+            {"ParentIndexNumber": 2, "IndexNumber": 1},
+        ]
+
+    monkeypatch.setattr(check_media, "engine", engine)
+    monkeypatch.setattr(check_media.emby_client, "search_by_any_provider_id", fake_search)
+    monkeypatch.setattr(check_media.emby_client, "get_episodes", fake_episodes)
+    monkeypatch.setattr(check_media.tmdb_client, "get_details", fake_details)
+
+    asyncio.run(check_media.check_new_media_job())
+
+    assert sorted(map(str, calls)) == sorted(map(str, ["search", "tmdb", ("episodes", "series-77")]))
+    with Session(engine) as session:
+        statuses = {r.specific_season: r.status for r in session.exec(select(SubscriptionRequest)).all()}
+    assert statuses == {
+        1: SubscriptionStatus.COMPLETED,
+        2: SubscriptionStatus.APPROVED,
+        None: SubscriptionStatus.APPROVED,
+    }
+
+
+def test_items_of_another_type_sharing_a_provider_id_complete_nothing(monkeypatch, engine):
+    with Session(engine) as session:
+        session.add(User(id="u1", name="Tester"))
+        session.add(SubscriptionRequest(
+            user_id="u1", tmdb_id="5", media_type="movie", title="Movie", status=SubscriptionStatus.APPROVED,
+        ))
+        session.add(SubscriptionRequest(
+            user_id="u1", tmdb_id="6", media_type="tv", title="Show", status=SubscriptionStatus.APPROVED,
+        ))
+        session.commit()
+
+    fetched = []
+
+    async def fake_search(provider_ids, item_types=None):
+        # Episodes and movies can carry the same Imdb/Tvdb ids as the requested title
+        if provider_ids["Tmdb"] == "5":
+            return [{"Id": "ep-5", "Type": "Episode"}]
+        return [{"Id": "movie-6", "Type": "Movie"}, {"Id": "season-6", "Type": "Season"}]
+
+    async def fake_episodes(series_id, season_number=None, server=None):
+        fetched.append(series_id)
+        return []
+
+    monkeypatch.setattr(check_media, "engine", engine)
+    monkeypatch.setattr(check_media.emby_client, "search_by_any_provider_id", fake_search)
+    monkeypatch.setattr(check_media.emby_client, "get_episodes", fake_episodes)
+
+    asyncio.run(check_media.check_new_media_job())
+
+    assert fetched == []
+    with Session(engine) as session:
+        assert session.exec(select(Notification)).all() == []
+        assert {r.status for r in session.exec(select(SubscriptionRequest)).all()} == {SubscriptionStatus.APPROVED}
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backend.api import media
+from backend.models import User
+from backend.services.subscription_status import SubscriptionStatusMap
+
+PERSON = {
+    "id": 7,
+    "combined_credits": {
+        "cast": [
+            {"id": 1, "media_type": "movie", "popularity": 5},
+            {"id": 2, "media_type": "tv", "popularity": 50},
+            {"id": 3, "media_type": "movie", "popularity": 20},
+            {"id": 9, "media_type": "person", "popularity": 99},
+        ],
+        "crew": [
+            {"id": 1, "media_type": "movie", "popularity": 5},
+            {"id": 4, "media_type": "movie", "popularity": 30},
+        ],
+    },
+}
+
+
+def _credits(monkeypatch, **params):
+    async def fake_person(person_id, max_age=None):
+        return PERSON
+
+    async def no_emby_items(tmdb_id):
+        return []
+
+    monkeypatch.setattr(media.tmdb_client, "get_person_details", fake_person)
+    monkeypatch.setattr(media, "lookup_emby_items", no_emby_items)
+    monkeypatch.setattr(media, "subscription_status", SubscriptionStatusMap())
+    monkeypatch.setattr(media.subscription_status, "_ensure_loaded", lambda session: None)
+    params = {"offset": 0, "limit": 40, "credit_type": "all", "profile": None, "fields": None, **params}
+    return asyncio.run(media.get_person_credits("7", current_user=User(id="u1", name="Tester"), session=None, **params))
+
+
+def test_windows_follow_collect_person_credits_order(monkeypatch):
+    expected = [str(item["id"]) for item in media.collect_person_credits(PERSON)]
+    assert expected == ["2", "4", "3", "1"]
+
+    first = _credits(monkeypatch, limit=3)
+    assert [str(item["id"]) for item in first["results"]] == expected[:3]
+    assert first["total"] == 4
+    assert first["next_offset"] == 3
+    assert all(item["status"] == "UNKNOWN" for item in first["results"])
+
+    last = _credits(monkeypatch, offset=first["next_offset"], limit=3)
+    assert [str(item["id"]) for item in last["results"]] == expected[3:]
+    assert last["next_offset"] is None
+
+
+def test_window_ending_exactly_at_the_end_has_no_next_offset(monkeypatch):
+    assert _credits(monkeypatch, offset=2, limit=2)["next_offset"] is None
+    assert _credits(monkeypatch, offset=4, limit=2)["results"] == []
+
+
+def test_credit_type_filters_cast_and_crew(monkeypatch):
+    cast = _credits(monkeypatch, credit_type="cast")
+    crew = _credits(monkeypatch, credit_type="crew")
+
+    assert [item["id"] for item in cast["results"]] == [2, 3, 1]
+    assert [item["id"] for item in crew["results"]] == [4, 1]
+    assert crew["total"] == 2
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlmodel import Session
+
+from backend.api import media
+from backend.models import User
+from backend.services.prefetch import Prefetcher
+from backend.services.rate_limit import Priority, current_priority
+
+
+def test_search_prefetches_next_page_and_top_details_in_background(monkeypatch, engine):
+    calls = []
+
+    async def fake_search(query, page):
+        calls.append(("search", page, current_priority()))
+        return {
+            "results": [{"id": i, "media_type": "movie", "title": f"Movie {i}"} for i in range(1, 11)],
+            "total_pages": 3,
+        }
+
+    async def fake_details(media_type, tmdb_id):
+        calls.append(("details", tmdb_id, current_priority()))
+        return {}
+
+    async def no_emby(tmdb_id):
+        return []
+
+    monkeypatch.setattr(media.tmdb_client, "search", fake_search)
+    monkeypatch.setattr(media.tmdb_client, "get_details", fake_details)
+    monkeypatch.setattr(media, "lookup_emby_items", no_emby)
+    monkeypatch.setattr(media.settings, "PREFETCH_DETAILS_COUNT", 2)
+    prefetcher = Prefetcher(enabled=True, concurrency=2, rate=100)
+    monkeypatch.setattr(media, "prefetcher", prefetcher)
+
+    async def run():
+        data = await media.search_media("movie", page=1, current_user=User(id="u1", name="Tester"), session=Session(engine))
+        await prefetcher.drain()
+        return data
+
+    data = asyncio.run(run())
+
+    assert len(data["results"]) == 10
+    assert calls[0] == ("search", 1, Priority.INTERACTIVE)
+    assert sorted(calls[1:]) == [
+        ("details", "1", Priority.BACKGROUND),
+        ("details", "2", Priority.BACKGROUND),
+        ("search", 2, Priority.BACKGROUND),
+    ]
+
+
+def test_prefetch_drops_work_over_budget_and_duplicates():
+    started = []
+
+    async def fetch():
+        started.append(1)
+        await asyncio.sleep(0.01)
+
+    async def run():
+        prefetcher = Prefetcher(enabled=True, concurrency=1, rate=2)
+        results = [prefetcher.schedule(key, fetch) for key in ("a", "a", "b", "c")]
+        await prefetcher.drain()
+        return prefetcher, results
+
+    prefetcher, results = asyncio.run(run())
+
+    assert results == [True, False, True, False]
+    assert len(started) == 2
+    assert prefetcher.metrics()["dropped"] == 1
+    assert not Prefetcher(enabled=False).schedule("a", fetch)
@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backend.services.projection import DETAIL, project, resolve_spec
+
+
+def test_detail_profile_drops_unused_fields_and_trims_credits():
+    payload = {
+        "id": 1,
+        "title": "Movie",
+        "production_companies": [{"id": 3, "logo_path": "/x.png"}],
+        "external_ids": {"imdb_id": "tt1", "facebook_id": "fb"},
+        "credits": {
+            "cast": [{"id": i, "name": f"Actor {i}", "character": "X", "credit_id": "c"} for i in range(100)],
+            "crew": [{"id": i, "name": f"Crew {i}", "job": "Director", "credit_id": "c"} for i in range(20)],
+        },
+    }
+
+    data = project(payload, DETAIL)
+
+    assert "production_companies" not in data
+    assert data["external_ids"] == {"imdb_id": "tt1"}
+    assert len(data["credits"]["cast"]) == 40
+    assert data["credits"]["cast"][0] == {"id": 0, "name": "Actor 0", "character": "X"}
+    assert len(data["credits"]["crew"]) == 6
+
+
+def test_fields_parameter_overrides_profile_and_keeps_ids():
+    spec = resolve_spec("detail", profile="card", fields="title,credits.cast.name")
+    payload = {"id": 1, "title": "Movie", "overview": "...", "credits": {"cast": [{"id": 2, "name": "A"}]}}
+
+    assert project(payload, spec) == {"id": 1, "title": "Movie", "credits": {"cast": [{"name": "A"}]}}
+    assert resolve_spec("card", profile="full") is None
@@ -0,0 +1,59 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx
+
+from backend.services.rate_limit import Priority, RateLimiter, background_priority, parse_retry_after
+
+
+def test_interactive_lane_is_served_before_background():
+    async def run():
+        limiter = RateLimiter("test", rate=50, burst=1)
+        order = []
+
+        async def call(tag, priority):
+            await limiter.acquire(priority)
+            order.append(tag)
+
+        await limiter.acquire()  # drain the burst so everyone queues
+        background = [asyncio.create_task(call(f"bg{i}", Priority.BACKGROUND)) for i in range(2)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("ui", Priority.INTERACTIVE))
+        await asyncio.gather(interactive, *background)
+
+        assert order == ["ui", "bg0", "bg1"]
+        metrics = limiter.metrics()
+        assert metrics["lanes"]["background"]["acquired"] == 2
+        assert metrics["lanes"]["interactive"]["queue_depth"] == 0
+
+    asyncio.run(run())
+
+
+def test_send_retries_429_after_retry_after():
+    async def run():
+        limiter = RateLimiter("test", rate=1000, burst=10, max_retries=2)
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+
+        async def fake_get(url):
+            return responses.pop(0)
+
+        with background_priority():
+            response = await limiter.send(fake_get, "http://tmdb/x")
+
+        assert response.status_code == 200
+        assert limiter.throttled == 1
+        assert limiter.metrics()["lanes"]["background"]["acquired"] == 2
+
+    asyncio.run(run())
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
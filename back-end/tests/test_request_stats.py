@@ -0,0 +1,60 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+from backend.models import SubscriptionRequest, SubscriptionStatus, User
+from backend.services.request_stats import RequestStats
+
+
+def test_stats_group_counts_and_median_time_to_complete(session):
+    now = datetime.utcnow()
+    session.add(User(id="u1", name="Alice"))
+    session.add(User(id="u2", name="Bob"))
+    for user_id, media_type, status, hours in [
+        ("u1", "movie", SubscriptionStatus.COMPLETED, 2),
+        ("u1", "series", SubscriptionStatus.COMPLETED, 10),
+        ("u1", "tv", SubscriptionStatus.COMPLETED, 4),
+        ("u2", "movie", SubscriptionStatus.PENDING, None),
+    ]:
+        session.add(SubscriptionRequest(
+            user_id=user_id, tmdb_id="1", media_type=media_type, title="x", status=status,
+            request_date=now - timedelta(hours=hours or 0),
+            completed_at=now if hours is not None else None,
+        ))
+    session.commit()
+
+    stats = RequestStats(days=7)
+    summary = stats.get(session)
+
+    assert summary["total"] == 4
+    assert summary["by_status"] == {"completed": 3, "pending": 1}
+    assert summary["by_media_type"] == {"movie": 2, "tv": 2}
+    assert summary["by_user"][0] == {"user_id": "u1", "user_name": "Alice", "total": 3, "by_status": {"completed": 3}}
+    assert summary["median_hours_to_complete"] == 4
+    assert len(summary["daily"]) == 7
+    assert sum(day["completed"] for day in summary["daily"]) == 3
+
+    # Served from the cached summary until invalidated
+    session.add(SubscriptionRequest(user_id="u2", tmdb_id="2", media_type="movie", title="y"))
+    session.commit()
+    assert stats.get(session)["total"] == 4
+    stats.invalidate()
+    assert stats.get(session)["total"] == 5
+
+
+def test_median_of_an_even_count_averages_the_middle_pair(session):
+    assert RequestStats(days=7).compute(session)["median_hours_to_complete"] is None
+
+    now = datetime.utcnow()
+    session.add(User(id="u1", name="Alice"))
+    for hours in (1, 3, 5, 100):
+        session.add(SubscriptionRequest(
+            user_id="u1", tmdb_id="1", media_type="movie", title="x", status=SubscriptionStatus.COMPLETED,
+            request_date=now - timedelta(hours=hours), completed_at=now,
+        ))
+    session.commit()
+
+    assert RequestStats(days=7).compute(session)["median_hours_to_complete"] == 4
@@ -0,0 +1,70 @@
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from starlette.responses import Response
+
+from backend.core import responses
+from backend.core.responses import FastJSONResponse, FastJSONRoute
+from backend.models import SubscriptionStatus
+
+CONTENT = {
+    "status": SubscriptionStatus.PENDING,
+    "request_date": datetime(2024, 1, 2, 3, 4, 5, 678901),
+    "release_date": date(2024, 1, 2),
+    "episodes_by_season": {1: 10, 2: 8},
+    "title": "千と千尋の神隠し",
+    "rating": 8.5,
+    "comment": None,
+    "items": [{"id": "1", "popularity": 12}],
+}
+
+
+def test_orjson_and_stdlib_encoders_produce_the_same_bytes(monkeypatch):
+    monkeypatch.setattr(responses.settings, "FAST_JSON", True)
+    fast = responses.dumps(CONTENT)
+    monkeypatch.setattr(responses.settings, "FAST_JSON", False)
+    stdlib = responses.dumps(CONTENT)
+
+    assert fast == stdlib
+    assert b'"status":"pending"' in fast
+    assert b'"request_date":"2024-01-02T03:04:05.678901"' in fast
+    assert b'"episodes_by_season":{"1":10,"2":8}' in fast
+
+
+def test_wrapped_routes_serve_json_and_pass_responses_through():
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.get("/data", response_class=FastJSONResponse)
+    async def data():
+        return CONTENT
+
+    @router.get("/sync", response_class=FastJSONResponse)
+    def sync_data():
+        return [{"id": 1}]
+
+    @router.get("/raw", response_class=FastJSONResponse)
+    async def raw():
+        return Response(content=b"raw body", media_type="text/plain", status_code=202)
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.get("/data")
+    assert response.status_code == 200
+    assert response.content == responses.dumps(CONTENT)
+    assert response.headers["content-type"] == "application/json"
+    assert client.get("/sync").json() == [{"id": 1}]
+
+    raw_response = client.get("/raw")
+    assert raw_response.status_code == 202
+    assert raw_response.content == b"raw body"
+    assert raw_response.headers["content-type"].startswith("text/plain")
+
+    # The endpoint functions themselves are left untouched
+    assert sync_data() == [{"id": 1}]
@@ -0,0 +1,80 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backend.services.search_index import SearchIndex
+
+
+def test_suggest_prefers_library_titles_and_matches_aliases():
+    index = SearchIndex()
+    index.add_tmdb_results([
+        {"id": 1, "media_type": "movie", "title": "星际穿越", "original_title": "Interstellar", "popularity": 80},
+        {"id": 2, "media_type": "movie", "title": "Interstate 60", "popularity": 5},
+        {"id": 3, "media_type": "person", "name": "Inter Person"},
+    ])
+    index.load_emby_library([
+        {"Id": "emby-2", "Type": "Movie", "Name": "Interstate 60", "ProviderIds": {"Tmdb": "2"}},
+    ])
+
+    results = index.suggest("inters")
+    assert [r["id"] for r in results] == [2, 1]
+    assert results[0]["status"] == "AVAILABLE"
+    assert results[0]["emby_id"] == "emby-2"
+    assert "status" not in results[1]
+
+    assert [r["id"] for r in index.suggest("星际")] == [1]
+    assert index.suggest("Person") == []
+
+
+def test_library_reload_drops_availability_and_eviction_keeps_library():
+    index = SearchIndex(max_entries=2)
+    index.load_emby_library([
+        {"Id": "emby-1", "Type": "Series", "Name": "Dark", "ProviderIds": {"Tmdb": "70523"}},
+    ])
+    index.add_tmdb_results([
+        {"id": 10, "media_type": "tv", "name": "Darkwing Duck"},
+        {"id": 11, "media_type": "tv", "name": "Dark Matter"},
+    ])
+    assert len(index) == 2
+    assert {r["id"] for r in index.suggest("dark")} == {70523, 11}
+
+    index.load_emby_library([])
+    assert "status" not in index.suggest("dark")[0]
+
+
+def test_suggest_is_safe_while_the_index_changes():
+    index = SearchIndex(max_entries=50)
+    stop = threading.Event()
+    errors = []
+
+    def churn():
+        i = 0
+        while not stop.is_set():
+            # Every batch evicts older entries that suggest may be scoring
+            index.add_tmdb_results([
+                {"id": i + n, "media_type": "movie", "title": f"Interstellar {i + n}"} for n in range(20)
+            ])
+            i += 20
+
+    def read():
+        try:
+            for _ in range(300):
+                index.suggest("interstellar")
+                index.suggest("in")
+        except Exception as e:
+            errors.append(e)
+
+    writer = threading.Thread(target=churn)
+    writer.start()
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    stop.set()
+    writer.join()
+
+    assert errors == []
+    assert len(index) <= 50
@@ -0,0 +1,82 @@
+import asyncio
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlmodel import Session
+
+from backend.models import SchedulerLease
+from backend.services import leader
+from backend.services.cache import ResponseCache, SQLiteCacheBackend
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = ResponseCache(backend=SQLiteCacheBackend(path, "tmdb", max_entries=2, prune_every=1))
+    reader = ResponseCache(backend=SQLiteCacheBackend(path, "tmdb", max_entries=2, prune_every=1))
+
+    writer.set("a", b'{"v": 1}')
+    assert reader.get("a") == {"v": 1}
+    assert reader.get("a", max_age=0) is None
+
+    writer.set("b", b"{}")
+    writer.set("c", b"{}")
+    assert len(reader) == 2
+
+
+def test_sqlite_cache_waits_for_a_locked_file_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResponseCache(backend=SQLiteCacheBackend(path, "tmdb", max_entries=10))
+    cache.set("a", b'{"v": 1}')
+    # Another worker holds the write lock for a while
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        cache.set_behind("b", b'{"v": 2}')
+        assert await cache.aget("a") == {"v": 1}
+        await asyncio.sleep(0.3)
+        other.execute("COMMIT")
+        await cache.drain()
+        ticker.cancel()
+        return ticks
+
+    ticks = asyncio.run(run())
+
+    assert ticks >= 10
+    assert cache.get("b") == {"v": 2}
+
+
+def test_only_one_process_holds_the_lease(monkeypatch, engine):
+    monkeypatch.setattr(leader, "engine", engine)
+
+    first = leader.LeaderElection(lease_seconds=60)
+    second = leader.LeaderElection(lease_seconds=60)
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.try_acquire()  # renewal
+
+    # The leader stops renewing: once the lease expires someone else takes over
+    with Session(engine) as session:
+        lease = session.get(SchedulerLease, "scheduler")
+        lease.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        session.add(lease)
+        session.commit()
+    assert second.try_acquire()
+    assert second.is_leader
+
+    second.release()
+    assert first.try_acquire()
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backend.services.cache import ResponseCache, MemoryCacheBackend
+from backend.services.circuit_breaker import CircuitBreaker
+from backend.services.search_index import SearchIndex
+from backend.services.snapshot import Snapshot
+
+
+def _breaker():
+    breaker = CircuitBreaker("tmdb")
+    breaker.last_good = ResponseCache(backend=MemoryCacheBackend(100))
+    return breaker
+
+
+def test_snapshot_round_trip_keeps_cache_ages(tmp_path):
+    path = str(tmp_path / "snapshot.json.gz")
+    breaker, index = _breaker(), SearchIndex()
+    now = time.time()
+    breaker.last_good.backend.set("fresh", b'{"v": 1}', stored_at=now - 10)
+    breaker.last_good.backend.set("old", b'{"v": 2}', stored_at=now - 600)
+    breaker.last_good.backend.set("expired", b'{"v": 3}', stored_at=now - 7200)
+    index.add_tmdb_results([{"id": 1, "media_type": "movie", "title": "Spirited Away"}])
+    Snapshot(path, max_age=3600, breakers=[breaker], index=index).save()
+
+    restored_breaker, restored_index = _breaker(), SearchIndex()
+    counts = Snapshot(path, max_age=3600, breakers=[restored_breaker], index=restored_index).load()
+
+    assert counts == {"tmdb": 2, "search_index": 1}
+    cache = restored_breaker.last_good
+    assert cache.get("fresh", max_age=300) == {"v": 1}
+    # Restored with its original age: too old to be fresh, still there as a fallback
+    assert cache.get("old", max_age=300) is None
+    assert cache.get("old") == {"v": 2}
+    assert cache.get("expired") is None
+    assert restored_index.suggest("spirited")[0]["id"] == 1
+
+
+def test_missing_or_corrupt_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    snapshot = Snapshot(str(path), max_age=3600, breakers=[_breaker()], index=SearchIndex())
+    assert snapshot.load() is None
+
+    path.write_bytes(b"not gzip")
+    assert snapshot.load() is None
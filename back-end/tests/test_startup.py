@@ -0,0 +1,37 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backend.api import system
+from backend.core.startup import StartupState
+from backend.services import scheduler
+
+
+def test_ready_flips_after_startup_and_back_on_shutdown(monkeypatch):
+    state = StartupState()
+    monkeypatch.setattr(system, "startup_state", state)
+
+    state.begin()
+    with state.phase("init_db"):
+        pass
+    assert system.read_ready().status_code == 503
+
+    state.mark_ready()
+    response = system.read_ready()
+    assert response.status_code == 200
+    assert b'"init_db"' in response.body
+
+    state.mark_stopping()
+    assert system.read_ready().status_code == 503
+
+
+def test_first_job_runs_are_deferred_with_jitter(monkeypatch):
+    monkeypatch.setattr(scheduler.settings, "STARTUP_JOB_DELAY_SECONDS", 30)
+    monkeypatch.setattr(scheduler.settings, "STARTUP_JOB_JITTER_SECONDS", 30)
+
+    runs = [scheduler.first_run_time() - datetime.now() for _ in range(20)]
+
+    assert all(timedelta(seconds=29) < run <= timedelta(seconds=60) for run in runs)
+    assert len(set(runs)) > 1
@@ -0,0 +1,95 @@
+import gzip
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from starlette.requests import Request
+
+from backend.core import static
+from backend.core.static import IMMUTABLE_CACHE, INDEX_CACHE, StaticSite
+
+SCRIPT = b"console.log('hello');\n" * 100
+
+
+def _site(tmp_path, monkeypatch, with_brotli_build=True):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_bytes(b"<!doctype html><div id=app></div>")
+    (tmp_path / "assets" / "app.1a2b.js").write_bytes(SCRIPT)
+    if with_brotli_build:
+        # Variant produced by the frontend build; the server never builds br itself here
+        (tmp_path / "assets" / "app.1a2b.js.br").write_bytes(b"prebuilt-br")
+    monkeypatch.setattr(static, "brotli", None)
+    site = StaticSite(str(tmp_path))
+    site.load()
+    return site
+
+
+def _get(site, path, **headers):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/" + path,
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    }
+    return site.response(path, Request(scope))
+
+
+def test_precompressed_variants_are_negotiated(tmp_path, monkeypatch):
+    site = _site(tmp_path, monkeypatch)
+
+    br = _get(site, "assets/app.1a2b.js", accept_encoding="gzip, deflate, br")
+    assert br.headers["content-encoding"] == "br"
+    assert br.body == b"prebuilt-br"
+    assert br.headers["cache-control"] == IMMUTABLE_CACHE
+    assert br.headers["vary"] == "Accept-Encoding"
+
+    gz = _get(site, "assets/app.1a2b.js", accept_encoding="gzip")
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(gz.body) == SCRIPT
+
+    plain = _get(site, "assets/app.1a2b.js")
+    assert "content-encoding" not in plain.headers
+    assert plain.body == SCRIPT
+    assert len({br.headers["etag"], gz.headers["etag"], plain.headers["etag"]}) == 3
+
+
+def test_q_values_and_wildcard(tmp_path, monkeypatch):
+    site = _site(tmp_path, monkeypatch)
+
+    assert site._negotiate("br;q=0.5, gzip;q=0.8", ["identity", "gzip", "br"]) == "gzip"
+    assert site._negotiate("*", ["identity", "gzip", "br"]) == "br"
+    assert site._negotiate("*;q=0.5, br;q=0", ["identity", "gzip", "br"]) == "gzip"
+    assert site._negotiate("gzip;q=0, *;q=0", ["identity", "gzip"]) == "identity"
+    assert site._negotiate("identity", ["identity", "gzip"]) == "identity"
+
+
+def test_matching_etag_gets_304(tmp_path, monkeypatch):
+    site = _site(tmp_path, monkeypatch)
+    first = _get(site, "assets/app.1a2b.js", accept_encoding="gzip")
+
+    cached = _get(site, "assets/app.1a2b.js", accept_encoding="gzip", if_none_match=first.headers["etag"])
+    assert cached.status_code == 304
+    assert cached.body == b""
+
+    # The identity representation has a different validator
+    other = _get(site, "assets/app.1a2b.js", if_none_match=first.headers["etag"])
+    assert other.status_code == 200
+
+
+def test_missing_asset_is_404_and_routes_fall_back_to_index(tmp_path, monkeypatch):
+    site = _site(tmp_path, monkeypatch)
+
+    assert _get(site, "assets/missing.js").status_code == 404
+    page = _get(site, "requests/42")
+    assert page.status_code == 200
+    assert page.body.startswith(b"<!doctype html>")
+    assert page.headers["cache-control"] == INDEX_CACHE
+
+
+def test_without_brotli_only_gzip_is_built(tmp_path, monkeypatch):
+    site = _site(tmp_path, monkeypatch, with_brotli_build=False)
+
+    assert set(site.assets["assets/app.1a2b.js"].variants) == {"identity", "gzip"}
+    response = _get(site, "assets/app.1a2b.js", accept_encoding="br, gzip")
+    assert response.headers["content-encoding"] == "gzip"
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlalchemy import event
+
+from backend.api import media, requests
+from backend.models import SubscriptionRequest, SubscriptionStatus, User, UserRole
+from backend.services.subscription_status import SubscriptionStatusMap
+
+
+def test_request_writes_update_the_map_and_reads_need_no_sql(monkeypatch, engine, session):
+    async def no_emby_items(tmdb_id):
+        return []
+
+    status_map = SubscriptionStatusMap(ttl_seconds=3600)
+    monkeypatch.setattr(media, "subscription_status", status_map)
+    monkeypatch.setattr(requests, "subscription_status", status_map)
+    monkeypatch.setattr(media, "lookup_emby_items", no_emby_items)
+
+    user = User(id="u1", name="Tester")
+    admin = User(id="admin", name="Admin", role=UserRole.ADMIN)
+    session.add_all([user, admin])
+    session.add(SubscriptionRequest(user_id="u1", tmdb_id="1", media_type="movie", title="Old"))
+    session.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    def enrich(*tmdb_ids):
+        media_list = [{"id": tmdb_id} for tmdb_id in tmdb_ids]
+        statements.clear()
+        asyncio.run(media.enrich_media_status(media_list, session))
+        assert not statements
+        return [item["status"] for item in media_list]
+
+    # The first read loads every request with one query
+    media_list = [{"id": "1"}]
+    asyncio.run(media.enrich_media_status(media_list, session))
+    assert media_list[0]["status"] == "PENDING"
+    assert len(statements) == 1
+
+    created = requests.create_request(
+        SubscriptionRequest(tmdb_id="2", media_type="tv", title="Show", specific_season=2),
+        current_user=user, session=session,
+    )
+    assert enrich("1", "2", "3") == ["PENDING", "PENDING", "UNKNOWN"]
+
+    requests.approve_request(created.id, current_user=admin, session=session)
+    assert enrich("2") == ["APPROVED"]
+
+    requests.reject_request(created.id, current_user=admin, session=session)
+    assert enrich("2") == ["REJECTED"]
+
+    # Reopening the rejected request
+    requests.create_request(
+        SubscriptionRequest(tmdb_id="2", media_type="tv", title="Show", specific_season=2),
+        current_user=user, session=session,
+    )
+    assert enrich("2") == ["PENDING"]
+
+    requests.cancel_request("2", season_number=2, current_user=user, session=session)
+    assert enrich("2") == ["UNKNOWN"]
+
+    # Season entries feed per-season status on details; the whole-show request wins on cards
+    status_map.record([
+        status_map.primary(session, "1")._replace(id=10, tmdb_id="3", specific_season=1),
+        status_map.primary(session, "1")._replace(id=11, tmdb_id="3", specific_season=None,
+                                                   status=SubscriptionStatus.COMPLETED),
+    ])
+    assert enrich("3") == ["COMPLETED"]
+    assert status_map.get(session, "3")[1].status == SubscriptionStatus.PENDING
+
+
+def test_write_during_a_reload_is_not_lost(session):
+    session.add(SubscriptionRequest(id=1, user_id="u1", tmdb_id="1", media_type="movie", title="Movie"))
+    session.commit()
+    status_map = SubscriptionStatusMap(ttl_seconds=0)
+
+    class RacingSession:
+        """
+        Runs the reload query, then lets a request endpoint commit and write through before the swap.
+        """
+        def exec(self, statement):
+            rows = session.exec(statement).all()
+            request = session.get(SubscriptionRequest, 1)
+            request.status = SubscriptionStatus.APPROVED
+            session.add(request)
+            session.commit()
+            status_map.put(request)
+            return SimpleNamespace(all=lambda: rows)
+
+    status_map._ensure_loaded(RacingSession())
+
+    assert status_map._by_tmdb_id["1"][None].status == SubscriptionStatus.APPROVED
+    assert status_map._journals == []
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx
+
+from backend.services import tmdb
+from backend.services.cache import MemoryCacheBackend, ResponseCache
+from backend.services.circuit_breaker import CircuitBreaker
+
+
+def _upstream(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"results": [len(calls)]})
+
+    breaker = CircuitBreaker("tmdb:test")
+    breaker.last_good = ResponseCache(backend=MemoryCacheBackend(100))
+    monkeypatch.setattr(tmdb, "tmdb_breaker", breaker)
+    monkeypatch.setattr(tmdb.tmdb_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return calls, breaker
+
+
+def test_fresh_responses_are_served_from_cache_within_the_ttl(monkeypatch):
+    calls, breaker = _upstream(monkeypatch)
+    assert tmdb.settings.TMDB_CACHE_TTL_SECONDS == 300
+
+    async def run():
+        first = await tmdb.tmdb_client.get_trending("movie")
+        second = await tmdb.tmdb_client.get_trending("movie")
+        # Entries older than the TTL are fetched again
+        for key, (body, stored_at) in breaker.last_good.backend.items():
+            breaker.last_good.backend.set(key, body, stored_at=stored_at - 301)
+        third = await tmdb.tmdb_client.get_trending("movie")
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first == second == {"results": [1]}
+    assert third == {"results": [2]}
+    assert len(calls) == 2
+
+
+def test_zero_ttl_always_calls_upstream(monkeypatch):
+    calls, _ = _upstream(monkeypatch)
+    monkeypatch.setattr(tmdb.settings, "TMDB_CACHE_TTL_SECONDS", 0)
+
+    async def run():
+        await tmdb.tmdb_client.get_trending("movie")
+        return await tmdb.tmdb_client.get_trending("movie")
+
+    assert asyncio.run(run()) == {"results": [2]}
+    assert len(calls) == 2
@@ -0,0 +1,65 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlmodel import select
+
+from backend.jobs import external_ids
+from backend.models import SubscriptionRequest, User, WorkItem, WorkStatus
+from backend.services.work_queue import WorkQueue
+
+
+def test_failed_items_back_off_and_eventually_fail(session):
+    queue = WorkQueue(batch_size=10, max_attempts=2, retry_base_seconds=60)
+    attempts = []
+
+    async def flaky(session, item):
+        attempts.append(item.key)
+        raise RuntimeError("upstream down")
+
+    queue.register("flaky", flaky)
+    queue.enqueue(session, "flaky", "a")
+    queue.enqueue(session, "flaky", "a")
+    session.commit()
+
+    assert asyncio.run(queue.process(session, "flaky")) == 1
+    item = session.exec(select(WorkItem)).one()
+    assert item.status == WorkStatus.PENDING
+    assert item.next_attempt_at > datetime.utcnow() + timedelta(seconds=50)
+    # Not due yet
+    assert asyncio.run(queue.process(session, "flaky")) == 0
+
+    item.next_attempt_at = datetime.utcnow()
+    session.add(item)
+    session.commit()
+    asyncio.run(queue.process(session, "flaky"))
+
+    assert attempts == ["a", "a"]
+    assert session.exec(select(WorkItem)).one().status == WorkStatus.FAILED
+
+
+def test_external_ids_are_filled_from_the_queue(monkeypatch, session):
+    fetched = []
+
+    async def fake_external_ids(media_type, tmdb_id):
+        fetched.append((media_type, tmdb_id))
+        return {"imdb_id": "tt0042", "tvdb_id": 4242}
+
+    monkeypatch.setattr(external_ids.tmdb_client, "get_external_ids", fake_external_ids)
+
+    session.add(User(id="u1", name="Tester"))
+    request = SubscriptionRequest(user_id="u1", tmdb_id="42", media_type="series", title="Show")
+    session.add(request)
+    session.flush()
+    external_ids.enqueue_external_ids(session, request)
+    session.commit()
+
+    asyncio.run(external_ids.work_queue.process(session, external_ids.EXTERNAL_IDS))
+
+    session.refresh(request)
+    assert fetched == [("tv", "42")]
+    assert (request.imdb_id, request.tvdb_id) == ("tt0042", "4242")
+    assert session.exec(select(WorkItem)).one().status == WorkStatus.DONE
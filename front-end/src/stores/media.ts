@@ -2,7 +2,8 @@ import { defineStore } from 'pinia'
 import { ref, watch } from 'vue'
 import http from '../utils/http'
 
-type CacheEntry = { items: any[]; timestamp: number }
+// nextCursor: continuation token of cursor-paginated endpoints (e.g. /media/anime)
+type CacheEntry = { items: any[]; timestamp: number; nextCursor?: string | null }
 type CacheShape = Record<string, CacheEntry>
 
 const CACHE_TTL_MS = 15 * 60 * 1000 // 15 minutes
@@ -14,7 +15,7 @@ const normalizeCache = (raw: Record<string, any>): CacheShape => {
     if (Array.isArray(value)) {
       normalized[key] = { items: value, timestamp: 0 }
     } else if (value && Array.isArray(value.items)) {
-      normalized[key] = { items: value.items, timestamp: Number(value.timestamp) || 0 }
+      normalized[key] = { items: value.items, timestamp: Number(value.timestamp) || 0, nextCursor: value.nextCursor ?? null }
     }
   })
   return normalized
@@ -46,7 +47,7 @@ export const useMediaStore = defineStore('media', () => {
     try {
       const res = await http.get(endpoint, { params })
       const items = res.data.results || res.data
-      cache.value[key] = { items, timestamp: Date.now() }
+      cache.value[key] = { items, timestamp: Date.now(), nextCursor: res.data.next_cursor ?? null }
     } catch (e) {
       console.error(e)
       errors.value[key] = '加载失败，请检查网络或 API 配置'
@@ -92,6 +93,7 @@ export const useMediaStore = defineStore('media', () => {
     // If used in a computed or template, accessing cache.value[key] creates dependency.
     return {
       get items() { return cache.value[key]?.items || [] }, // Getter for reactivity
+      get nextCursor() { return cache.value[key]?.nextCursor ?? null },
       get loading() { return loadingStates.value[key] || false },
       get error() { return errors.value[key] || '' }
     }
@@ -113,7 +115,7 @@ export const useMediaStore = defineStore('media', () => {
       })
 
       if (mutated) {
-        cache.value[key] = { items: updatedItems, timestamp: entry.timestamp }
+        cache.value[key] = { ...entry, items: updatedItems }
       }
     })
   }
@@ -1,4 +1,5 @@
 import axios from 'axios'
+import { ElMessage } from 'element-plus'
 import { useAuthStore } from '../stores/auth'
 import router from '../router'
 
@@ -30,6 +31,10 @@ http.interceptors.response.use(
        authStore.logout()
        router.push('/login')
     }
+    if (error.response && error.response.status === 429) {
+      const retryAfter = error.response.headers['retry-after']
+      ElMessage.warning(retryAfter ? `请求过于频繁，请 ${retryAfter} 秒后再试` : '请求过于频繁，请稍后再试')
+    }
     return Promise.reject(error)
   }
 )